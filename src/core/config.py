@@ -160,6 +160,10 @@ class TIFDAConfig(BaseModel):
 
 _config: Optional[TIFDAConfig] = None
 
+# Bumped whenever the configuration instance or its registries change, so
+# callers can cache values derived from it
+_config_version: int = 0
+
 
 def get_config() -> TIFDAConfig:
     """
@@ -175,15 +179,29 @@ def get_config() -> TIFDAConfig:
     Returns:
         TIFDAConfig instance
     """
-    global _config
+    global _config, _config_version
     
     if _config is None:
         _config = TIFDAConfig()
+        _config_version += 1
         print("✅ Configuration initialized with defaults")
     
     return _config
 
 
+def get_config_version() -> int:
+    """
+    Get the configuration version counter.
+    
+    Changes whenever the config is created, replaced with set_config() or
+    extended with register_sensor()/register_recipient().
+    
+    Returns:
+        Current configuration version
+    """
+    return _config_version
+
+
 def set_config(config: TIFDAConfig):
     """
     Set global configuration instance.
@@ -191,8 +209,9 @@ def set_config(config: TIFDAConfig):
     Args:
         config: TIFDAConfig instance to use
     """
-    global _config
+    global _config, _config_version
     _config = config
+    _config_version += 1
     print("✅ Configuration updated")
 
 
@@ -203,8 +222,10 @@ def register_sensor(sensor_config: SensorConfig):
     Args:
         sensor_config: SensorConfig to register
     """
+    global _config_version
     config = get_config()
     config.sensors[sensor_config.sensor_id] = sensor_config
+    _config_version += 1
     print(f"✅ Sensor registered: {sensor_config.sensor_id}")
 
 
@@ -215,8 +236,10 @@ def register_recipient(recipient_config: RecipientConfigModel):
     Args:
         recipient_config: RecipientConfigModel to register
     """
+    global _config_version
     config = get_config()
     config.recipients[recipient_config.recipient_id] = recipient_config
+    _config_version += 1
     print(f"✅ Recipient registered: {recipient_config.recipient_id}")
 
 
@@ -545,6 +545,10 @@ MAX_FILE_SIZE = {
 }
 """Maximum file sizes to prevent memory issues and ensure responsiveness"""
 
+# Maximum length of multimodal report previews (characters)
+MULTIMODAL_SNIPPET_MAX = 300
+"""Cap on report previews forwarded to LLM prompts (keeps prompt tokens bounded)"""
+
 # ==================== TIMING ====================
 
 # Gradio UI polling interval (seconds)
@@ -643,4 +647,18 @@ def get_threat_level_from_distance(distance_km: float) -> str:
     elif distance_km < THREAT_DISTANCE_LOW:
         return "low"
     else:
-        return "none"
\ No newline at end of file
+        return "none"
+
+
+def make_snippet(text: str, max_chars: int = MULTIMODAL_SNIPPET_MAX) -> str:
+    """
+    Truncate text to a bounded preview
+    
+    Args:
+        text: Full text (e.g. multimodal report)
+        max_chars: Maximum characters kept before the ellipsis
+        
+    Returns:
+        Text unchanged if short enough, otherwise its first max_chars + "..."
+    """
+    return text if len(text) <= max_chars else text[:max_chars] + "..."
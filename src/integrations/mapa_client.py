@@ -5,6 +5,7 @@ Mapa Client
 HTTP client for interacting with mapa-puntos-interes API.
 """
 
+import orjson
 import requests
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timezone
@@ -217,7 +218,7 @@ class MapaClient:
             response = self._request_with_retry(
                 'POST',
                 self.api_url,
-                json=punto_data
+                data=orjson.dumps(punto_data)  # Session already sends Content-Type: application/json
             )
             data = response.json()
             
@@ -255,7 +256,7 @@ class MapaClient:
             response = self._request_with_retry(
                 'PUT',
                 f"{self.api_url}/{punto_id}",
-                json=punto_data
+                data=orjson.dumps(punto_data)  # Session already sends Content-Type: application/json
             )
             data = response.json()
             
@@ -8,6 +8,7 @@ Based on paho-mqtt library.
 
 import paho.mqtt.client as mqtt
 import ssl
+import threading
 import time
 from typing import Optional, Callable, Dict, Any
 from dataclasses import dataclass
@@ -81,6 +82,7 @@ class MQTTClient:
         """
         self.config = config
         self._connected = False
+        self._connected_event = threading.Event()  # Wakes connect() as soon as CONNACK arrives
         self._reconnect_attempts = 0
         
         # Create paho MQTT client
@@ -144,6 +146,7 @@ class MQTTClient:
         """Internal connection callback wrapper"""
         if rc == 0:
             self._connected = True
+            self._connected_event.set()
             self._reconnect_attempts = 0
             logger.info(f"✅ Connected to MQTT broker at {self.config.host}:{self.config.port}")
             
@@ -152,6 +155,7 @@ class MQTTClient:
                 self._user_on_connect(client, userdata, flags, rc)
         else:
             self._connected = False
+            self._connected_event.clear()
             error_messages = {
                 1: "Connection refused - incorrect protocol version",
                 2: "Connection refused - invalid client identifier",
@@ -165,6 +169,7 @@ class MQTTClient:
     def _on_disconnect_wrapper(self, client, userdata, rc):
         """Internal disconnection callback wrapper"""
         self._connected = False
+        self._connected_event.clear()
         
         if rc != 0:
             logger.warning(f"⚠️ Unexpected MQTT disconnection (code: {rc})")
@@ -181,7 +186,8 @@ class MQTTClient:
     
     def _default_on_message(self, client, userdata, msg):
         """Default message handler (just logs)"""
-        logger.debug(f"Received message on topic '{msg.topic}': {msg.payload.decode()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received message on topic '%s': %s", msg.topic, msg.payload.decode())
     
     def _attempt_reconnect(self):
         """Attempt to reconnect to broker"""
@@ -224,12 +230,8 @@ class MQTTClient:
             self.client.loop_start()
             
             if blocking:
-                # Wait for connection
-                start_time = time.time()
-                while not self._connected and (time.time() - start_time) < timeout:
-                    time.sleep(0.1)
-                
-                if not self._connected:
+                # Wait for connection (returns as soon as on_connect fires)
+                if not self._connected_event.wait(timeout):
                     logger.error(f"❌ Connection timeout after {timeout}s")
                     return False
             
@@ -267,9 +269,33 @@ class MQTTClient:
         Returns:
             True if published successfully
         """
+        return self.publish_nowait(topic, payload, qos, retain) is not None
+    
+    def publish_nowait(
+        self,
+        topic: str,
+        payload: str,
+        qos: int = 0,
+        retain: bool = False
+    ) -> Optional[mqtt.MQTTMessageInfo]:
+        """
+        Queue message for publishing without waiting for delivery.
+        
+        The network loop thread sends it; call wait_for_publish() on the
+        returned handle to wait for the broker confirmation (QoS 1/2).
+        
+        Args:
+            topic: MQTT topic
+            payload: Message payload (string or bytes)
+            qos: Quality of Service (0, 1, or 2)
+            retain: Retain message on broker
+            
+        Returns:
+            MQTTMessageInfo handle, or None if the message could not be queued
+        """
         if not self._connected:
             logger.error("❌ Cannot publish: Not connected to broker")
-            return False
+            return None
         
         try:
             result = self.client.publish(
@@ -280,15 +306,16 @@ class MQTTClient:
             )
             
             if result.rc == mqtt.MQTT_ERR_SUCCESS:
-                logger.debug(f"📤 Published to '{topic}': {payload[:100]}...")
-                return True
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("📤 Published to '%s': %r...", topic, payload[:100])
+                return result
             else:
-                logger.error(f"❌ Publish failed with code: {result.rc}")
-                return False
+                logger.error("❌ Publish failed with code: %s", result.rc)
+                return None
                 
         except Exception as e:
-            logger.error(f"❌ Publish error: {e}")
-            return False
+            logger.error("❌ Publish error: %s", e)
+            return None
     
     def subscribe(self, topic: str, qos: int = 0):
         """
@@ -6,12 +6,20 @@ MQTT publisher for disseminating messages to downstream systems.
 Integrates with transmission_node.py for actual message delivery.
 """
 
-import json
 import logging
+import os
+import queue
+import struct
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Tuple, Union
+from dataclasses import dataclass, replace
+from functools import lru_cache
 
+import orjson
 from langsmith import traceable
 
 # Import from the new mqtt_client (will be in src/integrations/)
@@ -20,15 +28,100 @@ from src.models.dissemination import OutgoingMessage, RecipientConfig
 
 logger = logging.getLogger(__name__)
 
+# LangSmith tracing wraps every call (span setup + state packing); skip the
+# wrapper entirely unless tracing is switched on
+TRACING_ENABLED = os.getenv(
+    "LANGSMITH_TRACING", os.getenv("LANGCHAIN_TRACING_V2", "false")
+).lower() == "true"
+_traceable = traceable if TRACING_ENABLED else (lambda **kwargs: (lambda func: func))
 
-@dataclass
+# Max time publish_batch (and a submit() future) waits for delivery confirmations (seconds)
+PUBLISH_CONFIRM_TIMEOUT_SEC = 10.0
+
+# How often the submit() worker fails futures whose ack is overdue (seconds)
+ACK_SWEEP_INTERVAL_SEC = 0.5
+
+_ACK_TIMEOUT_ERROR = "Timed out waiting for publish confirmation"
+
+# Messages published between two confirmation drains in publish_batch
+CONFIRM_BATCH_SIZE = 64
+
+# Persistent broker connections held by the singleton publisher. Messages are
+# spread across them by recipient, so per-recipient ordering is preserved.
+POOL_SIZE = 4
+
+# Bound of the submit() hand-off queue; producers block when it is full
+PUBLISH_QUEUE_SIZE = 1024
+
+# Marker for QoS 0 publishes, which publish_batch never waits on
+_QOS0_SENT = object()
+
+# How long an unchanged get_stats snapshot is reused (seconds)
+HEALTH_CHECK_TTL_SEC = 1.0
+
+# Max worker threads publish_batch uses (one per pooled connection in use)
+PUBLISH_WORKERS = 8
+
+# Payload wire format: "json" (default) or "msgpack" (smaller and faster to
+# encode, requires msgspec). msgpack payloads go to "<topic>/msgpack" so
+# existing JSON consumers are unaffected.
+WIRE_FORMAT = os.getenv("TIFDA_WIRE_FORMAT", "json").lower()
+
+# Default topic base; the full topic is tifda/output/dissemination_reports/{recipient_id}
+DEFAULT_TOPIC_BASE = "tifda/output/dissemination_reports"
+
+# msgpack payloads go to "<topic>/msgpack"
+_TOPIC_SUFFIX = "/msgpack" if WIRE_FORMAT == "msgpack" else ""
+
+# 4-byte big-endian length header for stream transports (raw TCP, Kafka
+# adapters). MQTT frames packets itself, so it gets the bare body.
+_FRAME_HEADER = struct.Struct(">I")
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+
+if MSGSPEC_AVAILABLE:
+    class MessageEnvelope(msgspec.Struct):
+        """msgpack wire envelope (same fields as the JSON envelope)"""
+        message_id: str
+        recipient_id: str
+        format_type: str
+        timestamp: str
+        source: str
+        content: Dict[str, Any]
+        decision_id: Optional[str] = None
+    
+    _msgpack_encoder = msgspec.msgpack.Encoder()
+
+
+@dataclass(slots=True)
 class PublishResult:
-    """Result of a publish operation"""
+    """Result of a publish operation (one per message, so slotted to keep it small)"""
     success: bool
     message_id: str
     topic: str
     timestamp: datetime
     error: Optional[str] = None
+    payload_size_bytes: int = 0
+    batch_id: Optional[int] = None  # Confirmation batch (publish_batch only)
+    confirmed_at: float = 0.0  # time.monotonic() when the outcome was known
+
+
+@dataclass(slots=True, frozen=True)
+class ResolvedRecipient:
+    """Recipient routing resolved once from its config (topic in wire form)"""
+    recipient_id: str
+    topic: str
+    qos: int
+    batch: bool = False
+
+
+# publish_message/publish_batch accept raw config dicts or resolved routes
+RecipientConfigLike = Union[Dict[str, Any], ResolvedRecipient]
 
 
 class MQTTPublisher:
@@ -53,327 +146,241 @@ class MQTTPublisher:
                 msg.transmission_timestamp = result.timestamp
     """
     
-    def __init__(self, mqtt_client: MQTTClient):
+    def __init__(self, mqtt_client: MQTTClient, pool: Optional[List[MQTTClient]] = None):
         """
         Initialize publisher with MQTT client.
         
         Args:
-            mqtt_client: Connected MQTTClient instance
+            mqtt_client: Connected MQTTClient instance (primary connection)
+            pool: Additional connected clients to spread recipients across
         """
+        if WIRE_FORMAT == "msgpack" and not MSGSPEC_AVAILABLE:
+            raise ImportError(
+                "TIFDA_WIRE_FORMAT=msgpack requires msgspec. Install with: pip install msgspec"
+            )
+        
         self.mqtt_client = mqtt_client
+        self.mqtt_clients = [mqtt_client, *(pool or [])]
+        self._stats_lock = threading.Lock()  # publish_batch workers update stats concurrently
+        
+        # submit(): bounded hand-off queue drained by one background thread
+        # (started on first use); QoS 1/2 futures resolve from on_publish
+        self._submit_queue: "queue.Queue[Optional[Tuple[OutgoingMessage, Optional[RecipientConfigLike], Future]]]" = \
+            queue.Queue(maxsize=PUBLISH_QUEUE_SIZE)
+        self._submit_worker: Optional[threading.Thread] = None
+        self._submit_lock = threading.Lock()
+        self._ack_waiters: Dict[Tuple[int, int], Tuple[float, Future, OutgoingMessage, str, int]] = {}
+        self._stats_snapshot: Optional[Dict[str, Any]] = None  # Last get_stats() result
+        self._stats_snapshot_key: Tuple[int, int, int] = (0, 0, -1)
+        self._stats_snapshot_at = 0.0
         self.publish_stats = {
             'total_published': 0,
             'total_failed': 0,
             'by_recipient': {},
             'by_topic': {}
         }
+        
+        # Publish confirmations arrive asynchronously on the network threads.
+        # (paho client id, mid) -> monotonic time of the ack. mids are per
+        # connection and reused, so an ack only counts if it is newer than
+        # the publish it is matched against.
+        self._acked_at: Dict[Tuple[int, int], float] = {}
+        self._ack_cond = threading.Condition()
+        for client in self.mqtt_clients:
+            client.client.on_publish = self._on_publish_ack
     
-    @traceable(name="mqtt_publish_message")
-    def publish_message(
-        self,
-        message: OutgoingMessage,
-        recipient_config: Optional[Dict[str, Any]] = None
-    ) -> PublishResult:
+    def _client_index(self, recipient_id: str) -> int:
         """
-        Publish OutgoingMessage to MQTT broker.
+        Index of the pooled connection for a recipient.
         
-        Args:
-            message: OutgoingMessage to publish
-            recipient_config: Recipient configuration (contains MQTT settings)
-            
-        Returns:
-            PublishResult with status
+        Stable per recipient while its connection is up; if it is down the
+        next live connection takes over until it reconnects.
         """
-        # Determine topic and QoS from recipient config
-        if recipient_config and 'connection_config' in recipient_config:
-            topic = recipient_config['connection_config'].get(
-                'mqtt_topic',
-                f"tifda/output/dissemination_reports/{message.recipient_id}"
-            )
-            qos = recipient_config['connection_config'].get('qos', 0)
-        else:
-            # Default topic structure: tifda/output/dissemination_reports/{recipient_id}
-            topic = f"tifda/output/dissemination_reports/{message.recipient_id}"
-            qos = 0
+        size = len(self.mqtt_clients)
+        index = hash(recipient_id) % size
         
-        # Format message as JSON
-        try:
-            payload = self._format_message_payload(message)
-        except Exception as e:
-            error_msg = f"Failed to format message: {e}"
-            logger.error(f"❌ {error_msg}")
-            self.publish_stats['total_failed'] += 1
-            return PublishResult(
-                success=False,
-                message_id=message.message_id,
-                topic=topic,
-                timestamp=datetime.now(timezone.utc),
-                error=error_msg
-            )
+        if size == 1 or self.mqtt_clients[index].is_connected:
+            return index
         
-        # Publish to MQTT
-        try:
-            success = self.mqtt_client.publish(
-                topic=topic,
-                payload=payload,
-                qos=qos,
-                retain=False
-            )
-            
-            timestamp = datetime.now(timezone.utc)
-            
-            if success:
-                # Update stats
-                self.publish_stats['total_published'] += 1
-                self.publish_stats['by_recipient'][message.recipient_id] = \
-                    self.publish_stats['by_recipient'].get(message.recipient_id, 0) + 1
-                self.publish_stats['by_topic'][topic] = \
-                    self.publish_stats['by_topic'].get(topic, 0) + 1
-                
-                logger.info(f"✅ Published message {message.message_id} to topic '{topic}'")
-                
-                return PublishResult(
-                    success=True,
-                    message_id=message.message_id,
-                    topic=topic,
-                    timestamp=timestamp
-                )
-            else:
-                self.publish_stats['total_failed'] += 1
-                error_msg = "MQTT publish returned failure"
-                logger.error(f"❌ {error_msg}")
-                return PublishResult(
-                    success=False,
-                    message_id=message.message_id,
-                    topic=topic,
-                    timestamp=timestamp,
-                    error=error_msg
-                )
-                
-        except Exception as e:
-            self.publish_stats['total_failed'] += 1
-            error_msg = f"Exception during publish: {e}"
-            logger.error(f"❌ {error_msg}")
-            return PublishResult(
-                success=False,
-                message_id=message.message_id,
-                topic=topic,
-                timestamp=datetime.now(timezone.utc),
-                error=error_msg
-            )
+        for step in range(1, size):
+            fallback = (index + step) % size
+            if self.mqtt_clients[fallback].is_connected:
+                return fallback
+        
+        return index
+    
+    def _client_for(self, recipient_id: str) -> MQTTClient:
+        """Pick the pooled connection for a recipient"""
+        return self.mqtt_clients[self._client_index(recipient_id)]
+    
+    def _on_publish_ack(self, client, userdata, mid, *args):
+        """paho on_publish callback - records the confirmation for a message id"""
+        key = (id(client), mid)
+        
+        with self._ack_cond:
+            self._acked_at[key] = time.monotonic()
+            self._ack_cond.notify_all()
+            waiter = self._ack_waiters.pop(key, None)
+        
+        if waiter is not None:
+            _, future, message, topic, payload_size = waiter
+            future.set_result(self._record_result(message, topic, payload_size))
     
-    def _format_message_payload(self, message: OutgoingMessage) -> str:
+    def submit(
+        self,
+        message: OutgoingMessage,
+        recipient_config: Optional[RecipientConfigLike] = None
+    ) -> Future:
         """
-        Format OutgoingMessage as JSON payload.
+        Hand a message to the background publisher thread.
         
-        Creates a structured JSON envelope with metadata + content.
+        Returns as soon as the message is queued (blocking only while the
+        bounded queue is full). Encoding and publishing happen on the worker
+        thread; the future resolves with the PublishResult once the broker
+        confirms (QoS 1/2) or the message is sent (QoS 0). A QoS 1/2 message
+        not confirmed within PUBLISH_CONFIRM_TIMEOUT_SEC resolves as failed.
         
         Args:
-            message: OutgoingMessage to format
+            message: OutgoingMessage to publish
+            recipient_config: Recipient configuration (dict or ResolvedRecipient)
             
         Returns:
-            JSON string ready for MQTT
+            Future resolving to a PublishResult
         """
-        # Create message envelope
-        envelope = {
-            # Metadata
-            "message_id": message.message_id,
-            "recipient_id": message.recipient_id,
-            "format_type": message.format_type,
-            "timestamp": message.timestamp.isoformat(),
-            "source": "TIFDA",
-            
-            # Actual content (format-specific structure)
-            "content": message.content,
-            
-            # Optional fields
-            "decision_id": message.decision_id if hasattr(message, 'decision_id') else None
-        }
-        
-        return json.dumps(envelope, indent=None)  # Compact JSON for MQTT
+        if self._submit_worker is None:
+            with self._submit_lock:
+                if self._submit_worker is None:
+                    self._submit_worker = threading.Thread(
+                        target=self._submit_loop, name="mqtt-publisher", daemon=True
+                    )
+                    self._submit_worker.start()
+        
+        future = Future()
+        self._submit_queue.put((message, recipient_config, future))
+        return future
     
-    @traceable(name="mqtt_publish_batch")
-    def publish_batch(
-        self,
-        messages: List[OutgoingMessage],
-        recipient_configs: Optional[Dict[str, Dict[str, Any]]] = None
-    ) -> Dict[str, Any]:
-        """
-        Publish multiple messages.
-        
-        Args:
-            messages: List of OutgoingMessage objects
-            recipient_configs: Dict mapping recipient_id -> config
+    def _submit_loop(self):
+        """Background thread: encode and publish queued messages until stopped"""
+        next_sweep = time.monotonic() + ACK_SWEEP_INTERVAL_SEC
+        
+        while True:
+            try:
+                item = self._submit_queue.get(timeout=ACK_SWEEP_INTERVAL_SEC)
+            except queue.Empty:
+                item = ()
             
-        Returns:
-            Statistics: {
-                'total': int,
-                'successful': int,
-                'failed': int,
-                'results': List[PublishResult]
-            }
-        """
-        results = []
-        successful = 0
-        failed = 0
-        
-        for message in messages:
-            # Get recipient config if available
-            recipient_config = None
-            if recipient_configs and message.recipient_id in recipient_configs:
-                recipient_config = recipient_configs[message.recipient_id]
+            # A PUBACK can be lost (broker drop, reconnect without a session);
+            # don't leave those futures pending forever
+            now = time.monotonic()
+            if now >= next_sweep:
+                self._fail_ack_waiters(now - PUBLISH_CONFIRM_TIMEOUT_SEC, _ACK_TIMEOUT_ERROR)
+                next_sweep = now + ACK_SWEEP_INTERVAL_SEC
             
-            # Publish
-            result = self.publish_message(message, recipient_config)
-            results.append(result)
+            if item is None:
+                return
+            if not item:
+                continue
             
-            if result.success:
-                successful += 1
-            else:
-                failed += 1
-        
-        return {
-            'total': len(messages),
-            'successful': successful,
-            'failed': failed,
-            'results': results
-        }
+            message, recipient_config, future = item
+            try:
+                self._publish_submitted(message, recipient_config, future)
+            except Exception as e:
+                future.set_result(self._record_result(message, "N/A", 0, f"Exception during publish: {e}"))
     
-    def get_stats(self) -> Dict[str, Any]:
-        """Get publishing statistics"""
-        return {
-            **self.publish_stats,
-            'connected': self.mqtt_client.is_connected
-        }
+    def _publish_submitted(
+        self,
+        message: OutgoingMessage,
+        recipient_config: Optional[RecipientConfigLike],
+        future: Future
+    ):
+        """Publish one submitted message and arrange for its future to resolve"""
+        topic, qos = self._resolve_route(message, recipient_config)
+        
+        try:
+            payload = self._format_message_payload(message)
+        except Exception as e:
+            future.set_result(self._record_result(message, topic, 0, f"Failed to format message: {e}"))
+            return
+        
+        payload_size = len(payload)
+        client = self._client_for(message.recipient_id)
+        queued_at = time.monotonic()
+        info = client.publish_nowait(topic=topic, payload=payload, qos=qos)
+        
+        if info is None:
+            future.set_result(self._record_result(message, topic, payload_size, "MQTT publish returned failure"))
+            return
+        
+        if qos == 0:
+            future.set_result(self._record_result(message, topic, payload_size))
+            return
+        
+        key = (id(client.client), info.mid)
+        with self._ack_cond:
+            # The ack may already have arrived on the network thread
+            already_acked = self._acked_at.get(key, -1.0) >= queued_at
+            if not already_acked:
+                self._ack_waiters[key] = (queued_at, future, message, topic, payload_size)
+        
+        if already_acked:
+            future.set_result(self._record_result(message, topic, payload_size))
     
-    def health_check(self) -> tuple[bool, str]:
+    def _fail_ack_waiters(self, queued_before: float, error_msg: str):
         """
-        Check if publisher is healthy and can publish.
+        Resolve submit() futures still waiting for an ack as failed.
         
-        Returns:
-            (is_healthy, message)
+        Args:
+            queued_before: Only waiters queued before this monotonic time
+            error_msg: Error reported in their PublishResult
         """
-        if not self.mqtt_client.is_connected:
-            return False, "MQTT client not connected"
+        with self._ack_cond:
+            expired = [key for key, waiter in self._ack_waiters.items() if waiter[0] < queued_before]
+            waiters = [self._ack_waiters.pop(key) for key in expired]
         
-        return True, f"Publisher healthy - {self.publish_stats['total_published']} messages published"
-
-
-# ==================== SINGLETON INSTANCE ====================
-
-_mqtt_publisher: Optional[MQTTPublisher] = None
-
-
-def get_mqtt_publisher(
-    mqtt_config: Optional[MQTTConfig] = None,
-    force_new: bool = False
-) -> MQTTPublisher:
-    """
-    Get global MQTTPublisher instance (singleton).
-    
-    Args:
-        mqtt_config: MQTT configuration (if None, uses default from config.py)
-        force_new: Force creation of new publisher
-        
-    Returns:
-        MQTTPublisher instance
-    """
-    global _mqtt_publisher
-    
-    if _mqtt_publisher is None or force_new:
-        # Get config from TIFDA config if not provided
-        if mqtt_config is None:
-            from src.core.config import get_config
-            config = get_config()
-            mqtt_config = MQTTConfig(
-                host=config.mqtt.host,
-                port=config.mqtt.port,
-                client_id=config.mqtt.client_id,
-                username=config.mqtt.username,
-                password=config.mqtt.password
-            )
-        
-        # Create MQTT client
-        mqtt_client = MQTTClient(mqtt_config)
-        
-        # Connect (blocking)
-        if not mqtt_client.connect(blocking=True):
-            raise ConnectionError("Failed to connect to MQTT broker")
-        """
-TIFDA MQTT Publisher
-====================
-
-MQTT publisher for disseminating messages to downstream systems.
-Integrates with transmission_node.py for actual message delivery.
-"""
-
-import json
-import logging
-from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
-
-from langsmith import traceable
-
-# Import from the new mqtt_client (will be in src/integrations/)
-from src.integrations.mqtt_client import MQTTClient, MQTTConfig
-from src.models.dissemination import OutgoingMessage, RecipientConfig
-
-logger = logging.getLogger(__name__)
-
-
-@dataclass
-class PublishResult:
-    """Result of a publish operation"""
-    success: bool
-    message_id: str
-    topic: str
-    timestamp: datetime
-    error: Optional[str] = None
-
-
-class MQTTPublisher:
-    """
-    MQTT publisher for TIFDA message dissemination.
+        for _, future, message, topic, payload_size in waiters:
+            future.set_result(self._record_result(message, topic, payload_size, error_msg))
     
-    Handles:
-    - Connection management to MQTT broker
-    - Topic routing based on recipient
-    - Message formatting (JSON)
-    - QoS configuration per recipient
-    - Publish confirmations and error handling
+    def close(self):
+        """Stop the submit() worker thread and fail futures still waiting for an ack"""
+        if self._submit_worker is not None:
+            self._submit_queue.put(None)
+            self._submit_worker.join(timeout=PUBLISH_CONFIRM_TIMEOUT_SEC)
+            self._submit_worker = None
+        
+        self._fail_ack_waiters(float("inf"), "Publisher closed before publish confirmation")
     
-    Usage:
-        # In transmission_node.py
-        publisher = get_mqtt_publisher()
-        
-        for msg in pending_transmissions:
-            result = publisher.publish_message(msg, recipient_config)
-            if result.success:
-                msg.transmitted = True
-                msg.transmission_timestamp = result.timestamp
-    """
-    
-    def __init__(self, mqtt_client: MQTTClient):
+    def _drain_confirms(self, pending: Dict[Tuple[int, int], float], timeout: float) -> set:
         """
-        Initialize publisher with MQTT client.
+        Wait for confirmations of queued publishes.
         
         Args:
-            mqtt_client: Connected MQTTClient instance
+            pending: (paho client id, mid) -> monotonic time the message was queued
+            timeout: Max seconds to wait
+            
+        Returns:
+            Set of confirmed (paho client id, mid) keys
         """
-        self.mqtt_client = mqtt_client
-        self.publish_stats = {
-            'total_published': 0,
-            'total_failed': 0,
-            'by_recipient': {},
-            'by_topic': {}
-        }
+        if not pending:
+            return set()
+        
+        deadline = time.monotonic() + timeout
+        
+        with self._ack_cond:
+            while True:
+                confirmed = {
+                    key for key, queued_at in pending.items()
+                    if self._acked_at.get(key, -1.0) >= queued_at
+                }
+                remaining = deadline - time.monotonic()
+                if len(confirmed) == len(pending) or remaining <= 0:
+                    return confirmed
+                self._ack_cond.wait(remaining)
     
-    @traceable(name="mqtt_publish_message")
+    @_traceable(name="mqtt_publish_message")
     def publish_message(
         self,
         message: OutgoingMessage,
-        recipient_config: Optional[Dict[str, Any]] = None
+        recipient_config: Optional[RecipientConfigLike] = None
     ) -> PublishResult:
         """
         Publish OutgoingMessage to MQTT broker.
@@ -385,103 +392,112 @@ class MQTTPublisher:
         Returns:
             PublishResult with status
         """
-        # Determine topic and QoS from recipient config
-        if recipient_config and 'connection_config' in recipient_config:
-            topic = recipient_config['connection_config'].get(
-                'mqtt_topic',
-                f"tifda/output/dissemination_reports/{message.recipient_id}"
-            )
-            qos = recipient_config['connection_config'].get('qos', 0)
-        else:
-            # Default topic structure: tifda/output/dissemination_reports/{recipient_id}
-            topic = f"tifda/output/dissemination_reports/{message.recipient_id}"
-            qos = 0
+        topic, qos = self._resolve_route(message, recipient_config)
         
-        # Format message as JSON
+        # Format message as JSON (encoded once, reused for publish and size)
         try:
             payload = self._format_message_payload(message)
         except Exception as e:
-            error_msg = f"Failed to format message: {e}"
-            logger.error(f"❌ {error_msg}")
-            self.publish_stats['total_failed'] += 1
-            return PublishResult(
-                success=False,
-                message_id=message.message_id,
-                topic=topic,
-                timestamp=datetime.now(timezone.utc),
-                error=error_msg
-            )
+            return self._record_result(message, topic, 0, f"Failed to format message: {e}")
+        
+        payload_size = len(payload)
         
         # Publish to MQTT
         try:
-            success = self.mqtt_client.publish(
+            success = self._client_for(message.recipient_id).publish(
                 topic=topic,
                 payload=payload,
                 qos=qos,
                 retain=False
             )
+        except Exception as e:
+            return self._record_result(message, topic, payload_size, f"Exception during publish: {e}")
+        
+        error_msg = None if success else "MQTT publish returned failure"
+        return self._record_result(message, topic, payload_size, error_msg)
+    
+    def _resolve_route(
+        self,
+        message: OutgoingMessage,
+        recipient_config: Optional[RecipientConfigLike]
+    ) -> Tuple[str, int]:
+        """
+        Determine topic and QoS from recipient config.
+        
+        Args:
+            message: OutgoingMessage to route
+            recipient_config: Recipient configuration dict or pre-resolved
+                ResolvedRecipient (may be None)
             
-            timestamp = datetime.now(timezone.utc)
+        Returns:
+            (topic, qos)
+        """
+        if not isinstance(recipient_config, ResolvedRecipient):
+            recipient_config = resolve_recipient(message.recipient_id, recipient_config)
+        
+        return recipient_config.topic, recipient_config.qos
+    
+    def _record_result(
+        self,
+        message: OutgoingMessage,
+        topic: str,
+        payload_size: int,
+        error_msg: Optional[str] = None,
+        timestamp: Optional[datetime] = None
+    ) -> PublishResult:
+        """
+        Update publish stats and build the PublishResult for one message.
+        
+        Args:
+            message: Message that was published (or attempted)
+            topic: Topic it was sent to
+            payload_size: Encoded payload size in bytes
+            error_msg: Failure reason, None on success
+            timestamp: Wall-clock time to stamp (shared by a whole slice), now if None
             
-            if success:
-                # Update stats
+        Returns:
+            PublishResult with status
+        """
+        if error_msg is None:
+            with self._stats_lock:
                 self.publish_stats['total_published'] += 1
                 self.publish_stats['by_recipient'][message.recipient_id] = \
                     self.publish_stats['by_recipient'].get(message.recipient_id, 0) + 1
                 self.publish_stats['by_topic'][topic] = \
                     self.publish_stats['by_topic'].get(topic, 0) + 1
-                
-                logger.info(f"✅ Published message {message.message_id} to topic '{topic}'")
-                
-                return PublishResult(
-                    success=True,
-                    message_id=message.message_id,
-                    topic=topic,
-                    timestamp=timestamp
-                )
-            else:
+            
+            logger.debug("✅ Published message %s to topic '%s'", message.message_id, topic)
+        else:
+            with self._stats_lock:
                 self.publish_stats['total_failed'] += 1
-                error_msg = "MQTT publish returned failure"
-                logger.error(f"❌ {error_msg}")
-                return PublishResult(
-                    success=False,
-                    message_id=message.message_id,
-                    topic=topic,
-                    timestamp=timestamp,
-                    error=error_msg
-                )
-                
-        except Exception as e:
-            self.publish_stats['total_failed'] += 1
-            error_msg = f"Exception during publish: {e}"
-            logger.error(f"❌ {error_msg}")
-            return PublishResult(
-                success=False,
-                message_id=message.message_id,
-                topic=topic,
-                timestamp=datetime.now(timezone.utc),
-                error=error_msg
-            )
+            logger.error("❌ %s", error_msg)
+        
+        return PublishResult(
+            success=error_msg is None,
+            message_id=message.message_id,
+            topic=topic,
+            timestamp=timestamp or datetime.now(timezone.utc),
+            error=error_msg,
+            payload_size_bytes=payload_size,
+            confirmed_at=time.monotonic()
+        )
     
-    def _format_message_payload(self, message: OutgoingMessage) -> str:
+    def _build_envelope(self, message: OutgoingMessage) -> Any:
         """
-        Format OutgoingMessage as JSON payload.
-        
-        Creates a structured JSON envelope with metadata + content.
+        Build the wire envelope (metadata + content) for one message.
         
         Args:
-            message: OutgoingMessage to format
+            message: OutgoingMessage to wrap
             
         Returns:
-            JSON string ready for MQTT
+            Envelope dict, or MessageEnvelope struct in msgpack mode
         """
-        # Create message envelope
         envelope = {
             # Metadata
             "message_id": message.message_id,
             "recipient_id": message.recipient_id,
             "format_type": message.format_type,
-            "timestamp": message.timestamp.isoformat(),
+            "timestamp": _isoformat(message.timestamp),
             "source": "TIFDA",
             
             # Actual content (format-specific structure)
@@ -491,61 +507,267 @@ class MQTTPublisher:
             "decision_id": message.decision_id if hasattr(message, 'decision_id') else None
         }
         
-        return json.dumps(envelope, indent=None)  # Compact JSON for MQTT
+        if WIRE_FORMAT == "msgpack":
+            return MessageEnvelope(**envelope)
+        
+        return envelope
+    
+    def _encode(self, obj: Any) -> bytes:
+        """Encode an envelope (or group of envelopes) for the active wire format"""
+        if WIRE_FORMAT == "msgpack":
+            return _msgpack_encoder.encode(obj)
+        
+        return orjson.dumps(obj)  # Compact JSON for MQTT
+    
+    def _format_message_payload(self, message: OutgoingMessage) -> bytes:
+        """
+        Format OutgoingMessage as wire payload.
+        
+        Creates a structured envelope with metadata + content, encoded as
+        JSON (orjson) or msgpack (msgspec) depending on WIRE_FORMAT. Both
+        encoders serialize datetimes found in content natively.
+        
+        Args:
+            message: OutgoingMessage to format
+            
+        Returns:
+            Encoded bytes ready for MQTT
+        """
+        return self._encode(self._build_envelope(message))
+    
+    def _format_group_payload(self, messages: List[OutgoingMessage]) -> bytes:
+        """
+        Format several messages for one recipient as a single wire payload.
+        
+        Args:
+            messages: OutgoingMessages sharing recipient, topic and QoS
+            
+        Returns:
+            Encoded {"batch": [envelope, ...], "count": k}
+        """
+        return self._encode({
+            "batch": [self._build_envelope(m) for m in messages],
+            "count": len(messages)
+        })
+    
+    def encode_framed(self, message: OutgoingMessage) -> bytes:
+        """
+        Encode a message for a stream transport as a length-prefixed frame.
+        
+        Uses the same envelope bytes as MQTT, so storage and transport stay
+        consistent and the payload is serialized only once.
+        
+        Args:
+            message: OutgoingMessage to encode
+            
+        Returns:
+            4-byte big-endian length followed by the encoded payload
+        """
+        return frame_payload(self._format_message_payload(message))
     
-    @traceable(name="mqtt_publish_batch")
+    @_traceable(name="mqtt_publish_batch")
     def publish_batch(
         self,
         messages: List[OutgoingMessage],
-        recipient_configs: Optional[Dict[str, Dict[str, Any]]] = None
+        recipient_configs: Optional[Dict[str, RecipientConfigLike]] = None,
+        timeout: float = PUBLISH_CONFIRM_TIMEOUT_SEC,
+        batch_size: int = CONFIRM_BATCH_SIZE
     ) -> Dict[str, Any]:
         """
         Publish multiple messages.
         
+        Messages are bucketed by pooled connection (i.e. by recipient) and the
+        buckets are published concurrently, one worker thread per connection.
+        Within a bucket messages keep their order and go out in slices of
+        batch_size: every publish of a slice is queued without waiting
+        (pipelined over the connection), then the confirmations that flowed in
+        through the on_publish callback are drained once for the slice instead
+        of paying one round-trip per message.
+        
+        Recipients whose connection_config sets 'batch': True get all their
+        messages in one {"batch": [...], "count": k} payload instead.
+        
+        QoS 0 publishes are fire-and-forget: they count as sent once queued
+        and never hold up a slice's confirmation drain.
+        
         Args:
             messages: List of OutgoingMessage objects
             recipient_configs: Dict mapping recipient_id -> config
+            timeout: Max seconds to wait for the confirmations of one slice
+            batch_size: Messages per confirmation batch
             
         Returns:
             Statistics: {
                 'total': int,
                 'successful': int,
                 'failed': int,
-                'results': List[PublishResult]
+                'results': List[PublishResult]  (same order as messages)
             }
         """
-        results = []
-        successful = 0
-        failed = 0
-        
-        for message in messages:
-            # Get recipient config if available
-            recipient_config = None
-            if recipient_configs and message.recipient_id in recipient_configs:
-                recipient_config = recipient_configs[message.recipient_id]
-            
-            # Publish
-            result = self.publish_message(message, recipient_config)
-            results.append(result)
+        recipient_configs = recipient_configs or {}
+        
+        # Bucket publish units by connection, remembering each message's
+        # position. A unit is one message, or every message of a recipient
+        # that takes batched payloads.
+        buckets: Dict[int, List[Tuple[List[Tuple[int, OutgoingMessage]], bool]]] = defaultdict(list)
+        grouped: Dict[str, List[Tuple[int, OutgoingMessage]]] = {}
+        
+        for position, message in enumerate(messages):
+            recipient_id = message.recipient_id
             
-            if result.success:
-                successful += 1
+            if _wants_batched_payload(recipient_configs.get(recipient_id)):
+                group = grouped.get(recipient_id)
+                if group is None:
+                    group = grouped[recipient_id] = []
+                    buckets[self._client_index(recipient_id)].append((group, True))
+                group.append((position, message))
             else:
-                failed += 1
+                buckets[self._client_index(recipient_id)].append(([(position, message)], False))
+        
+        results: List[Optional[PublishResult]] = [None] * len(messages)
+        
+        if len(buckets) <= 1:
+            for client_index, bucket in buckets.items():
+                for position, result in self._publish_bucket(
+                    self.mqtt_clients[client_index], bucket, recipient_configs, timeout, batch_size
+                ):
+                    results[position] = result
+        else:
+            with ThreadPoolExecutor(max_workers=min(PUBLISH_WORKERS, len(buckets))) as executor:
+                futures = [
+                    executor.submit(
+                        self._publish_bucket,
+                        self.mqtt_clients[client_index], bucket, recipient_configs, timeout, batch_size
+                    )
+                    for client_index, bucket in buckets.items()
+                ]
+                for future in as_completed(futures):
+                    for position, result in future.result():
+                        results[position] = result
+        
+        successful = sum(1 for r in results if r.success)
         
         return {
             'total': len(messages),
             'successful': successful,
-            'failed': failed,
+            'failed': len(results) - successful,
             'results': results
         }
     
+    def _publish_bucket(
+        self,
+        client: MQTTClient,
+        bucket: List[Tuple[List[Tuple[int, OutgoingMessage]], bool]],
+        recipient_configs: Dict[str, RecipientConfigLike],
+        timeout: float,
+        batch_size: int
+    ) -> List[Tuple[int, PublishResult]]:
+        """
+        Publish one connection's units in order, draining confirms per slice.
+        
+        Args:
+            client: Pooled connection that owns these recipients
+            bucket: (items, grouped) units in send order; items are
+                (position in the batch, message) pairs and grouped units
+                are sent as one batched payload
+            recipient_configs: Dict mapping recipient_id -> config
+            timeout: Max seconds to wait for the confirmations of one slice
+            batch_size: Publishes per confirmation batch
+            
+        Returns:
+            (position, PublishResult) pairs; a grouped payload's size is
+            reported on its first message
+        """
+        results = []
+        
+        for batch_id, start in enumerate(range(0, len(bucket), batch_size)):
+            # Queue every publish of the slice without waiting
+            queued = []
+            pending_mids: Dict[Tuple[int, int], float] = {}
+            
+            for items, is_group in bucket[start:start + batch_size]:
+                message = items[0][1]
+                
+                try:
+                    topic, qos = self._resolve_route(message, recipient_configs.get(message.recipient_id))
+                except Exception as e:
+                    # A bad recipient config fails this unit only, not the bucket
+                    topic = _default_topic(message.recipient_id)
+                    queued.append((items, topic, None, 0, f"Failed to resolve route: {e}"))
+                    continue
+                
+                try:
+                    if is_group:
+                        payload = self._format_group_payload([m for _, m in items])
+                    else:
+                        payload = self._format_message_payload(message)
+                except Exception as e:
+                    queued.append((items, topic, None, 0, f"Failed to format message: {e}"))
+                    continue
+                
+                # The encoded bytes are the single source for publish and size
+                payload_size = len(payload)
+                queued_at = time.monotonic()
+                info = client.publish_nowait(topic=topic, payload=payload, qos=qos)
+                
+                if info is None:
+                    queued.append((items, topic, None, payload_size, "MQTT publish returned failure"))
+                elif qos == 0:
+                    # Fire-and-forget: QoS 0 has no broker ack, so being
+                    # queued is all there is to confirm
+                    queued.append((items, topic, _QOS0_SENT, payload_size, None))
+                else:
+                    key = (id(client.client), info.mid)
+                    pending_mids[key] = queued_at
+                    queued.append((items, topic, key, payload_size, None))
+            
+            # One confirmation drain per slice
+            confirmed = self._drain_confirms(pending_mids, timeout)
+            slice_ts = datetime.now(timezone.utc)
+            
+            for items, topic, key, payload_size, error_msg in queued:
+                if error_msg is None and key is not _QOS0_SENT and key not in confirmed:
+                    error_msg = _ACK_TIMEOUT_ERROR
+                
+                for position, message in items:
+                    result = self._record_result(message, topic, payload_size, error_msg, slice_ts)
+                    result.batch_id = batch_id
+                    results.append((position, result))
+                    payload_size = 0  # Count a shared payload once
+        
+        return results
+    
     def get_stats(self) -> Dict[str, Any]:
-        """Get publishing statistics"""
-        return {
-            **self.publish_stats,
-            'connected': self.mqtt_client.is_connected
-        }
+        """
+        Get publishing statistics.
+        
+        The snapshot is reused for HEALTH_CHECK_TTL_SEC as long as no publish
+        outcome has been recorded and the number of live connections (always
+        read live) hasn't changed since it was taken.
+        """
+        now = time.monotonic()
+        connections_up = sum(1 for c in self.mqtt_clients if c.is_connected)
+        counters = (self.publish_stats['total_published'], self.publish_stats['total_failed'], connections_up)
+        
+        if (
+            self._stats_snapshot is not None
+            and self._stats_snapshot_key == counters
+            and now - self._stats_snapshot_at < HEALTH_CHECK_TTL_SEC
+        ):
+            return self._stats_snapshot
+        
+        with self._stats_lock:
+            snapshot = {
+                **self.publish_stats,
+                'connected': connections_up > 0,
+                'connections_up': connections_up,
+                'pool_size': len(self.mqtt_clients)
+            }
+        
+        self._stats_snapshot = snapshot
+        self._stats_snapshot_key = counters
+        self._stats_snapshot_at = now
+        return snapshot
     
     def health_check(self) -> tuple[bool, str]:
         """
@@ -554,15 +776,96 @@ class MQTTPublisher:
         Returns:
             (is_healthy, message)
         """
-        if not self.mqtt_client.is_connected:
-            return False, "MQTT client not connected"
+        # Connection flags are plain attributes kept current by the paho
+        # callbacks, so they are read live on every check (never cached)
+        connected = sum(1 for c in self.mqtt_clients if c.is_connected)
+        published = self.publish_stats['total_published']
+        
+        if connected == 0:
+            return False, f"MQTT client not connected (0/{len(self.mqtt_clients)} connections up)"
+        
+        # Recipients of a dropped connection fail over to a live one, so a
+        # partial pool can still deliver everything
+        if connected < len(self.mqtt_clients):
+            return True, (
+                f"Publisher degraded - {connected}/{len(self.mqtt_clients)} connections up, "
+                f"{published} messages published"
+            )
         
-        return True, f"Publisher healthy - {self.publish_stats['total_published']} messages published"
+        return True, f"Publisher healthy - {published} messages published"
+
+
+@lru_cache(maxsize=256)
+def _isoformat(ts: datetime) -> str:
+    """ISO string for a timestamp; a transmission batch shares one, so it is formatted once"""
+    return ts.isoformat()
+
+
+def resolve_recipient(
+    recipient_id: str,
+    recipient_config: Optional[Dict[str, Any]]
+) -> ResolvedRecipient:
+    """
+    Resolve a recipient config dict into its wire routing.
+    
+    Args:
+        recipient_id: Recipient identifier
+        recipient_config: Recipient configuration (may be None); MQTT settings
+            live in its 'connection_config' ('mqtt_topic', 'qos', 'batch')
+        
+    Returns:
+        ResolvedRecipient (default topic and QoS 0 when not configured)
+    """
+    connection_config = (recipient_config or {}).get('connection_config') or {}
+    topic = connection_config.get('mqtt_topic')
+    
+    return ResolvedRecipient(
+        recipient_id=recipient_id,
+        # Default topic structure: tifda/output/dissemination_reports/{recipient_id}
+        topic=_default_topic(recipient_id) if topic is None else _wire_topic(topic),
+        qos=connection_config.get('qos', 0),
+        batch=bool(connection_config.get('batch', False))
+    )
+
+
+def _wants_batched_payload(recipient_config: Optional[RecipientConfigLike]) -> bool:
+    """Whether a recipient takes several messages per payload (connection_config['batch'])"""
+    if not recipient_config:
+        return False
+    if isinstance(recipient_config, ResolvedRecipient):
+        return recipient_config.batch
+    return bool((recipient_config.get('connection_config') or {}).get('batch', False))
+
+
+@lru_cache(maxsize=4096)
+def _wire_topic(topic: str) -> str:
+    """Topic as published for the active wire format (recipients repeat, so cached)"""
+    return topic + _TOPIC_SUFFIX
+
+
+@lru_cache(maxsize=4096)
+def _default_topic(recipient_id: str) -> str:
+    """Default wire topic for a recipient without an explicit mqtt_topic"""
+    return DEFAULT_TOPIC_BASE + "/" + recipient_id + _TOPIC_SUFFIX
+
+
+def frame_payload(body: bytes) -> bytes:
+    """
+    Prefix an encoded payload with its 4-byte big-endian length.
+    
+    Args:
+        body: Encoded payload (JSON or msgpack bytes)
+        
+    Returns:
+        Length-prefixed frame
+    """
+    return _FRAME_HEADER.pack(len(body)) + body
 
 
 # ==================== SINGLETON INSTANCE ====================
 
 _mqtt_publisher: Optional[MQTTPublisher] = None
+_mqtt_publisher_lock = threading.Lock()
 
 
 def get_mqtt_publisher(
@@ -581,53 +884,68 @@ def get_mqtt_publisher(
     """
     global _mqtt_publisher
     
-    if _mqtt_publisher is None or force_new:
-        # Get config from TIFDA config if not provided
-        if mqtt_config is None:
-            from src.core.config import get_config
-            config = get_config()
-            mqtt_config = MQTTConfig(
-                host=config.mqtt.host,
-                port=config.mqtt.port,
-                client_id=config.mqtt.client_id,
-                username=config.mqtt.username,
-                password=config.mqtt.password
-            )
+    # Fast path: the connections are opened once per process and reused
+    if _mqtt_publisher is not None and not force_new:
+        return _mqtt_publisher
+    
+    with _mqtt_publisher_lock:
+        if _mqtt_publisher is None or force_new:
+            _mqtt_publisher = _create_mqtt_publisher(mqtt_config)
+    
+    return _mqtt_publisher
+
+
+def _create_mqtt_publisher(mqtt_config: Optional[MQTTConfig]) -> MQTTPublisher:
+    """
+    Open POOL_SIZE persistent connections and wrap them in a publisher.
+    
+    Args:
+        mqtt_config: MQTT configuration (if None, uses default from config.py)
         
-        # Create MQTT client
-        mqtt_client = MQTTClient(mqtt_config)
+    Returns:
+        MQTTPublisher instance
+    """
+    # Get config from TIFDA config if not provided
+    if mqtt_config is None:
+        from src.core.config import get_config
+        config = get_config()
+        mqtt_config = MQTTConfig(
+            host=config.mqtt.host,
+            port=config.mqtt.port,
+            client_id=config.mqtt.client_id,
+            username=config.mqtt.username,
+            password=config.mqtt.password
+        )
+    
+    # Create MQTT clients (client ids must be unique per connection)
+    clients = []
+    for i in range(POOL_SIZE):
+        client_config = replace(mqtt_config, client_id=f"{mqtt_config.client_id}-{i}") if i else mqtt_config
+        mqtt_client = MQTTClient(client_config)
         
         # Connect (blocking)
         if not mqtt_client.connect(blocking=True):
+            for opened in clients:
+                opened.disconnect()
             raise ConnectionError("Failed to connect to MQTT broker")
         
-        # Create publisher
-        _mqtt_publisher = MQTTPublisher(mqtt_client)
-        logger.info("✅ MQTT Publisher initialized")
+        clients.append(mqtt_client)
     
-    return _mqtt_publisher
-
-
-def shutdown_mqtt_publisher():
-    """Shutdown the global MQTT publisher"""
-    global _mqtt_publisher
+    # Create publisher
+    publisher = MQTTPublisher(clients[0], pool=clients[1:])
+    logger.info("✅ MQTT Publisher initialized (%d connections)", len(clients))
     
-    if _mqtt_publisher:
-        _mqtt_publisher.mqtt_client.disconnect()
-        _mqtt_publisher = None
-        logger.info("MQTT Publisher shutdown")
-        # Create publisher
-        _mqtt_publisher = MQTTPublisher(mqtt_client)
-        logger.info("✅ MQTT Publisher initialized")
-    
-    return _mqtt_publisher
+    return publisher
 
 
 def shutdown_mqtt_publisher():
     """Shutdown the global MQTT publisher"""
     global _mqtt_publisher
     
-    if _mqtt_publisher:
-        _mqtt_publisher.mqtt_client.disconnect()
-        _mqtt_publisher = None
-        logger.info("MQTT Publisher shutdown")
\ No newline at end of file
+    with _mqtt_publisher_lock:
+        if _mqtt_publisher:
+            _mqtt_publisher.close()
+            for client in _mqtt_publisher.mqtt_clients:
+                client.disconnect()
+            _mqtt_publisher = None
+            logger.info("MQTT Publisher shutdown")
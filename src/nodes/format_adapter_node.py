@@ -411,51 +411,51 @@ def format_adapter_node(state: TIFDAState) -> Dict[str, Any]:
     
     # ============ BUILD REASONING ============
     
-    reasoning = f"""## 📝 Format Adaptation Complete
+    parts = [f"""## 📝 Format Adaptation Complete
 
 **Sensor**: `{sensor_id}`
 **Messages Formatted**: {len(formatted_messages)}
 **Errors**: {len(format_errors)}
 
 ### Format Distribution:
-"""
+"""]
     
     if format_counts["link16"] > 0:
-        reasoning += f"- 🔗 **Link16**: {format_counts['link16']} (NATO tactical data link)\n"
+        parts.append(f"- 🔗 **Link16**: {format_counts['link16']} (NATO tactical data link)\n")
     if format_counts["json"] > 0:
-        reasoning += f"- 📄 **JSON**: {format_counts['json']} (modern APIs)\n"
+        parts.append(f"- 📄 **JSON**: {format_counts['json']} (modern APIs)\n")
     if format_counts["xml"] > 0:
-        reasoning += f"- 📋 **XML**: {format_counts['xml']} (legacy systems)\n"
+        parts.append(f"- 📋 **XML**: {format_counts['xml']} (legacy systems)\n")
     if format_counts["csv"] > 0:
-        reasoning += f"- 📊 **CSV**: {format_counts['csv']} (tabular format)\n"
+        parts.append(f"- 📊 **CSV**: {format_counts['csv']} (tabular format)\n")
     
-    reasoning += "\n"
+    parts.append("\n")
     
     if formatted_messages:
-        reasoning += "### 📤 Formatted Messages:\n\n"
+        parts.append("### 📤 Formatted Messages:\n\n")
         
-        # Group by recipient
+        # Group by recipient: recipient_id -> [message count, formats]
         messages_by_recipient = {}
         for msg in formatted_messages:
-            if msg["recipient_id"] not in messages_by_recipient:
-                messages_by_recipient[msg["recipient_id"]] = []
-            messages_by_recipient[msg["recipient_id"]].append(msg)
+            entry = messages_by_recipient.setdefault(msg["recipient_id"], [0, set()])
+            entry[0] += 1
+            entry[1].add(msg["format"])
         
-        for recipient_id, messages in messages_by_recipient.items():
-            formats = [msg["format"] for msg in messages]
-            reasoning += f"**{recipient_id}**: {len(messages)} message(s) in {', '.join(set(formats)).upper()}\n"
+        parts.extend(
+            f"**{recipient_id}**: {count} message(s) in {', '.join(formats).upper()}\n"
+            for recipient_id, (count, formats) in messages_by_recipient.items()
+        )
         
-        reasoning += "\n"
+        parts.append("\n")
     
     if format_errors:
-        reasoning += f"### ⚠️  Format Errors ({len(format_errors)}):\n"
-        for error in format_errors[:3]:
-            reasoning += f"- {error}\n"
-        reasoning += "\n"
+        parts.append(f"### ⚠️  Format Errors ({len(format_errors)}):\n")
+        parts.extend(f"- {error}\n" for error in format_errors[:3])
+        parts.append("\n")
     
     # Show format examples (truncated)
     if formatted_messages:
-        reasoning += "### 📋 Format Examples:\n\n"
+        parts.append("### 📋 Format Examples:\n\n")
         
         # Show one example per format
         shown_formats = set()
@@ -464,10 +464,10 @@ def format_adapter_node(state: TIFDAState) -> Dict[str, Any]:
                 shown_formats.add(msg["format"])
                 
                 content_preview = str(msg["content"])[:200]
-                reasoning += f"**{msg['format'].upper()}** (to {msg['recipient_id']}):\n"
-                reasoning += f"```\n{content_preview}...\n```\n\n"
+                parts.append(f"**{msg['format'].upper()}** (to {msg['recipient_id']}):\n")
+                parts.append(f"```\n{content_preview}...\n```\n\n")
     
-    reasoning += """
+    parts.append("""
 ### Supported Formats:
 - **Link16**: NATO J-series tactical data link
 - **JSON**: Modern REST API format
@@ -475,7 +475,9 @@ def format_adapter_node(state: TIFDAState) -> Dict[str, Any]:
 - **CSV**: Simple tabular format
 
 **Next**: Route to `transmission_node` for MQTT publishing
-"""
+""")
+    
+    reasoning = "".join(parts)
     
     # ============ UPDATE STATE ============
     
@@ -26,6 +26,7 @@ from datetime import datetime, timezone
 from langsmith import traceable
 
 from src.core.state import TIFDAState, log_decision, add_notification
+from src.core.constants import make_snippet
 from src.tools.audio_tools import process_audio_file
 from src.tools.image_tools import process_tactical_image
 from src.tools.document_tools import process_document
@@ -122,6 +123,7 @@ def multimodal_parser_node(state: TIFDAState) -> Dict[str, Any]:
                     "success": True,
                     "file_path": audio_path,
                     "report": audio_report,
+                    "snippet": make_snippet(audio_report),
                     "processed_at": datetime.now(timezone.utc).isoformat()
                 }
                 
@@ -164,6 +166,7 @@ def multimodal_parser_node(state: TIFDAState) -> Dict[str, Any]:
                     "success": True,
                     "file_path": image_path,
                     "report": image_report,
+                    "snippet": make_snippet(image_report),
                     "analysis_type": "general",
                     "processed_at": datetime.now(timezone.utc).isoformat()
                 }
@@ -206,6 +209,7 @@ def multimodal_parser_node(state: TIFDAState) -> Dict[str, Any]:
                     "success": True,
                     "file_path": document_path,
                     "report": document_report,
+                    "snippet": make_snippet(document_report),
                     "processed_at": datetime.now(timezone.utc).isoformat()
                 }
                 
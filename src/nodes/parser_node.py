@@ -135,8 +135,8 @@ def parser_node(state: TIFDAState) -> Dict[str, Any]:
         
         logger.info(f"\n🔧 Parsing with {parser_name}...")
         
-        # Parse using factory (includes validation)
-        success, error_message, entities = factory.parse(sensor_event)
+        # Parse using factory (includes validation; reuses the selected parser)
+        success, error_message, entities = factory.parse(sensor_event, parser=parser)
         
         if not success:
             error_msg = f"Parsing failed: {error_message}"
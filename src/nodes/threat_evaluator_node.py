@@ -28,6 +28,8 @@ Node Signature:
 import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timezone
+from collections import defaultdict, Counter
+import itertools
 import math
 
 from langsmith import traceable
@@ -35,6 +37,7 @@ from langchain_openai import ChatOpenAI
 from langchain_core.messages import SystemMessage, HumanMessage
 
 from src.core.state import TIFDAState, log_decision, add_notification
+from src.core.constants import make_snippet
 from src.models import EntityCOP, ThreatAssessment
 from src.rules import threat_rules
 
@@ -46,16 +49,35 @@ logger = logging.getLogger(__name__)
 # Threat assessment configuration
 THREAT_ASSESSMENT_MODEL = "gpt-4o-mini"  # Fast and cost-effective
 THREAT_ASSESSMENT_TEMPERATURE = 0.1  # Low temperature for consistent assessments
+MAX_INPUT_TOKENS = 6000  # Preflight budget for system + user prompt
 THREAT_PROXIMITY_RADIUS_KM = 2000  # Consider threats within THREAT_PROXIMITY_RADIUS_KM  of friendlies
 # tbh, THREAT_PROXIMITY_RADIUS_KM makes no sense because the distances are already defined in thread rules
 
 # Entities that trigger threat assessment
 THREAT_TRIGGER_CLASSIFICATIONS = ["hostile", "unknown"]
 
+# Skip the LLM for obvious low-threat cases the rules leave ambiguous
+# (kept as a flag so the shortcut can be audited / disabled)
+USE_HEURISTIC_SHORTCUT = True
+
 
 # ==================== GEOSPATIAL UTILITIES ====================
 
-def _haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+# Optional JIT acceleration - numba is not a hard dependency, the pure
+# Python path below is used when it is not installed
+try:
+    import numpy as np
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Below this many friendlies the parallel kernel's thread dispatch costs more
+# than the distance math, so the scalar haversine is used instead
+PARALLEL_DISTANCE_MIN = 256
+
+
+def _haversine_scalar(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
     Calculate distance between two points using Haversine formula.
     
@@ -82,6 +104,31 @@ def _haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> f
     return distance
 
 
+if NUMBA_AVAILABLE:
+    _haversine_scalar_nb = njit(cache=True, fastmath=True)(_haversine_scalar)
+    
+    @njit(cache=True, parallel=True, fastmath=True)
+    def _haversine_array_nb(lat, lon, lats, lons):
+        """
+        Distances (km) from one point to many points, computed in parallel.
+        
+        Args:
+            lat, lon: Reference point (degrees)
+            lats, lons: float64 arrays of target points (degrees)
+            
+        Returns:
+            float64 array of distances in kilometers
+        """
+        out = np.empty(lats.shape[0])
+        for i in prange(lats.shape[0]):
+            out[i] = _haversine_scalar_nb(lat, lon, lats[i], lons[i])
+        return out
+    
+    _haversine_distance = _haversine_scalar_nb
+else:
+    _haversine_distance = _haversine_scalar
+
+
 def _find_nearby_friendlies(
     entity: EntityCOP,
     cop_entities: Dict[str, EntityCOP],
@@ -98,36 +145,94 @@ def _find_nearby_friendlies(
     Returns:
         List of friendly entities within radius
     """
-    nearby_friendlies = []
+    # Friendly entities other than the one being assessed
+    candidates = [
+        other_entity for other_id, other_entity in cop_entities.items()
+        if other_entity.classification == "friendly" and other_id != entity.entity_id
+    ]
     
-    for other_id, other_entity in cop_entities.items():
-        # Skip if not friendly
-        if other_entity.classification != "friendly":
-            continue
-        
-        # Skip if same entity
-        if other_id == entity.entity_id:
-            continue
-        
-        # Calculate distance
-        distance_km = _haversine_distance(
+    if not candidates:
+        return []
+    
+    if NUMBA_AVAILABLE and len(candidates) >= PARALLEL_DISTANCE_MIN:
+        distances = _haversine_array_nb(
             entity.location.lat, entity.location.lon,
-            other_entity.location.lat, other_entity.location.lon
+            np.array([c.location.lat for c in candidates], dtype=np.float64),
+            np.array([c.location.lon for c in candidates], dtype=np.float64)
         )
-        
-        if distance_km <= radius_km:
-            nearby_friendlies.append(other_entity)
+    else:
+        distances = [
+            _haversine_distance(
+                entity.location.lat, entity.location.lon,
+                c.location.lat, c.location.lon
+            )
+            for c in candidates
+        ]
     
-    return nearby_friendlies
+    return [c for c, distance_km in zip(candidates, distances) if distance_km <= radius_km]
 
 
 # ==================== HYBRID THREAT ASSESSMENT ====================
 
+def _make_assessment_id(entity_id: str, now: datetime, seq: "itertools.count[int]") -> str:
+    """
+    Build a unique assessment ID.
+    
+    Args:
+        entity_id: Assessed entity
+        now: Batch timestamp
+        seq: Batch-wide counter
+        
+    Returns:
+        Assessment ID of the form threat_<entity>_<epoch>_<n>
+    """
+    return f"threat_{entity_id}_{int(now.timestamp())}_{next(seq)}"
+
+
+def _heuristic_assess(
+    entity: EntityCOP,
+    distance_to_nearest: float
+) -> Optional[Dict[str, Any]]:
+    """
+    Cheap pre-filter for ambiguous cases where the LLM answer is predictable.
+    
+    Only called once the rules have left the case ambiguous, i.e. the entity
+    sits between its must_notify and never_notify distances.
+    
+    Args:
+        entity: Entity to assess
+        distance_to_nearest: Distance to the nearest friendly (km)
+        
+    Returns:
+        Dict with threat_level, confidence and reasoning, or None if the
+        case still needs the LLM
+    """
+    if entity.classification != "unknown" or entity.speed_kmh not in (None, 0):
+        return None
+    
+    must_notify_km, never_notify_km, _ = threat_rules.get_distance_thresholds(entity.entity_type, "unknown")
+    
+    if must_notify_km <= distance_to_nearest <= never_notify_km:
+        return {
+            "threat_level": "low",
+            "confidence": 0.6,
+            "reasoning": (
+                f"Heuristic assessment: stationary unknown {entity.entity_type} at "
+                f"{distance_to_nearest:.0f}km from nearest friendly, outside the "
+                f"{must_notify_km:.0f}km must-notify range → LOW"
+            )
+        }
+    
+    return None
+
+
 def _assess_threat_hybrid(
     entity: EntityCOP,
     nearby_friendlies: List[EntityCOP],
     llm: ChatOpenAI,
-    multimodal_available: bool
+    multimodal_available: bool,
+    now: datetime,
+    seq: "itertools.count[int]"
 ) -> Optional[ThreatAssessment]:
     """
     Hybrid threat assessment - tries rules first, then LLM.
@@ -142,6 +247,8 @@ def _assess_threat_hybrid(
         nearby_friendlies: List of friendly entities nearby
         llm: LLM instance for ambiguous cases
         multimodal_available: Whether multimodal data exists
+        now: Batch timestamp shared by all assessments of this node run
+        seq: Counter making assessment IDs unique within the batch
         
     Returns:
         ThreatAssessment or None if not a threat
@@ -151,7 +258,7 @@ def _assess_threat_hybrid(
     
     # Quick check: should we even assess this entity?
     if not threat_rules.should_assess_threat(entity):
-        logger.info(f"⏭️  Skipping {entity.entity_id} ({entity.classification} - no threat)")
+        logger.debug("⏭️  Skipping %s (%s - no threat)", entity.entity_id, entity.classification)
         return None
     
     # ============ STEP 2: CALCULATE DISTANCE ============
@@ -179,11 +286,14 @@ def _assess_threat_hybrid(
     
     if obvious_level:
         # ✅ Rule-based assessment succeeded (in principle, most of cases)
-        logger.info(f"⚡ Rule-based assessment: {entity.entity_id} → {obvious_level.upper()}")
-        logger.info(f"   Classification: {entity.classification}, Type: {entity.entity_type}, Distance: {distance_to_nearest:.0f}km")
+        logger.debug(
+            "⚡ Rule-based assessment: %s → %s (%s %s, %.0fkm)",
+            entity.entity_id, obvious_level.upper(),
+            entity.classification, entity.entity_type, distance_to_nearest
+        )
         
         # Create threat assessment from rule-based decision
-        assessment_id = f"threat_{entity.entity_id}_{int(datetime.now(timezone.utc).timestamp())}"
+        assessment_id = _make_assessment_id(entity.entity_id, now, seq)
         
         threat_assessment = ThreatAssessment(
             assessment_id=assessment_id,
@@ -192,7 +302,7 @@ def _assess_threat_hybrid(
             threat_source_id=entity.entity_id,
             reasoning=f"Rule-based assessment: {entity.classification} {entity.entity_type} at {distance_to_nearest:.0f}km from nearest friendly → {obvious_level.upper()}. Fast deterministic evaluation based on threat classification matrix.",
             confidence=0.95,  # High confidence for rule-based
-            timestamp=datetime.now(timezone.utc),
+            timestamp=now,
             distances_to_affected_km={
                 f.entity_id: _haversine_distance(
                     entity.location.lat, entity.location.lon,
@@ -204,17 +314,46 @@ def _assess_threat_hybrid(
         
         return threat_assessment
     
-    # ============ STEP 4: FALL BACK TO LLM (AMBIGUOUS CASES) ============
+    # ============ STEP 4: HEURISTIC SHORTCUT ============
     
-    logger.info(f"🤖 Ambiguous case - calling LLM for {entity.entity_id}")
-    logger.info(f"   (Distance: {distance_to_nearest:.0f}km, Classification: {entity.classification})")
+    if USE_HEURISTIC_SHORTCUT:
+        heuristic = _heuristic_assess(entity, distance_to_nearest)
+        
+        if heuristic:
+            logger.debug("⚡ Heuristic assessment: %s → %s (LLM skipped)", entity.entity_id, heuristic["threat_level"].upper())
+            
+            return ThreatAssessment(
+                assessment_id=_make_assessment_id(entity.entity_id, now, seq),
+                threat_level=heuristic["threat_level"],
+                affected_entities=[f.entity_id for f in nearby_friendlies],
+                threat_source_id=entity.entity_id,
+                reasoning=heuristic["reasoning"],
+                confidence=heuristic["confidence"],
+                timestamp=now,
+                distances_to_affected_km={
+                    f.entity_id: _haversine_distance(
+                        entity.location.lat, entity.location.lon,
+                        f.location.lat, f.location.lon
+                    )
+                    for f in nearby_friendlies
+                }
+            )
+    
+    # ============ STEP 5: FALL BACK TO LLM (AMBIGUOUS CASES) ============
+    
+    logger.debug(
+        "🤖 Ambiguous case - calling LLM for %s (Distance: %.0fkm, Classification: %s)",
+        entity.entity_id, distance_to_nearest, entity.classification
+    )
     
     # Use LLM assessment for ambiguous cases (these should be the less frequent scenarios of cases)
     return _assess_threat_with_llm(
         entity,
         nearby_friendlies,
         llm,
-        multimodal_available
+        multimodal_available,
+        now,
+        seq
     )
 
 
@@ -246,7 +385,8 @@ Provide clear, actionable reasoning. Be conservative - when in doubt, assess as
 def _build_threat_assessment_prompt(
     entity: EntityCOP,
     nearby_friendlies: List[EntityCOP],
-    multimodal_available: bool
+    multimodal_available: bool,
+    comments: Optional[str] = None
 ) -> str:
     """
     Build the threat assessment prompt for LLM.
@@ -255,6 +395,7 @@ def _build_threat_assessment_prompt(
         entity: Entity to assess
         nearby_friendlies: Friendly entities nearby
         multimodal_available: Whether multimodal data is available
+        comments: Replacement for entity.comments (e.g. truncated), None to use them as is
         
     Returns:
         Formatted prompt string
@@ -281,8 +422,9 @@ ENTITY DETAILS:
     prompt += f"- Source sensors: {', '.join(entity.source_sensors)}\n"
     
     # Comments (may include multimodal flags)
-    if entity.comments:
-        prompt += f"- Additional info: {entity.comments}\n"
+    comments = entity.comments if comments is None else comments
+    if comments:
+        prompt += f"- Additional info: {comments}\n"
     
     # Multimodal data
     if multimodal_available and "multimodal_results" in entity.metadata:
@@ -292,20 +434,17 @@ ENTITY DETAILS:
         
         if "audio" in multimodal and multimodal["audio"].get("success"):
             prompt += "- Audio transcription available (radio intercept)\n"
-            report = multimodal["audio"]["report"]
-            snippet = report[:300] + "..." if len(report) > 300 else report
+            snippet = multimodal["audio"].get("snippet") or make_snippet(multimodal["audio"]["report"])
             prompt += f"  Preview: {snippet}\n"
         
         if "image" in multimodal and multimodal["image"].get("success"):
             prompt += "- Visual analysis available (imagery)\n"
-            report = multimodal["image"]["report"]
-            snippet = report[:300] + "..." if len(report) > 300 else report
+            snippet = multimodal["image"].get("snippet") or make_snippet(multimodal["image"]["report"])
             prompt += f"  Preview: {snippet}\n"
         
         if "document" in multimodal and multimodal["document"].get("success"):
             prompt += "- Document intelligence available\n"
-            report = multimodal["document"]["report"]
-            snippet = report[:300] + "..." if len(report) > 300 else report
+            snippet = multimodal["document"].get("snippet") or make_snippet(multimodal["document"]["report"])
             prompt += f"  Preview: {snippet}\n"
     
     # Nearby friendlies
@@ -341,11 +480,82 @@ AFFECTED_ENTITIES: <comma-separated IDs or "none">
     return prompt
 
 
+_token_encoder = None
+_system_prompt_tokens: Optional[int] = None  # THREAT_ASSESSMENT_SYSTEM_PROMPT is constant, counted once
+
+
+def _load_token_encoder():
+    """tiktoken encoding for the assessment model, False if it can't be loaded"""
+    global _token_encoder
+    
+    if _token_encoder is None:
+        try:
+            import tiktoken
+            _token_encoder = tiktoken.encoding_for_model(THREAT_ASSESSMENT_MODEL)
+        except Exception:
+            _token_encoder = False
+    
+    return _token_encoder
+
+
+def _count_tokens(text: str) -> int:
+    """
+    Estimate the token count of a prompt.
+    
+    Uses tiktoken (installed with langchain-openai) when the encoding can be
+    loaded, otherwise falls back to the ~4 characters per token rule of thumb.
+    
+    Args:
+        text: Prompt text
+        
+    Returns:
+        Estimated number of tokens
+    """
+    encoder = _load_token_encoder()
+    
+    if encoder:
+        return len(encoder.encode(text))
+    return len(text) // 4
+
+
+def _truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Cut text down to about max_tokens tokens.
+    
+    Args:
+        text: Text to shorten
+        max_tokens: Token budget for it
+        
+    Returns:
+        Text unchanged if within budget, otherwise its head + "..."
+    """
+    if _count_tokens(text) <= max_tokens:
+        return text
+    
+    encoder = _load_token_encoder()
+    
+    if encoder:
+        return encoder.decode(encoder.encode(text)[:max_tokens]) + "..."
+    return text[:max_tokens * 4] + "..."
+
+
+def _prompt_tokens(prompt: str) -> int:
+    """Tokens of the system prompt plus the given user prompt"""
+    global _system_prompt_tokens
+    
+    if _system_prompt_tokens is None:
+        _system_prompt_tokens = _count_tokens(THREAT_ASSESSMENT_SYSTEM_PROMPT)
+    
+    return _system_prompt_tokens + _count_tokens(prompt)
+
+
 def _assess_threat_with_llm(
     entity: EntityCOP,
     nearby_friendlies: List[EntityCOP],
     llm: ChatOpenAI,
-    multimodal_available: bool
+    multimodal_available: bool,
+    now: datetime,
+    seq: "itertools.count[int]"
 ) -> Optional[ThreatAssessment]:
     """
     Assess threat using LLM (for ambiguous cases).
@@ -355,13 +565,39 @@ def _assess_threat_with_llm(
         nearby_friendlies: Friendly entities nearby
         llm: LLM instance
         multimodal_available: Whether multimodal data exists
+        now: Batch timestamp shared by all assessments of this node run
+        seq: Counter making assessment IDs unique within the batch
         
     Returns:
         ThreatAssessment or None
     """
     prompt = _build_threat_assessment_prompt(entity, nearby_friendlies, multimodal_available)
     
-    logger.info(f"   🤖 Calling LLM for threat assessment...")
+    # Preflight: an oversize prompt is slow (or rejected). Everything but the
+    # free-text comments is bounded, so those are trimmed to fit the budget.
+    prompt_tokens = _prompt_tokens(prompt)
+    
+    if prompt_tokens > MAX_INPUT_TOKENS and entity.comments:
+        # A few tokens of slack for the "..." marker and re-tokenization at the cut
+        comment_budget = _count_tokens(entity.comments) - (prompt_tokens - MAX_INPUT_TOKENS) - 8
+        logger.warning(
+            "   ⚠️  Prompt for %s is %d tokens (max %d), truncating comments",
+            entity.entity_id, prompt_tokens, MAX_INPUT_TOKENS
+        )
+        prompt = _build_threat_assessment_prompt(
+            entity, nearby_friendlies, multimodal_available,
+            comments=_truncate_to_tokens(entity.comments, max(comment_budget, 0))
+        )
+        prompt_tokens = _prompt_tokens(prompt)
+    
+    if prompt_tokens > MAX_INPUT_TOKENS:
+        logger.error(
+            "   ❌ Prompt for %s is still %d tokens (max %d), skipping LLM assessment",
+            entity.entity_id, prompt_tokens, MAX_INPUT_TOKENS
+        )
+        return None
+    
+    logger.debug("   🤖 Calling LLM for threat assessment...")
     
     try:
         messages = [
@@ -372,7 +608,7 @@ def _assess_threat_with_llm(
         response = llm.invoke(messages)
         response_text = response.content
         
-        logger.info(f"   ✅ LLM response received ({len(response_text)} chars)")
+        logger.debug("   ✅ LLM response received (%d chars)", len(response_text))
         
         # Parse LLM response
         threat_level = None
@@ -404,7 +640,7 @@ def _assess_threat_with_llm(
         # Validate threat level
         valid_levels = ["critical", "high", "medium", "low", "none"]
         if threat_level not in valid_levels:
-            logger.warning(f"   ⚠️  Invalid threat level '{threat_level}', defaulting to 'medium'")
+            logger.warning("   ⚠️  Invalid threat level '%s', defaulting to 'medium'", threat_level)
             threat_level = "medium"
         
         # If no affected entities specified, use all nearby friendlies
@@ -412,7 +648,7 @@ def _assess_threat_with_llm(
             affected_entity_ids = [f.entity_id for f in nearby_friendlies]
         
         # Create threat assessment with proper timestamp
-        assessment_id = f"threat_{entity.entity_id}_{int(datetime.now(timezone.utc).timestamp())}"
+        assessment_id = _make_assessment_id(entity.entity_id, now, seq)
         
         threat_assessment = ThreatAssessment(
             assessment_id=assessment_id,
@@ -421,7 +657,7 @@ def _assess_threat_with_llm(
             threat_source_id=entity.entity_id,
             reasoning=reasoning,
             confidence=confidence,
-            timestamp=datetime.now(timezone.utc),
+            timestamp=now,
             distances_to_affected_km={
                 f.entity_id: _haversine_distance(
                     entity.location.lat, entity.location.lon,
@@ -523,6 +759,10 @@ def threat_evaluator_node(state: TIFDAState) -> Dict[str, Any]:
     threat_assessments = []
     assessment_errors = []
     
+    # One timestamp per batch; the counter keeps IDs unique within the same second
+    now = datetime.now(timezone.utc)
+    seq = itertools.count()
+    
     # Track assessment stats
     stats = {
         "rule_based": 0,
@@ -532,11 +772,11 @@ def threat_evaluator_node(state: TIFDAState) -> Dict[str, Any]:
     
     for entity in entities_to_assess:
         try:
-            logger.info(f"\n🔍 Assessing: {entity.entity_id} ({entity.entity_type}, {entity.classification})")
+            logger.debug("🔍 Assessing: %s (%s, %s)", entity.entity_id, entity.entity_type, entity.classification)
             
             # Find nearby friendlies
             nearby_friendlies = _find_nearby_friendlies(entity, cop_entities)
-            logger.info(f"   Nearby friendlies: {len(nearby_friendlies)}")
+            logger.debug("   Nearby friendlies: %d", len(nearby_friendlies))
             
             # Check for multimodal data
             multimodal_available = "multimodal_results" in entity.metadata
@@ -546,40 +786,57 @@ def threat_evaluator_node(state: TIFDAState) -> Dict[str, Any]:
                 entity=entity,
                 nearby_friendlies=nearby_friendlies,
                 llm=llm,
-                multimodal_available=multimodal_available
+                multimodal_available=multimodal_available,
+                now=now,
+                seq=seq
             )
             
             if threat_assessment is None:
-                logger.info(f"   ⏭️  No threat detected (skipped)")
+                logger.info("⏭️  %s: no threat detected (skipped)", entity.entity_id)
                 stats["skipped"] += 1
                 continue
             
             # Track stats
-            if "Rule-based assessment" in threat_assessment.reasoning:
+            if threat_assessment.reasoning.startswith(("Rule-based assessment", "Heuristic assessment")):
                 stats["rule_based"] += 1
             else:
                 stats["llm_based"] += 1
             
             threat_assessments.append(threat_assessment)
             
-            logger.info(f"   ✅ Threat level: {threat_assessment.threat_level.upper()}")
-            logger.info(f"   ✅ Confidence: {threat_assessment.confidence:.2f}")
-            logger.info(f"   ✅ Affected: {len(threat_assessment.affected_entities)} assets")
+            logger.info(
+                "✅ %s (%s, %s): %s, confidence %.2f, %d friendlies nearby, %d affected",
+                entity.entity_id, entity.entity_type, entity.classification,
+                threat_assessment.threat_level.upper(), threat_assessment.confidence,
+                len(nearby_friendlies), len(threat_assessment.affected_entities)
+            )
             
         except Exception as e:
-            logger.exception(f"   ❌ Error assessing {entity.entity_id}: {e}")
+            logger.exception("   ❌ Error assessing %s: %s", entity.entity_id, e)
             assessment_errors.append(f"{entity.entity_id}: {str(e)}")
             stats["skipped"] += 1
     
-    # ============ BUILD THREAT MATRIX ============
+    # ============ BUILD THREAT MATRIX, COUNTS AND PRIORITY LIST ============
     
-    threat_matrix = {}
+    # Single pass over the assessments feeds every derived structure below
+    threat_matrix = defaultdict(list)
+    threat_counts = Counter()
+    priority_threats = []
     
     for assessment in threat_assessments:
         for entity_id in assessment.affected_entities:
-            if entity_id not in threat_matrix:
-                threat_matrix[entity_id] = []
             threat_matrix[entity_id].append(assessment.assessment_id)
+        
+        threat_counts[assessment.threat_level] += 1
+        
+        if assessment.threat_level in ("critical", "high"):
+            priority_threats.append(assessment)
+    
+    threat_matrix = dict(threat_matrix)
+    
+    for level in ("critical", "high", "medium", "low", "none"):
+        threat_counts.setdefault(level, 0)
+    threat_counts = dict(threat_counts)
     
     # ============ RESULTS ============
     
@@ -596,15 +853,6 @@ def threat_evaluator_node(state: TIFDAState) -> Dict[str, Any]:
         rule_pct = (stats['rule_based'] / total_assessed) * 100
         logger.info(f"   Efficiency: {rule_pct:.0f}% rule-based (target: 70%)")
     
-    # Count by threat level
-    threat_counts = {
-        "critical": sum(1 for t in threat_assessments if t.threat_level == "critical"),
-        "high": sum(1 for t in threat_assessments if t.threat_level == "high"),
-        "medium": sum(1 for t in threat_assessments if t.threat_level == "medium"),
-        "low": sum(1 for t in threat_assessments if t.threat_level == "low"),
-        "none": sum(1 for t in threat_assessments if t.threat_level == "none")
-    }
-    
     logger.info(f"\n🎯 Threat Levels:")
     logger.info(f"   🔴 CRITICAL: {threat_counts['critical']}")
     logger.info(f"   🟠 HIGH: {threat_counts['high']}")
@@ -643,8 +891,6 @@ def threat_evaluator_node(state: TIFDAState) -> Dict[str, Any]:
     else:
         reasoning += "\n### Threat Details:\n\n"
         
-        priority_threats = [t for t in threat_assessments if t.threat_level in ["critical", "high"]]
-        
         for assessment in priority_threats:
             icon = "🔴" if assessment.threat_level == "critical" else "🟠"
             reasoning += f"{icon} **{assessment.threat_source_id}** - {assessment.threat_level.upper()}\n"
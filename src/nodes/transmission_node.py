@@ -7,28 +7,229 @@ Eleventh and FINAL node in TIFDA pipeline - REAL message transmission.
 ✅ PRODUCTION READY - Uses real paho-mqtt client
 """
 
+import asyncio
 import logging
-from typing import Dict, Any, List
+import os
+import time
+from logging.handlers import RotatingFileHandler
+from typing import Dict, Any, List, Optional, get_args
 from datetime import datetime, timezone
-import json
+from collections import UserString, defaultdict, deque
+from functools import lru_cache
 
+import orjson
 from langsmith import traceable
 
+from src.core.config import get_config, get_config_version
 from src.core.state import TIFDAState, log_decision, add_notification
-from src.integrations.mqtt_publisher import get_mqtt_publisher
+from src.integrations.mqtt_publisher import ResolvedRecipient, get_mqtt_publisher, resolve_recipient
+from src.models.dissemination import OutgoingMessage
 
 logger = logging.getLogger(__name__)
 
-@traceable(name="transmission_node")
+# LangSmith tracing wraps every call (span setup + state packing); skip the
+# wrapper entirely unless tracing is switched on
+TRACING_ENABLED = os.getenv(
+    "LANGSMITH_TRACING", os.getenv("LANGCHAIN_TRACING_V2", "false")
+).lower() == "true"
+_traceable = traceable if TRACING_ENABLED else (lambda **kwargs: (lambda func: func))
+
+# Default QoS per message priority (used when the recipient config sets none)
+QOS_MAP = {"critical": 2, "high": 1, "medium": 1, "low": 0}
+
+# Markdown reasoning is a human-readable artifact; batch/production
+# dissemination runs can skip it with TIFDA_REASONING=0, or defer it until
+# something actually reads it with TIFDA_REASONING=lazy
+# (TIFDA_EMIT_REASONING=false is accepted as an alias for TIFDA_REASONING=0)
+REASONING_MODE = os.getenv("TIFDA_REASONING", "1").lower()
+REASONING_ENABLED = (
+    REASONING_MODE != "0"
+    and os.getenv("TIFDA_EMIT_REASONING", "true").lower() == "true"
+)
+
+# format_type values OutgoingMessage accepts
+OUTGOING_FORMAT_TYPES = frozenset(get_args(OutgoingMessage.model_fields["format_type"].annotation))
+
+# Max log entries one run returns in state; older ones are spilled to
+# <audit_log_dir>/transmission_log_overflow.jsonl (0 = unbounded)
+TRANSMISSION_LOG_MAX = int(os.getenv("TIFDA_TRANSMISSION_LOG_MAX", "10000"))
+
+NODE_BANNER = "\n".join(("=" * 70, "TRANSMISSION NODE - MQTT (REAL)", "=" * 70))
+
+# Recipients detailed in the reasoning "Transmitted To" section
+REASONING_RECIPIENT_CAP = 50
+
+# Reasoning markdown templates
+REASONING_HEADER_TMPL = """## 📡 Transmission Complete (MQTT)
+
+**Sensor**: `{sensor_id}`
+**Messages**: {total}
+**Mode**: PRODUCTION (real MQTT)
+
+### Summary:
+- ✅ Success: {success} ({success_rate:.1%})
+- ❌ Failed: {failed}
+- 📊 Bytes: {total_bytes:,}
+
+"""
+
+REASONING_MQTT_STATS_TMPL = """### MQTT Stats:
+- Total published (lifetime): {total_published}
+- Total failed (lifetime): {total_failed}
+
+### Details:
+"""
+
+REASONING_NO_MESSAGES = "## ✅ No Messages to Transmit\n\nNo formatted messages."
+
+REASONING_FAILED_TMPL = "## ❌ Transmission Failed\n\n{}"
+
+REASONING_SUMMARY_TMPL = "📡 Transmitted {success}/{total} via MQTT ({failed} failed)"
+
+REASONING_FOOTER = "\n---\n\n## 🎉 TIFDA PIPELINE COMPLETE!\n\nIntelligence disseminated via MQTT! 🚀\n"
+
+
+_spill_logger: Optional[logging.Logger] = None
+
+
+def _get_spill_logger() -> logging.Logger:
+    """Get the JSON-lines logger evicted transmission log entries go to"""
+    global _spill_logger
+    
+    if _spill_logger is None:
+        spill_logger = logging.getLogger(f"{__name__}.overflow")
+        spill_logger.propagate = False
+        spill_logger.setLevel(logging.INFO)
+        
+        handler = RotatingFileHandler(
+            get_config().audit_log_dir / "transmission_log_overflow.jsonl",
+            maxBytes=10 * 1024 * 1024,
+            backupCount=3,
+            encoding="utf-8"
+        )
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        spill_logger.addHandler(handler)
+        
+        _spill_logger = spill_logger
+    
+    return _spill_logger
+
+
+def _append_log(transmission_log: deque, log_entry: Dict[str, Any]):
+    """Append to the bounded log, spilling the entry it evicts to disk"""
+    if len(transmission_log) == transmission_log.maxlen:
+        _get_spill_logger().info(orjson.dumps(transmission_log[0]).decode())
+    transmission_log.append(log_entry)
+
+
+@lru_cache(maxsize=1)
+def _build_recipient_configs(config_version: int) -> Dict[str, ResolvedRecipient]:
+    """
+    Resolve every configured recipient's topic and QoS (cached per config version).
+    
+    Args:
+        config_version: get_config_version() value the cache entry is valid for
+        
+    Returns:
+        Dict mapping recipient_id -> ResolvedRecipient
+    """
+    return {
+        rid: resolve_recipient(rid, {'connection_config': rc.connection_config})
+        for rid, rc in get_config().recipients.items()
+    }
+
+
+def _build_reasoning(
+    sensor_id: str,
+    transmission_stats: Dict[str, Any],
+    transmission_errors: List[str],
+    transmission_log: List[Dict[str, Any]],
+    publisher_stats: Dict[str, Any],
+    topics_by_recipient: Dict[str, Dict[str, int]],
+    recipients_truncated: int = 0
+) -> str:
+    """
+    Build the markdown transmission report shown to analysts.
+    
+    Args:
+        sensor_id: Originating sensor
+        transmission_stats: Totals for this run
+        transmission_errors: Error strings for failed messages
+        transmission_log: Log entries for this run
+        publisher_stats: Lifetime publisher statistics
+        topics_by_recipient: recipient -> {topic: successful message count}
+        recipients_truncated: Recipients left out of topics_by_recipient
+        
+    Returns:
+        Markdown reasoning string
+    """
+    parts = [REASONING_HEADER_TMPL.format(
+        sensor_id=sensor_id,
+        total=transmission_stats['total'],
+        success=transmission_stats['success'],
+        success_rate=transmission_stats['success_rate'],
+        failed=transmission_stats['failed'],
+        total_bytes=transmission_stats['total_bytes']
+    )]
+    
+    if transmission_errors:
+        parts.append(f"### Errors ({len(transmission_errors)}):\n")
+        parts.extend(f"- {error}\n" for error in transmission_errors[:3])
+        parts.append("\n")
+    
+    if topics_by_recipient:
+        parts.append("### Transmitted To:\n")
+        for recipient, topic_counts in topics_by_recipient.items():
+            parts.append(f"- **{recipient}**: {sum(topic_counts.values())} message(s)\n")
+            parts.append(f"  - Topics: {', '.join(f'`{t}`' for t in topic_counts)}\n")
+        if recipients_truncated:
+            parts.append(f"- … {recipients_truncated} more recipient(s) truncated\n")
+        parts.append("\n")
+    
+    parts.append(REASONING_MQTT_STATS_TMPL.format(
+        total_published=publisher_stats['total_published'],
+        total_failed=publisher_stats['total_failed']
+    ))
+    
+    for log_entry in transmission_log[:5]:
+        icon = "✅" if log_entry.get("success") else "❌"
+        parts.append(f"{icon} `{log_entry['message_id']}` → `{log_entry.get('topic', 'N/A')}`\n")
+    
+    if len(transmission_log) > 5:
+        parts.append(f"\n... and {len(transmission_log) - 5} more\n")
+    
+    parts.append(REASONING_FOOTER)
+    return "".join(parts)
+
+
+class _LazyReasoning(UserString):
+    """
+    Reasoning string rendered on first use.
+    
+    Behaves like a str for readers (slicing, 'in', formatting, str()), but
+    the markdown is only assembled if one of them actually touches it.
+    """
+    
+    def __init__(self, seq: Any = None, **ctx):
+        # UserString builds derived values via self.__class__(seq)
+        self._ctx = ctx
+        self._rendered = None if seq is None else str(seq)
+    
+    @property
+    def data(self) -> str:
+        if self._rendered is None:
+            self._rendered = _build_reasoning(**self._ctx)
+        return self._rendered
+
+
+@_traceable(name="transmission_node")
 def transmission_node(state: TIFDAState) -> Dict[str, Any]:
     """
     Transmission node - REAL MQTT dissemination.
     
     Publishes to: tifda/output/dissemination_reports/{recipient_id}
     """
-    logger.info("=" * 70)
-    logger.info("TRANSMISSION NODE - MQTT (REAL)")
-    logger.info("=" * 70)
+    logger.info(NODE_BANNER)
     
     formatted_messages = state.get("formatted_messages", [])
     sensor_metadata = state.get("sensor_metadata", {})
@@ -38,10 +239,10 @@ def transmission_node(state: TIFDAState) -> Dict[str, Any]:
         logger.info("✅ No messages to transmit")
         return {
             "transmission_log": [],
-            "decision_reasoning": "## ✅ No Messages to Transmit\n\nNo formatted messages."
+            "decision_reasoning": REASONING_NO_MESSAGES
         }
     
-    logger.info(f"📡 Transmitting {len(formatted_messages)} messages")
+    logger.info("📡 Transmitting %d messages", len(formatted_messages))
     
     # Get MQTT publisher
     try:
@@ -50,126 +251,181 @@ def transmission_node(state: TIFDAState) -> Dict[str, Any]:
         
         if not is_healthy:
             error_msg = f"MQTT publisher not healthy: {health_msg}"
-            logger.error(f"❌ {error_msg}")
+            logger.error("❌ %s", error_msg)
             return {
                 "transmission_log": [],
                 "error": error_msg,
-                "decision_reasoning": f"## ❌ Transmission Failed\n\n{error_msg}"
+                "decision_reasoning": REASONING_FAILED_TMPL.format(error_msg)
             }
         
-        logger.info(f"✅ MQTT ready: {health_msg}")
+        logger.info("✅ MQTT ready: %s", health_msg)
         
     except Exception as e:
         error_msg = f"Failed to get MQTT publisher: {e}"
-        logger.error(f"❌ {error_msg}")
+        logger.error("❌ %s", error_msg)
         return {
             "transmission_log": [],
             "error": error_msg,
-            "decision_reasoning": f"## ❌ Transmission Failed\n\n{error_msg}"
+            "decision_reasoning": REASONING_FAILED_TMPL.format(error_msg)
         }
     
-    # Get recipient configs
-    recipient_configs = {}
+    # Get recipient configs (rebuilt only when the config changes)
     try:
-        from src.core.config import get_config
-        config = get_config()
-        for rid, rc in config.recipients.items():
-            recipient_configs[rid] = {
-                'recipient_id': rc.recipient_id,
-                'recipient_type': rc.recipient_type,
-                'connection_config': rc.connection_config
-            }
+        recipient_configs = _build_recipient_configs(get_config_version())
     except Exception as e:
-        logger.warning(f"Could not load recipient configs: {e}")
+        logger.warning("Could not load recipient configs: %s", e)
+        recipient_configs = {}
+    
+    # Drop duplicates (same message_id) and empty-content messages before
+    # paying for serialization and publish
+    seen_ids = set()
+    recipient_ids = set()
+    messages_to_send = []
+    for formatted_message in formatted_messages:
+        message_id = formatted_message["message_id"]
+        if message_id in seen_ids or not formatted_message.get("content"):
+            continue
+        seen_ids.add(message_id)
+        recipient_ids.add(formatted_message["recipient_id"])
+        messages_to_send.append(formatted_message)
+    
+    deduped = len(formatted_messages) - len(messages_to_send)
+    if deduped:
+        logger.info("🧹 Skipped %d duplicate/empty message(s)", deduped)
     
     # Transmit messages
-    transmission_log = []
+    transmission_log = deque(maxlen=TRANSMISSION_LOG_MAX or None)
     transmission_errors = []
-    total_messages = len(formatted_messages)
+    total_messages = len(messages_to_send)
     successful_transmissions = 0
     failed_transmissions = 0
     total_bytes_transmitted = 0
     
-    for formatted_message in formatted_messages:
+    # One wall-clock timestamp for the whole batch; log entries carry a
+    # cheap monotonic offset from it instead of their own datetime
+    batch_ts = datetime.now(timezone.utc)
+    batch_ts_iso = batch_ts.isoformat()
+    mono_start = time.monotonic()
+    
+    # Common case: every message goes to one recipient (e.g. a sensor
+    # feeding a single command center), so its routing is looked up once
+    single_recipient = len(recipient_ids) == 1
+    if single_recipient:
+        only_config = recipient_configs.get(next(iter(recipient_ids)))
+    
+    # Build outgoing messages (publishes are queued together below)
+    outgoing = []
+    message_proto = OutgoingMessage(
+        message_id="",
+        decision_id="",
+        recipient_id="",
+        format_type="json",
+        content={},
+        timestamp=batch_ts
+    )
+    
+    for formatted_message in messages_to_send:
         message_id = formatted_message["message_id"]
         recipient_id = formatted_message["recipient_id"]
         priority = formatted_message["priority"]
         
-        logger.info(f"\n📤 Transmitting: {message_id}")
-        logger.info(f"   Recipient: {recipient_id}")
-        logger.info(f"   Priority: {priority}")
+        recipient_config = only_config if single_recipient else recipient_configs.get(recipient_id)
         
-        recipient_config = recipient_configs.get(recipient_id)
-        
-        # Determine topic
-        if recipient_config and 'connection_config' in recipient_config:
-            topic = recipient_config['connection_config'].get(
-                'mqtt_topic',
-                f"tifda/output/dissemination_reports/{recipient_id}"
-            )
-            qos = recipient_config['connection_config'].get('qos', 1)
-        else:
-            topic = f"tifda/output/dissemination_reports/{recipient_id}"
-            qos_map = {"critical": 2, "high": 1, "medium": 1, "low": 0}
-            qos = qos_map.get(priority, 1)
+        # Determine QoS (pre-resolved for configured recipients)
+        qos = recipient_config.qos if recipient_config else QOS_MAP.get(priority, 1)
         
         try:
-            # Create OutgoingMessage
-            from src.models.dissemination import OutgoingMessage
+            # Create OutgoingMessage from the batch prototype. model_copy
+            # skips validation, so check what the constructor would reject.
+            format_type = formatted_message["format"]
+            if format_type not in OUTGOING_FORMAT_TYPES:
+                raise ValueError(f"Unsupported format_type '{format_type}'")
+            if not isinstance(formatted_message["content"], dict):
+                raise ValueError("content must be a dict")
             
-            msg = OutgoingMessage(
-                message_id=message_id,
-                decision_id=formatted_message.get("decision_id", "unknown"),
-                recipient_id=recipient_id,
-                format_type=formatted_message["format"],
-                content=formatted_message["content"],
-                timestamp=datetime.now(timezone.utc)
-            )
-            
-            # Publish
-            result = mqtt_publisher.publish_message(msg, recipient_config)
-            
-            payload_size = len(json.dumps(formatted_message["content"]))
-            total_bytes_transmitted += payload_size
-            
-            log_entry = {
+            msg = message_proto.model_copy(update={
                 "message_id": message_id,
+                "decision_id": formatted_message.get("decision_id", "unknown"),
                 "recipient_id": recipient_id,
-                "topic": result.topic,
-                "format": formatted_message["format"],
-                "priority": priority,
-                "qos": qos,
-                "payload_size_bytes": payload_size,
-                "success": result.success,
-                "timestamp": result.timestamp.isoformat()
-            }
-            
-            if result.success:
-                logger.info(f"   ✅ Published to '{result.topic}'")
-                successful_transmissions += 1
-            else:
-                logger.error(f"   ❌ Failed: {result.error}")
-                failed_transmissions += 1
-                transmission_errors.append(f"{message_id}: {result.error}")
-                log_entry["error"] = result.error
+                "format_type": format_type,
+                "content": formatted_message["content"]
+            })
             
-            transmission_log.append(log_entry)
+            outgoing.append((formatted_message, qos, msg))
             
         except Exception as e:
-            logger.error(f"   ❌ Exception: {e}")
+            logger.error("   ❌ %s: %s", message_id, e)
             failed_transmissions += 1
             transmission_errors.append(f"{message_id}: {e}")
             
-            transmission_log.append({
+            _append_log(transmission_log, {
                 "message_id": message_id,
                 "recipient_id": recipient_id,
                 "success": False,
                 "error": str(e),
-                "timestamp": datetime.now(timezone.utc).isoformat()
+                "timestamp": batch_ts_iso,
+                "timestamp_offset_ms": int((time.monotonic() - mono_start) * 1000)
             })
     
-    # Stats
-    publisher_stats = mqtt_publisher.get_stats()
+    # Publish: all messages are pipelined, confirmations collected at the end
+    batch_result = mqtt_publisher.publish_batch(
+        [msg for _, _, msg in outgoing],
+        recipient_configs
+    )
+    
+    results = batch_result["results"]
+    
+    # Aggregate stats column-wise from the batch instead of per-entry counters
+    successful_transmissions += batch_result["successful"]
+    failed_transmissions += batch_result["failed"]
+    total_bytes_transmitted = sum(r.payload_size_bytes for r in results)
+    
+    # recipient -> {topic: message count}, grouped while logging; only the
+    # first REASONING_RECIPIENT_CAP recipients are detailed in the reasoning
+    topics_by_recipient = {}
+    truncated_recipients = set()
+    
+    for (formatted_message, qos, msg), result in zip(outgoing, results):
+        log_entry = {
+            "message_id": msg.message_id,
+            "recipient_id": msg.recipient_id,
+            "topic": result.topic,
+            "format": formatted_message["format"],
+            "priority": formatted_message["priority"],
+            "qos": qos,
+            "payload_size_bytes": result.payload_size_bytes,
+            "success": result.success,
+            "batch_id": result.batch_id,
+            "timestamp": batch_ts_iso,
+            "timestamp_offset_ms": int((result.confirmed_at - mono_start) * 1000)
+        }
+        
+        # One summary line per message (lazy %-formatting)
+        if result.success:
+            topic_counts = topics_by_recipient.get(msg.recipient_id)
+            if topic_counts is None:
+                if len(topics_by_recipient) < REASONING_RECIPIENT_CAP:
+                    topic_counts = topics_by_recipient[msg.recipient_id] = defaultdict(int)
+                else:
+                    truncated_recipients.add(msg.recipient_id)
+            if topic_counts is not None:
+                topic_counts[result.topic] += 1
+            logger.info(
+                "   ✅ %s → %s [%s, qos=%d] '%s'",
+                msg.message_id, msg.recipient_id, formatted_message["priority"], qos, result.topic
+            )
+        else:
+            logger.error(
+                "   ❌ %s → %s [%s]: %s",
+                msg.message_id, msg.recipient_id, formatted_message["priority"], result.error
+            )
+            transmission_errors.append(f"{msg.message_id}: {result.error}")
+            log_entry["error"] = result.error
+        
+        _append_log(transmission_log, log_entry)
+    
+    # State reducer concatenates lists
+    transmission_log = list(transmission_log)
     
     # Results
     transmission_stats = {
@@ -177,64 +433,41 @@ def transmission_node(state: TIFDAState) -> Dict[str, Any]:
         "success": successful_transmissions,
         "failed": failed_transmissions,
         "success_rate": successful_transmissions / total_messages if total_messages > 0 else 0,
-        "total_bytes": total_bytes_transmitted
+        "total_bytes": total_bytes_transmitted,
+        "deduped": deduped
     }
     
-    logger.info(f"\n📊 Transmission complete:")
-    logger.info(f"   ✅ Success: {successful_transmissions}/{total_messages}")
-    logger.info(f"   ❌ Failed: {failed_transmissions}")
-    
-    # Build reasoning
-    reasoning = f"""## 📡 Transmission Complete (MQTT)
-
-**Sensor**: `{sensor_id}`
-**Messages**: {total_messages}
-**Mode**: PRODUCTION (real MQTT)
-
-### Summary:
-- ✅ Success: {successful_transmissions} ({transmission_stats['success_rate']:.1%})
-- ❌ Failed: {failed_transmissions}
-- 📊 Bytes: {total_bytes_transmitted:,}
-
-"""
-    
-    if transmission_errors:
-        reasoning += f"### Errors ({len(transmission_errors)}):\n"
-        for error in transmission_errors[:3]:
-            reasoning += f"- {error}\n"
-        reasoning += "\n"
-    
-    messages_by_recipient = {}
-    for log_entry in transmission_log:
-        if log_entry.get("success"):
-            recipient = log_entry["recipient_id"]
-            if recipient not in messages_by_recipient:
-                messages_by_recipient[recipient] = []
-            messages_by_recipient[recipient].append(log_entry)
-    
-    if messages_by_recipient:
-        reasoning += "### Transmitted To:\n"
-        for recipient, logs in messages_by_recipient.items():
-            topics = list(set([log["topic"] for log in logs]))
-            reasoning += f"- **{recipient}**: {len(logs)} message(s)\n"
-            reasoning += f"  - Topics: {', '.join([f'`{t}`' for t in topics])}\n"
-        reasoning += "\n"
-    
-    reasoning += f"""### MQTT Stats:
-- Total published (lifetime): {publisher_stats['total_published']}
-- Total failed (lifetime): {publisher_stats['total_failed']}
-
-### Details:
-"""
-    
-    for log_entry in transmission_log[:5]:
-        icon = "✅" if log_entry.get("success") else "❌"
-        reasoning += f"{icon} `{log_entry['message_id']}` → `{log_entry.get('topic', 'N/A')}`\n"
-    
-    if len(transmission_log) > 5:
-        reasoning += f"\n... and {len(transmission_log) - 5} more\n"
+    logger.info(
+        "\n📊 Transmission complete:\n   ✅ Success: %d/%d\n   ❌ Failed: %d",
+        successful_transmissions, total_messages, failed_transmissions
+    )
     
-    reasoning += "\n---\n\n## 🎉 TIFDA PIPELINE COMPLETE!\n\nIntelligence disseminated via MQTT! 🚀\n"
+    # Build reasoning (skipped entirely when no consumer needs it)
+    if REASONING_ENABLED and REASONING_MODE == "lazy":
+        reasoning = _LazyReasoning(
+            sensor_id=sensor_id,
+            transmission_stats=transmission_stats,
+            transmission_errors=transmission_errors,
+            transmission_log=transmission_log,
+            publisher_stats=mqtt_publisher.get_stats(),
+            topics_by_recipient=topics_by_recipient,
+            recipients_truncated=len(truncated_recipients)
+        )
+    elif REASONING_ENABLED:
+        reasoning = _build_reasoning(
+            sensor_id,
+            transmission_stats,
+            transmission_errors,
+            transmission_log,
+            mqtt_publisher.get_stats(),
+            topics_by_recipient,
+            len(truncated_recipients)
+        )
+    else:
+        # One-line summary instead of the full markdown report
+        reasoning = REASONING_SUMMARY_TMPL.format(
+            success=successful_transmissions, total=total_messages, failed=failed_transmissions
+        )
     
     # Update state
     log_decision(
@@ -249,6 +482,7 @@ def transmission_node(state: TIFDAState) -> Dict[str, Any]:
             "failed": failed_transmissions,
             "success_rate": transmission_stats['success_rate'],
             "total_bytes": total_bytes_transmitted,
+            "deduped": deduped,
             "transmission_mode": "mqtt"
         }
     )
@@ -261,7 +495,7 @@ def transmission_node(state: TIFDAState) -> Dict[str, Any]:
     
     add_notification(state, "🎉 TIFDA pipeline complete!")
     
-    logger.info(f"\n✅ TRANSMISSION COMPLETE - Success: {successful_transmissions}/{total_messages}\n")
+    logger.info("\n✅ TRANSMISSION COMPLETE - Success: %d/%d\n", successful_transmissions, total_messages)
     
     return {
         "transmission_log": transmission_log,
@@ -269,6 +503,24 @@ def transmission_node(state: TIFDAState) -> Dict[str, Any]:
     }
 
 
+async def transmission_node_async(state: TIFDAState) -> Dict[str, Any]:
+    """
+    Async variant of transmission_node for graphs run with ainvoke/astream.
+    
+    Publishing is already pipelined (many QoS 1/2 publishes in flight per
+    connection, acks collected by callback), so the blocking part is only
+    the confirmation wait; it runs in a worker thread to keep the event
+    loop free.
+    
+    Args:
+        state: Current TIFDA state
+        
+    Returns:
+        Same state update as transmission_node
+    """
+    return await asyncio.to_thread(transmission_node, state)
+
+
 # ==================== TESTING ====================
 
 def test_transmission_node():
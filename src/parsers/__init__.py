@@ -5,7 +5,7 @@ TIFDA Parsers
 Format-specific parsers for converting sensor data into EntityCOP objects.
 """
 
-from src.parsers.base_parser import BaseParser
+from src.parsers.base_parser import BaseParser, ParserValidationError
 from src.parsers.asterix_parser import ASTERIXParser
 from src.parsers.drone_parser import DroneParser
 from src.parsers.radio_parser import RadioParser
@@ -14,6 +14,7 @@ from src.parsers.parser_factory import ParserFactory, get_parser_factory
 
 __all__ = [
     "BaseParser",
+    "ParserValidationError",
     "ASTERIXParser",
     "DroneParser",
     "RadioParser",
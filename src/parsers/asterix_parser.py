@@ -6,11 +6,45 @@ Parser for ASTERIX radar format (simplified JSON representation).
 ASTERIX is the standard for radar data exchange in European airspace.
 """
 
-from typing import List, Dict, Any
+import sys
+from typing import List, Dict, Any, Iterator
 from datetime import datetime, timezone
 
 from src.models import EntityCOP, Location, SensorMessage
-from src.parsers.base_parser import BaseParser
+from src.parsers.base_parser import BaseParser, ParserValidationError, intern_value
+
+
+# Fields every track must carry
+_REQUIRED_TRACK_FIELDS = ("track_id", "location", "speed_kmh")
+
+# Valid IFF classifications mapped to one canonical string each, so entities
+# share those objects instead of each keeping the copy decoded from its message
+# (anything else is reported as "unknown")
+_IFF_CANONICAL = {v: v for v in ("friendly", "hostile", "neutral", "unknown")}
+
+
+def _canonical_iff(value: Any) -> str:
+    """Canonical IFF string for value ("unknown" for anything else, including non-strings)"""
+    return _IFF_CANONICAL.get(value, "unknown") if isinstance(value, str) else "unknown"
+
+
+# Confidence for common plot counts: min(0.5 + plot_count * 0.1, 0.95)
+_CONF_TABLE = {n: min(0.5 + (n * 0.1), 0.95) for n in range(16)}
+
+# Marks an absent optional track field (distinct from an explicit None)
+_MISSING = object()
+
+# Optional vectorized path for large frames - numpy is not a hard
+# dependency, the per-track loop is used when it is not installed
+try:
+    import numpy as np
+    from src.parsers._asterix_kernels import ENTITY_TYPES, compute_conf_and_type
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Below this many tracks the per-track loop beats the array setup cost
+BATCH_MIN_TRACKS = 16
 
 
 class ASTERIXParser(BaseParser):
@@ -20,6 +54,9 @@ class ASTERIXParser(BaseParser):
     Handles radar track data in JSON format representing ASTERIX messages.
     """
     
+    sensor_type = "radar"
+    fused_validation = True  # parse() validates tracks in the same pass
+    
     def can_parse(self, sensor_msg: SensorMessage) -> bool:
         """Check if message is ASTERIX format"""
         # Check sensor type
@@ -47,110 +84,336 @@ class ASTERIXParser(BaseParser):
         
         # Validate each track
         for i, track in enumerate(data["tracks"]):
-            if not isinstance(track, dict):
-                return False, f"Track {i} must be an object"
-            
-            # Required fields
-            required = ["track_id", "location", "speed_kmh"]
-            missing = [field for field in required if field not in track]
-            if missing:
-                return False, f"Track {i} missing required fields: {missing}"
-            
-            # Validate location
-            location = track.get("location")
-            if not isinstance(location, dict):
-                return False, f"Track {i} location must be an object"
-            
-            if "lat" not in location or "lon" not in location:
-                return False, f"Track {i} location must have 'lat' and 'lon'"
+            error = self._track_error(i, track)
+            if error:
+                return False, error
         
         return True, ""
     
+    @staticmethod
+    def _track_error(i: int, track: Any) -> str:
+        """
+        Describe what is structurally wrong with a track.
+        
+        Args:
+            i: Track index within the message
+            track: Raw track data
+            
+        Returns:
+            Error message, or empty string if the track is valid
+        """
+        if not isinstance(track, dict):
+            return f"Track {i} must be an object"
+        
+        # Required fields
+        missing = [field for field in _REQUIRED_TRACK_FIELDS if field not in track]
+        if missing:
+            return f"Track {i} missing required fields: {missing}"
+        
+        # Validate location
+        location = track.get("location")
+        if not isinstance(location, dict):
+            return f"Track {i} location must be an object"
+        
+        if "lat" not in location or "lon" not in location:
+            return f"Track {i} location must have 'lat' and 'lon'"
+        
+        return ""
+    
     def parse(self, sensor_msg: SensorMessage) -> List[EntityCOP]:
-        """Parse ASTERIX tracks into EntityCOP objects"""
+        """
+        Parse ASTERIX tracks into EntityCOP objects.
+        
+        Validates each track in the same pass (see fused_validation).
+        
+        Raises:
+            ParserValidationError: If the message or a track is malformed
+        """
+        tracks, system_id, is_simulated, base_classification = self._read_frame(sensor_msg)
+        
+        if NUMPY_AVAILABLE and len(tracks) >= BATCH_MIN_TRACKS:
+            return self._parse_batch(
+                tracks, sensor_msg, system_id, is_simulated, base_classification
+            )
+        
+        return list(self._iter_tracks(
+            sensor_msg, tracks, system_id, is_simulated, base_classification
+        ))
+    
+    def parse_iter(self, sensor_msg: SensorMessage) -> Iterator[EntityCOP]:
+        """
+        Parse ASTERIX tracks lazily, one EntityCOP at a time.
+        
+        For very large frames: consumers that handle entities incrementally
+        keep only the ones in flight alive instead of the whole list.
+        Frame-level problems raise immediately; a malformed track raises
+        when the iteration reaches it.
+        
+        Args:
+            sensor_msg: Sensor message to parse
+            
+        Returns:
+            Iterator of EntityCOP objects, in track order
+            
+        Raises:
+            ParserValidationError: If the message or a track is malformed
+        """
+        return self._iter_tracks(sensor_msg, *self._read_frame(sensor_msg))
+    
+    def _read_frame(self, sensor_msg: SensorMessage) -> tuple[List[Any], Any, bool, str]:
+        """
+        Check the frame structure and read system-level metadata.
+        
+        Args:
+            sensor_msg: Sensor message to parse
+            
+        Returns:
+            (tracks, system_id, is_simulated, base_classification)
+            
+        Raises:
+            ParserValidationError: If 'tracks' is missing or not an array
+        """
         data = sensor_msg.data
-        entities = []
         
-        # Get system-level metadata
+        if "tracks" not in data:
+            raise ParserValidationError("Missing 'tracks' array")
+        tracks = data["tracks"]
+        if not isinstance(tracks, list):
+            raise ParserValidationError("'tracks' must be an array")
+        
+        # Get system-level metadata (interned: it is repeated in every
+        # entity's metadata and stays alive as long as the COP holds them)
         system_id = data.get("system_id", sensor_msg.sensor_id)
+        if isinstance(system_id, str):
+            system_id = sys.intern(system_id)
         is_simulated = data.get("is_simulated", False)
         
         # Determine base classification for radar data
         # Radar data is typically SECRET or CONFIDENTIAL
-        base_classification = data.get("classification_level", "SECRET")
+        base_classification = intern_value(data.get("classification_level", "SECRET"))
+        
+        return tracks, system_id, is_simulated, base_classification
+    
+    def _iter_tracks(
+        self,
+        sensor_msg: SensorMessage,
+        tracks: List[Any],
+        system_id: Any,
+        is_simulated: bool,
+        base_classification: str
+    ) -> Iterator[EntityCOP]:
+        """Per-track parse loop (scalar path), yielding one entity per track"""
+        # Bind hot lookups to locals once for the track loop
+        sensor_id = sys.intern(sensor_msg.sensor_id)
+        timestamp = sensor_msg.timestamp
+        make_entity = EntityCOP  # bypasses BaseParser._create_entity (one call frame less per track)
+        make_location = Location
+        source_sensors = (sensor_id,)  # validated into a fresh list per entity
+        conf_for_plots = _CONF_TABLE.get
+        iff_canonical = _canonical_iff
         
-        for track in data["tracks"]:
+        for i, track in enumerate(tracks):
+            # Pull required fields; a structural problem becomes a validation error
+            try:
+                track_id = track["track_id"]
+                loc_data = track["location"]
+                lat = loc_data["lat"]
+                lon = loc_data["lon"]
+                speed_kmh = track["speed_kmh"]
+            except (KeyError, TypeError, IndexError):
+                raise ParserValidationError(
+                    self._track_error(i, track) or f"Track {i} is malformed"
+                ) from None
+            
+            track_get = track.get
+            altitude = track_get("altitude_m")
+            heading = track_get("heading")
+            
             # Build entity ID
-            track_id = track["track_id"]
-            entity_id = f"{sensor_msg.sensor_id}_{track_id}"
+            entity_id = f"{sensor_id}_{track_id}"
             
             # Parse location
-            loc_data = track["location"]
-            location = Location(
-                lat=loc_data["lat"],
-                lon=loc_data["lon"],
-                alt=track.get("altitude_m")
-            )
+            location = make_location(lat=lat, lon=lon, alt=altitude)
             
             # Determine entity type (radar detects air targets)
             entity_type = "aircraft"  # Default for radar
-            if track.get("altitude_m", 0) < 100:
+            if (altitude if "altitude_m" in track else 0) < 100:
                 entity_type = "ground_vehicle"  # Low altitude might be ground
             
             # Parse IFF classification
-            iff_classification = track.get("classification", "unknown")
-            if iff_classification not in ["friendly", "hostile", "neutral", "unknown"]:
-                iff_classification = "unknown"
+            iff_classification = iff_canonical(track_get("classification", "unknown"))
             
             # Build metadata
             metadata = {
                 "track_id": track_id,
                 "system_id": system_id,
                 "is_simulated": is_simulated,
-                "altitude_m": track.get("altitude_m"),
-                "speed_kmh": track["speed_kmh"],
-                "heading": track.get("heading"),
+                "altitude_m": altitude,
+                "speed_kmh": speed_kmh,
+                "heading": heading,
                 "sensor_type": "radar"
             }
             
-            # Add quality data if available
-            if "quality" in track:
-                quality = track["quality"]
+            # Add quality data if available (the metadata literal has spare
+            # slots, so adding this key does not resize the dict)
+            ssr_code = None
+            quality = track_get("quality", _MISSING)
+            if quality is not _MISSING:
+                quality_get = quality.get
+                ssr_code = quality_get("ssr_code")
+                plot_count = quality_get("plot_count")
                 metadata["quality"] = {
-                    "accuracy_m": quality.get("accuracy_m"),
-                    "plot_count": quality.get("plot_count"),
-                    "ssr_code": quality.get("ssr_code")
+                    "accuracy_m": quality_get("accuracy_m"),
+                    "plot_count": plot_count,
+                    "ssr_code": ssr_code
                 }
                 
-                # Higher plot count = higher confidence
-                plot_count = quality.get("plot_count", 1)
-                confidence = min(0.5 + (plot_count * 0.1), 0.95)
+                # Higher plot count = higher confidence (absent = single plot)
+                if plot_count is None and "plot_count" not in quality:
+                    plot_count = 1
+                confidence = conf_for_plots(plot_count)
+                if confidence is None:
+                    confidence = min(0.5 + (plot_count * 0.1), 0.95)
             else:
                 confidence = 0.8  # Default radar confidence
             
             # Determine information classification
             # If SSR code present (transponder), might be friendlier data
-            if metadata.get("quality", {}).get("ssr_code"):
-                info_classification = "CONFIDENTIAL"
-            else:
-                info_classification = base_classification
+            info_classification = "CONFIDENTIAL" if ssr_code else base_classification
             
             # Create entity
-            entity = self._create_entity(
+            yield make_entity(
                 entity_id=entity_id,
                 entity_type=entity_type,
                 location=location,
-                timestamp=sensor_msg.timestamp,
-                sensor_msg=sensor_msg,
+                timestamp=timestamp,
                 classification=iff_classification,
                 information_classification=info_classification,
                 confidence=confidence,
+                source_sensors=source_sensors,
                 metadata=metadata,
-                speed_kmh=track["speed_kmh"],
-                heading=track.get("heading"),
+                speed_kmh=speed_kmh,
+                heading=heading,
                 comments=f"Radar track {track_id} from {system_id}"
             )
+    
+    def _parse_batch(
+        self,
+        tracks: List[Any],
+        sensor_msg: SensorMessage,
+        system_id: str,
+        is_simulated: bool,
+        base_classification: str
+    ) -> List[EntityCOP]:
+        """
+        Parse a large track list with the numeric logic vectorized.
+        
+        One pass pulls (and validates) the per-track fields into parallel
+        columns; entity type and confidence are then computed with NumPy
+        over the whole frame. Produces the same entities as the per-track loop.
+        
+        Args:
+            tracks: Raw track list from the message
+            sensor_msg: Source sensor message
+            system_id: Radar system identifier
+            is_simulated: Whether the frame is simulated
+            base_classification: Information classification without SSR code
+            
+        Returns:
+            List of EntityCOP objects, in track order
+        """
+        n = len(tracks)
+        track_ids, lats, lons, speeds, altitudes, headings = [], [], [], [], [], []
+        iffs, qualities, type_alts, plot_counts, has_quality = [], [], [], [], []
+        
+        for i, track in enumerate(tracks):
+            try:
+                track_ids.append(track["track_id"])
+                loc_data = track["location"]
+                lats.append(loc_data["lat"])
+                lons.append(loc_data["lon"])
+                speeds.append(track["speed_kmh"])
+            except (KeyError, TypeError, IndexError):
+                raise ParserValidationError(
+                    self._track_error(i, track) or f"Track {i} is malformed"
+                ) from None
             
-            entities.append(entity)
+            track_get = track.get
+            altitude = track_get("altitude_m")
+            altitudes.append(altitude)
+            type_alts.append(altitude if "altitude_m" in track else 0)
+            headings.append(track_get("heading"))
+            iffs.append(track_get("classification", "unknown"))
+            
+            if "quality" in track:
+                quality = track["quality"]
+                qualities.append(quality)
+                plot_counts.append(quality.get("plot_count", 1))
+                has_quality.append(True)
+            else:
+                qualities.append(None)
+                plot_counts.append(1)
+                has_quality.append(False)
+        
+        # Vectorized numeric logic over the whole frame (numba-compiled if available)
+        confidences, type_idx = compute_conf_and_type(
+            np.fromiter(type_alts, dtype=np.float64, count=n),
+            np.fromiter(plot_counts, dtype=np.float64, count=n),
+            np.fromiter(has_quality, dtype=bool, count=n)
+        )
+        confidences = confidences.tolist()
+        entity_types = [ENTITY_TYPES[t] for t in type_idx.tolist()]
+        
+        sensor_id = sys.intern(sensor_msg.sensor_id)
+        timestamp = sensor_msg.timestamp
+        make_entity = EntityCOP  # bypasses BaseParser._create_entity (one call frame less per track)
+        make_location = Location
+        source_sensors = (sensor_id,)  # validated into a fresh list per entity
+        iff_canonical = _canonical_iff
+        entities = []
+        append = entities.append
+        
+        for i in range(n):
+            track_id = track_ids[i]
+            altitude = altitudes[i]
+            heading = headings[i]
+            speed_kmh = speeds[i]
+            
+            iff_classification = iff_canonical(iffs[i])
+            
+            metadata = {
+                "track_id": track_id,
+                "system_id": system_id,
+                "is_simulated": is_simulated,
+                "altitude_m": altitude,
+                "speed_kmh": speed_kmh,
+                "heading": heading,
+                "sensor_type": "radar"
+            }
+            
+            ssr_code = None
+            quality = qualities[i]
+            if has_quality[i]:
+                ssr_code = quality.get("ssr_code")
+                metadata["quality"] = {
+                    "accuracy_m": quality.get("accuracy_m"),
+                    "plot_count": quality.get("plot_count"),
+                    "ssr_code": ssr_code
+                }
+            
+            append(make_entity(
+                entity_id=f"{sensor_id}_{track_id}",
+                entity_type=entity_types[i],
+                location=make_location(lat=lats[i], lon=lons[i], alt=altitude),
+                timestamp=timestamp,
+                classification=iff_classification,
+                information_classification="CONFIDENTIAL" if ssr_code else base_classification,
+                confidence=confidences[i],
+                source_sensors=source_sensors,
+                metadata=metadata,
+                speed_kmh=speed_kmh,
+                heading=heading,
+                comments=f"Radar track {track_id} from {system_id}"
+            ))
         
-        return entities
\ No newline at end of file
+        return entities
@@ -5,6 +5,7 @@ Base Parser
 Abstract base class for all format-specific parsers.
 """
 
+import sys
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timezone
@@ -12,6 +13,28 @@ from datetime import datetime, timezone
 from src.models import EntityCOP, Location, SensorMessage
 
 
+def intern_value(value: Any) -> Any:
+    """
+    Intern a categorical string decoded from a message.
+    
+    Values like classification levels or priorities repeat across every
+    entity kept in the COP; interning makes them share one string object
+    (and compare by identity first). Non-strings are returned unchanged.
+    
+    Args:
+        value: Raw field value
+        
+    Returns:
+        Interned string, or the value itself if it is not a str
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+class ParserValidationError(ValueError):
+    """Raised by parsers with fused validation when the message structure is invalid"""
+    pass
+
+
 class BaseParser(ABC):
     """
     Abstract base for all sensor format parsers.
@@ -20,6 +43,14 @@ class BaseParser(ABC):
     into standardized EntityCOP objects for the Common Operational Picture.
     """
     
+    # sensor_type this parser handles (None = checked via can_parse only);
+    # ParserFactory dispatches on it instead of scanning every parser
+    sensor_type: Optional[str] = None
+    
+    # True if parse() performs validation itself (raising ParserValidationError),
+    # so ParserFactory can skip the separate validate() pass
+    fused_validation: bool = False
+    
     @abstractmethod
     def can_parse(self, sensor_msg: SensorMessage) -> bool:
         """
@@ -134,7 +165,7 @@ class BaseParser(ABC):
             classification=classification,
             information_classification=information_classification,
             confidence=confidence,
-            source_sensors=[sensor_msg.sensor_id],
+            source_sensors=[sys.intern(sensor_msg.sensor_id)],  # shared across entities
             metadata=metadata or {},
             speed_kmh=speed_kmh,
             heading=heading,
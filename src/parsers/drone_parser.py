@@ -9,7 +9,12 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime, timezone
 
 from src.models import EntityCOP, Location, SensorMessage
-from src.parsers.base_parser import BaseParser
+from src.parsers.base_parser import BaseParser, intern_value
+
+
+# Accepted position keys (either spelling)
+_LAT_KEYS = frozenset(("latitude", "lat"))
+_LON_KEYS = frozenset(("longitude", "lon"))
 
 
 class DroneParser(BaseParser):
@@ -19,6 +24,8 @@ class DroneParser(BaseParser):
     Handles drone telemetry, imagery, and visual intelligence.
     """
     
+    sensor_type = "drone"
+    
     def can_parse(self, sensor_msg: SensorMessage) -> bool:
         """Check if message is drone format"""
         if sensor_msg.sensor_type != "drone":
@@ -27,11 +34,10 @@ class DroneParser(BaseParser):
         data = sensor_msg.data
         
         # Drone data must have position
-        return (
-            isinstance(data, dict) and
-            ("latitude" in data or "lat" in data) and
-            ("longitude" in data or "lon" in data)
-        )
+        if not isinstance(data, dict):
+            return False
+        keys = data.keys()
+        return not (keys.isdisjoint(_LAT_KEYS) or keys.isdisjoint(_LON_KEYS))
     
     def validate(self, sensor_msg: SensorMessage) -> tuple[bool, str]:
         """Validate drone message structure"""
@@ -53,13 +59,15 @@ class DroneParser(BaseParser):
     def parse(self, sensor_msg: SensorMessage) -> List[EntityCOP]:
         """Parse drone data into EntityCOP objects"""
         data = sensor_msg.data
+        get = data.get
+        sensor_id = sensor_msg.sensor_id
         entities = []
         
         # Get drone position
-        lat = data.get("latitude") or data.get("lat")
-        lon = data.get("longitude") or data.get("lon")
-        alt_agl = data.get("altitude_m_agl")
-        alt_msl = data.get("altitude_m_msl")
+        lat = get("latitude") or get("lat")
+        lon = get("longitude") or get("lon")
+        alt_agl = get("altitude_m_agl")
+        alt_msl = get("altitude_m_msl")
         
         # Use MSL if available, otherwise AGL
         altitude = alt_msl if alt_msl is not None else alt_agl
@@ -67,25 +75,30 @@ class DroneParser(BaseParser):
         location = Location(lat=lat, lon=lon, alt=altitude)
         
         # Drone entity (the drone itself)
-        drone_id = data.get("drone_id", f"{sensor_msg.sensor_id}_platform")
+        drone_id = get("drone_id", f"{sensor_id}_platform")
+        
+        heading = get("heading")
+        ground_speed_kmh = get("ground_speed_kmh")
         
         # Metadata
         metadata = {
             "drone_id": drone_id,
-            "flight_mode": data.get("flight_mode"),
+            "flight_mode": intern_value(get("flight_mode")),
             "altitude_m_agl": alt_agl,
             "altitude_m_msl": alt_msl,
-            "heading": data.get("heading"),
-            "ground_speed_kmh": data.get("ground_speed_kmh"),
-            "battery_percent": data.get("battery_percent"),
-            "camera_heading": data.get("camera_heading"),
+            "heading": heading,
+            "ground_speed_kmh": ground_speed_kmh,
+            "battery_percent": get("battery_percent"),
+            "camera_heading": get("camera_heading"),
             "sensor_type": "drone"
         }
         
-        # Check if there's an image
-        has_image = bool(data.get("image_link") or data.get("image_path"))
-        if has_image:
-            metadata["image_link"] = data.get("image_link") or data.get("image_path")
+        # Check if there's an image (added only when present, so the metadata
+        # shape is unchanged; the literal above is presized with spare slots,
+        # so this insert does not resize the dict)
+        image_link = get("image_link") or get("image_path")
+        if image_link:
+            metadata["image_link"] = image_link
         
         # Drone classification (always friendly - it's our drone)
         # Information classification: drone position is typically CONFIDENTIAL
@@ -99,8 +112,8 @@ class DroneParser(BaseParser):
             information_classification="CONFIDENTIAL",  # Drone positions are sensitive
             confidence=0.95,  # High confidence in own drone telemetry
             metadata=metadata,
-            speed_kmh=data.get("ground_speed_kmh"),
-            heading=data.get("heading"),
+            speed_kmh=ground_speed_kmh,
+            heading=heading,
             comments=f"UAV {drone_id} telemetry"
         )
         
@@ -9,7 +9,29 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime, timezone
 
 from src.models import EntityCOP, Location, SensorMessage
-from src.parsers.base_parser import BaseParser
+from src.parsers.base_parser import BaseParser, intern_value
+
+
+# Accepted report priorities (list kept for the error message, set for lookups)
+PRIORITY_LEVELS = ["low", "medium", "high", "critical"]
+_VALID_PRIORITIES = frozenset(PRIORITY_LEVELS)
+
+# Priority -> default information classification (unlisted: RESTRICTED)
+_PRIORITY_TO_CLASSIFICATION = {
+    "critical": "SECRET",
+    "high": "CONFIDENTIAL",
+    "medium": "RESTRICTED",
+    "low": "RESTRICTED",
+}
+
+# Priority -> confidence; high priority reports from known operators
+# have higher confidence (unlisted: 0.7)
+_PRIORITY_TO_CONFIDENCE = {
+    "critical": 0.85,
+    "high": 0.85,
+    "medium": 0.7,
+    "low": 0.7,
+}
 
 
 class ManualParser(BaseParser):
@@ -19,6 +41,8 @@ class ManualParser(BaseParser):
     Handles SITREP, SPOTREP, SALUTE, and other military report formats.
     """
     
+    sensor_type = "manual"
+    
     def can_parse(self, sensor_msg: SensorMessage) -> bool:
         """Check if message is manual report format"""
         if sensor_msg.sensor_type != "manual":
@@ -44,9 +68,9 @@ class ManualParser(BaseParser):
             return False, f"Missing required fields: {missing}"
         
         # Validate priority
-        valid_priorities = ["low", "medium", "high", "critical"]
-        if data.get("priority") not in valid_priorities:
-            return False, f"Invalid priority. Must be one of: {valid_priorities}"
+        priority = data.get("priority")
+        if not isinstance(priority, str) or priority not in _VALID_PRIORITIES:
+            return False, f"Invalid priority. Must be one of: {PRIORITY_LEVELS}"
         
         return True, ""
     
@@ -72,38 +96,34 @@ class ManualParser(BaseParser):
             # For now, skip if no location
             return entities
         
+        # Read each report field once
+        sensor_id = sensor_msg.sensor_id
+        priority = intern_value(data["priority"])
+        operator_name = data["operator_name"]
+        content = data["content"]
+        
         # Build entity ID
-        report_id = data.get("report_id", f"{sensor_msg.sensor_id}_report")
-        entity_id = f"{sensor_msg.sensor_id}_{report_id}"
+        report_id = data.get("report_id", f"{sensor_id}_report")
+        entity_id = f"{sensor_id}_{report_id}"
         
         # Metadata
         metadata = {
             "report_id": report_id,
-            "report_type": data.get("report_type", "OTHER"),
-            "priority": data["priority"],
-            "operator_name": data["operator_name"],
-            "content": data["content"],
+            "report_type": intern_value(data.get("report_type", "OTHER")),
+            "priority": priority,
+            "operator_name": operator_name,
+            "content": content,
             "sensor_type": "manual"
         }
         
-        # Determine classification based on priority and report type
-        priority = data["priority"]
-        if priority == "critical":
-            info_classification = "SECRET"
-        elif priority == "high":
-            info_classification = "CONFIDENTIAL"
+        # Determine classification based on priority (override if specified)
+        if "classification_level" in data:
+            info_classification = intern_value(data["classification_level"])
         else:
-            info_classification = "RESTRICTED"
+            info_classification = _PRIORITY_TO_CLASSIFICATION.get(priority, "RESTRICTED")
         
-        # Allow override if specified
-        info_classification = data.get("classification_level", info_classification)
-        
-        # Determine confidence based on operator and priority
-        # High priority reports from known operators have higher confidence
-        if priority in ["critical", "high"]:
-            confidence = 0.85
-        else:
-            confidence = 0.7
+        # Determine confidence based on priority
+        confidence = _PRIORITY_TO_CONFIDENCE.get(priority, 0.7)
         
         # Create event entity
         report_entity = self._create_entity(
@@ -116,7 +136,7 @@ class ManualParser(BaseParser):
             information_classification=info_classification,
             confidence=confidence,
             metadata=metadata,
-            comments=f"{data.get('report_type', 'REPORT')} from {data['operator_name']}: {data['content'][:100]}"
+            comments=f"{data.get('report_type', 'REPORT')} from {operator_name}: {content[:100]}"
         )
         
         entities.append(report_entity)
@@ -5,15 +5,19 @@ Parser Factory
 Factory for creating appropriate parsers based on sensor message format.
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 from src.models import SensorMessage, EntityCOP
-from src.parsers.base_parser import BaseParser
+from src.parsers.base_parser import BaseParser, ParserValidationError
 from src.parsers.asterix_parser import ASTERIXParser
 from src.parsers.drone_parser import DroneParser
 from src.parsers.radio_parser import RadioParser
 from src.parsers.manual_parser import ManualParser
 
 
+# Max sensor_id entries kept in the dispatch cache
+DISPATCH_CACHE_SIZE = 1024
+
+
 class ParserFactory:
     """
     Factory for selecting and executing appropriate parser for sensor messages.
@@ -27,6 +31,19 @@ class ParserFactory:
             RadioParser(),
             ManualParser(),
         ]
+        
+        # sensor_type -> first parser declaring it (O(1) dispatch)
+        self._by_type: Dict[str, BaseParser] = {}
+        for parser in self.parsers:
+            self._index_parser(parser)
+        
+        # sensor_id -> parser last selected for it (for sensors resolved by scanning)
+        self._dispatch_cache: Dict[str, BaseParser] = {}
+    
+    def _index_parser(self, parser: BaseParser):
+        """Add parser to the sensor_type dispatch table (earlier parsers win)"""
+        if parser.sensor_type is not None:
+            self._by_type.setdefault(parser.sensor_type, parser)
     
     def get_parser(self, sensor_msg: SensorMessage) -> Optional[BaseParser]:
         """
@@ -38,18 +55,45 @@ class ParserFactory:
         Returns:
             Parser instance that can handle this format, or None if no parser found
         """
+        # Fast path: the parser registered for this sensor_type
+        candidate = self._by_type.get(sensor_msg.sensor_type)
+        if candidate is not None and candidate.can_parse(sensor_msg):
+            return candidate
+        
+        # Parser this sensor resolved to last time (can_parse is still checked,
+        # since it depends on message content, not just the sensor)
+        sensor_id = sensor_msg.sensor_id
+        cached = self._dispatch_cache.get(sensor_id)
+        if cached is not None and cached is not candidate and cached.can_parse(sensor_msg):
+            return cached
+        
+        # Fall back to scanning (custom parsers without a sensor_type, or a
+        # message the dispatched parser doesn't recognize); parsers declaring
+        # a different sensor_type are skipped without calling can_parse
+        sensor_type = sensor_msg.sensor_type
         for parser in self.parsers:
-            if parser.can_parse(sensor_msg):
+            declared = parser.sensor_type
+            if declared is not None and declared != sensor_type:
+                continue
+            if parser is not candidate and parser is not cached and parser.can_parse(sensor_msg):
+                if len(self._dispatch_cache) >= DISPATCH_CACHE_SIZE:
+                    self._dispatch_cache.pop(next(iter(self._dispatch_cache)))  # oldest
+                self._dispatch_cache[sensor_id] = parser
                 return parser
         
         return None
     
-    def parse(self, sensor_msg: SensorMessage) -> tuple[bool, str, List[EntityCOP]]:
+    def parse(
+        self,
+        sensor_msg: SensorMessage,
+        parser: Optional[BaseParser] = None
+    ) -> tuple[bool, str, List[EntityCOP]]:
         """
         Parse sensor message using appropriate parser.
         
         Args:
             sensor_msg: Sensor message to parse
+            parser: Parser already selected via get_parser() (skips selection)
             
         Returns:
             (success, error_message, entities)
@@ -57,24 +101,74 @@ class ParserFactory:
             - error_message: Error description (empty if success)
             - entities: List of parsed EntityCOP objects
         """
-        # Find appropriate parser
-        parser = self.get_parser(sensor_msg)
+        # Find appropriate parser (unless the caller already did)
+        if parser is None:
+            parser = self.get_parser(sensor_msg)
         
         if parser is None:
             return False, f"No parser found for sensor type '{sensor_msg.sensor_type}'", []
         
-        # Validate message structure
-        is_valid, error = parser.validate(sensor_msg)
-        if not is_valid:
-            return False, f"Validation failed: {error}", []
+        return self._run_parser(parser, sensor_msg)
+    
+    def _run_parser(
+        self,
+        parser: BaseParser,
+        sensor_msg: SensorMessage
+    ) -> tuple[bool, str, List[EntityCOP]]:
+        """Validate (unless fused) and parse one message with the given parser"""
+        # Validate message structure (fused parsers validate while parsing)
+        if not parser.fused_validation:
+            is_valid, error = parser.validate(sensor_msg)
+            if not is_valid:
+                return False, f"Validation failed: {error}", []
         
         # Parse message
         try:
             entities = parser.parse(sensor_msg)
             return True, "", entities
+        except ParserValidationError as e:
+            return False, f"Validation failed: {str(e)}", []
         except Exception as e:
             return False, f"Parsing failed: {str(e)}", []
     
+    def parse_many(
+        self,
+        sensor_msgs: List[SensorMessage]
+    ) -> List[tuple[bool, str, List[EntityCOP]]]:
+        """
+        Parse a batch of sensor messages.
+        
+        Messages are grouped by the parser that handles them, then each
+        group is run through its parser in one go. Failures are isolated
+        per message.
+        
+        Args:
+            sensor_msgs: Sensor messages to parse
+            
+        Returns:
+            One (success, error_message, entities) tuple per message, in input order
+        """
+        results: List[Optional[tuple[bool, str, List[EntityCOP]]]] = [None] * len(sensor_msgs)
+        buckets: Dict[int, tuple[BaseParser, List[int]]] = {}
+        get_parser = self.get_parser
+        
+        for i, sensor_msg in enumerate(sensor_msgs):
+            parser = get_parser(sensor_msg)
+            if parser is None:
+                results[i] = (False, f"No parser found for sensor type '{sensor_msg.sensor_type}'", [])
+                continue
+            bucket = buckets.get(id(parser))
+            if bucket is None:
+                bucket = buckets[id(parser)] = (parser, [])
+            bucket[1].append(i)
+        
+        run_parser = self._run_parser
+        for parser, indices in buckets.values():
+            for i in indices:
+                results[i] = run_parser(parser, sensor_msgs[i])
+        
+        return results
+    
     def register_parser(self, parser: BaseParser):
         """
         Register a new parser.
@@ -83,6 +177,8 @@ class ParserFactory:
             parser: Parser instance to register
         """
         self.parsers.append(parser)
+        self._index_parser(parser)
+        self._dispatch_cache.clear()
 
 
 # Global parser factory instance
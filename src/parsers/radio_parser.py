@@ -9,7 +9,7 @@ from typing import List, Dict, Any
 from datetime import datetime, timezone
 
 from src.models import EntityCOP, Location, SensorMessage
-from src.parsers.base_parser import BaseParser
+from src.parsers.base_parser import BaseParser, intern_value
 
 
 class RadioParser(BaseParser):
@@ -21,6 +21,8 @@ class RadioParser(BaseParser):
     This parser creates metadata entities for the intercept event itself.
     """
     
+    sensor_type = "radio"
+    
     def can_parse(self, sensor_msg: SensorMessage) -> bool:
         """Check if message is radio format"""
         if sensor_msg.sensor_type != "radio":
@@ -55,16 +57,18 @@ class RadioParser(BaseParser):
         Actual transcription and entity extraction from audio is handled by multimodal tools.
         """
         data = sensor_msg.data
+        get = data.get
         entities = []
         
         # Radio intercept station location (if available)
         # If not provided, we can't create a geographic entity
-        if "location" in data:
-            loc_data = data["location"]
+        loc_data = get("location")
+        if loc_data is not None or "location" in data:
+            loc_get = loc_data.get
             location = Location(
-                lat=loc_data.get("lat", 0),
-                lon=loc_data.get("lon", 0),
-                alt=loc_data.get("alt")
+                lat=loc_get("lat", 0),
+                lon=loc_get("lon", 0),
+                alt=loc_get("alt")
             )
         else:
             # No location - skip entity creation
@@ -73,24 +77,25 @@ class RadioParser(BaseParser):
         
         # Create event entity for the intercept
         station_id = data["station_id"]
+        frequency_mhz = data["frequency_mhz"]
         entity_id = f"{sensor_msg.sensor_id}_{station_id}_intercept"
         
         # Metadata
         metadata = {
             "station_id": station_id,
-            "frequency_mhz": data["frequency_mhz"],
-            "bandwidth_khz": data.get("bandwidth_khz"),
-            "modulation_type": data.get("modulation_type"),
+            "frequency_mhz": frequency_mhz,
+            "bandwidth_khz": get("bandwidth_khz"),
+            "modulation_type": get("modulation_type"),
             "channel": data["channel"],
-            "duration_sec": data.get("duration_sec"),
-            "signal_strength": data.get("signal_strength"),
-            "audio_path": data.get("audio_path"),
+            "duration_sec": get("duration_sec"),
+            "signal_strength": get("signal_strength"),
+            "audio_path": get("audio_path"),
             "sensor_type": "radio"
         }
         
         # Radio intercepts are typically SECRET or higher
         # Especially if intercepting adversary communications
-        info_classification = data.get("classification_level", "SECRET")
+        info_classification = intern_value(get("classification_level", "SECRET"))
         
         # Create event entity
         intercept_entity = self._create_entity(
@@ -103,7 +108,7 @@ class RadioParser(BaseParser):
             information_classification=info_classification,
             confidence=0.7,  # Moderate confidence until transcription confirms
             metadata=metadata,
-            comments=f"Radio intercept on {data['frequency_mhz']} MHz"
+            comments=f"Radio intercept on {frequency_mhz} MHz"
         )
         
         entities.append(intercept_entity)
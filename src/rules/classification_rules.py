@@ -8,32 +8,98 @@ Rules for handling classified information:
 - Entity filtering by clearance level
 """
 
-from typing import List, Dict, Literal, Optional
+import sys
+from collections import Counter
 from copy import deepcopy
+from functools import lru_cache
+from typing import List, Dict, Optional
 
-from src.models import EntityCOP
+from src.models import EntityCOP, Location
 
 
 # ==================== CLASSIFICATION HIERARCHY ====================
 
-CLASSIFICATION_HIERARCHY = [
+# Interned so equality checks against classifications coming from the
+# models (the Literal values) short-circuit on identity
+CLASSIFICATION_HIERARCHY = [sys.intern(classification) for classification in (
     "TOP_SECRET",
     "SECRET",
     "CONFIDENTIAL",
     "RESTRICTED",
     "UNCLASSIFIED"
-]
+)]
 """Information classification levels (highest to lowest)"""
 
 ACCESS_LEVEL_TO_CLASSIFICATION = {
-    "top_secret_access": "TOP_SECRET",
-    "secret_access": "SECRET",
-    "confidential_access": "CONFIDENTIAL",
-    "restricted_access": "RESTRICTED",
-    "unclassified_access": "UNCLASSIFIED",
+    sys.intern(level): sys.intern(classification) for level, classification in {
+        "top_secret_access": "TOP_SECRET",
+        "secret_access": "SECRET",
+        "confidential_access": "CONFIDENTIAL",
+        "restricted_access": "RESTRICTED",
+        "unclassified_access": "UNCLASSIFIED",
+    }.items()
 }
 """Map access levels to maximum classification they can view"""
 
+_HIER_INDEX: Dict[str, int] = {c: i for i, c in enumerate(CLASSIFICATION_HIERARCHY)}
+"""Classification -> hierarchy index (0 = TOP_SECRET, 4 = UNCLASSIFIED)"""
+
+_ACCESS_TO_INDEX: Dict[str, int] = {
+    level: _HIER_INDEX[classification]
+    for level, classification in ACCESS_LEVEL_TO_CLASSIFICATION.items()
+}
+"""Access level -> hierarchy index of the highest classification it can view"""
+
+_UNCLASSIFIED_INDEX = _HIER_INDEX["UNCLASSIFIED"]
+
+# Downgrade stages (bit flags), applied in this order
+_STAGE_TOP_SECRET = 1    # From TOP_SECRET: strip sensors, round speed/heading
+_STAGE_SECRET = 2        # From SECRET+ to CONFIDENTIAL-: round location/confidence
+_STAGE_CONFIDENTIAL = 4  # From CONFIDENTIAL+ to RESTRICTED-: wipe details
+_STAGE_UNCLASSIFIED = 8  # To UNCLASSIFIED: coarse location only
+
+
+def _downgrade_plan(original_index: int, target_index: int) -> int:
+    """Stages to run when downgrading between two hierarchy indices (0 = none)"""
+    if target_index <= original_index:
+        return 0
+    plan = 0
+    if original_index == 0:
+        plan |= _STAGE_TOP_SECRET
+    if original_index <= 1 and target_index >= 2:
+        plan |= _STAGE_SECRET
+    if original_index <= 2 and target_index >= 3:
+        plan |= _STAGE_CONFIDENTIAL
+    if target_index == 4:
+        plan |= _STAGE_UNCLASSIFIED
+    return plan
+
+
+_DOWNGRADE_PLAN: Dict[tuple[int, int], int] = {
+    (original_index, target_index): _downgrade_plan(original_index, target_index)
+    for original_index in range(len(CLASSIFICATION_HIERARCHY))
+    for target_index in range(len(CLASSIFICATION_HIERARCHY))
+}
+"""(original index, target index) -> bitmask of downgrade stages"""
+
+_TOP_SECRET_DROP_METADATA = ("multimodal_results", "raw_sensor_data")
+"""Metadata keys removed when downgrading from TOP_SECRET"""
+
+_SECRET_KEEP_METADATA = frozenset({"detection_time", "last_update"})
+"""Metadata keys kept when downgrading from SECRET to CONFIDENTIAL or below"""
+
+_ACCESS_ALLOWED: Dict[str, Dict[str, bool]] = {
+    level: {
+        classification: recipient_index <= required_index
+        for classification, required_index in _HIER_INDEX.items()
+    }
+    for level, recipient_index in _ACCESS_TO_INDEX.items()
+}
+"""Access matrix: access level -> classification -> can access"""
+
+_DEFAULT_ACCESS_ROW = _ACCESS_ALLOWED["unclassified_access"]
+"""Row used for unknown access levels (UNCLASSIFIED only)"""
+
 
 # ==================== ACCESS CONTROL ====================
 
@@ -47,13 +113,11 @@ def _get_classification_index(classification: str) -> int:
     Returns:
         Index (0 = TOP_SECRET, 4 = UNCLASSIFIED)
     """
-    try:
-        return CLASSIFICATION_HIERARCHY.index(classification)
-    except ValueError:
-        # Unknown classification - treat as most restrictive
-        return 0
+    # Unknown classification - treat as most restrictive
+    return _HIER_INDEX.get(classification, 0)
 
 
+@lru_cache(maxsize=64)  # 5 access levels x 5 classifications, plus room for unknown values
 def can_recipient_access(
     recipient_access_level: str,
     information_classification: str
@@ -68,18 +132,14 @@ def can_recipient_access(
     Returns:
         True if recipient has sufficient clearance
     """
-    # Get max classification recipient can see
-    max_classification = ACCESS_LEVEL_TO_CLASSIFICATION.get(
-        recipient_access_level,
-        "UNCLASSIFIED"
-    )
-    
-    # Get indices (lower = more classified)
-    recipient_index = _get_classification_index(max_classification)
-    required_index = _get_classification_index(information_classification)
+    # Precomputed access matrix; unknown access level = UNCLASSIFIED only
+    row = _ACCESS_ALLOWED.get(recipient_access_level, _DEFAULT_ACCESS_ROW)
     
-    # Can access if recipient clearance >= required clearance
-    return recipient_index <= required_index
+    allowed = row.get(information_classification)
+    if allowed is None:
+        # Unknown classification - treat as most restrictive
+        allowed = row["TOP_SECRET"]
+    return allowed
 
 
 def get_highest_accessible_classification(recipient_access_level: str) -> str:
@@ -100,6 +160,36 @@ def get_highest_accessible_classification(recipient_access_level: str) -> str:
 
 # ==================== CLASSIFICATION DOWNGRADING ====================
 
+def _copy_for_downgrade(
+    entity: EntityCOP,
+    location: Optional[Location] = None,
+    deep_metadata: bool = False
+) -> EntityCOP:
+    """
+    Copy an entity deeply enough for downgrading.
+    
+    Only the containers downgrading mutates in place (metadata,
+    source_sensors) get their own objects; scalars are reassigned, so a full
+    deepcopy is unnecessary. Metadata values (e.g. multimodal_results dicts)
+    are shared with the original unless deep_metadata is set, which callers
+    must do whenever the metadata survives into the returned entity.
+    
+    Args:
+        entity: Original entity
+        location: Already-degraded location to use; if None the original
+            location is copied unchanged
+        deep_metadata: Deep-copy the metadata values too
+        
+    Returns:
+        Copy that can be downgraded without affecting the original
+    """
+    return entity.model_copy(update={
+        "location": location if location is not None else entity.location.model_copy(),
+        "metadata": deepcopy(entity.metadata) if deep_metadata else dict(entity.metadata),
+        "source_sensors": list(entity.source_sensors),
+    })
+
+
 def downgrade_entity_classification(
     entity: EntityCOP,
     target_classification: str
@@ -120,22 +210,70 @@ def downgrade_entity_classification(
     Returns:
         Downgraded copy of entity
     """
-    # Work with a copy
-    downgraded = deepcopy(entity)
+    return _downgrade(
+        entity,
+        target_classification,
+        _get_classification_index(entity.information_classification),
+        _get_classification_index(target_classification)
+    )
+
+
+def _downgrade(
+    entity: EntityCOP,
+    target_classification: str,
+    original_index: int,
+    target_index: int
+) -> EntityCOP:
+    """
+    Downgrade entity given already-resolved hierarchy indices.
+    
+    Args:
+        entity: Original entity
+        target_classification: Target classification level
+        original_index: Hierarchy index of the entity's classification
+        target_index: Hierarchy index of target_classification
+        
+    Returns:
+        Downgraded copy of entity
+    """
+    plan = _DOWNGRADE_PLAN[(original_index, target_index)]
+    
+    # Degrade the location once, straight into a new Location, instead of
+    # copying it and then overwriting its fields stage by stage
+    location = None
+    if plan & (_STAGE_SECRET | _STAGE_UNCLASSIFIED):
+        lat = entity.location.lat
+        lon = entity.location.lon
+        if plan & _STAGE_SECRET:
+            # Round location to 0.01° (~1km precision)
+            lat = round(lat, 2)
+            lon = round(lon, 2)
+        if plan & _STAGE_UNCLASSIFIED:
+            # ~10km precision
+            lat = round(lat, 1)
+            lon = round(lon, 1)
+        # Altitude is removed at both stages
+        location = entity.location.model_copy(update={"lat": lat, "lon": lon, "alt": None})
     
-    # Get classification indices
-    original_index = _get_classification_index(entity.information_classification)
-    target_index = _get_classification_index(target_classification)
+    # ============ DOWNGRADE TO UNCLASSIFIED ============
+    # Everything the earlier stages would touch ends up overwritten or
+    # cleared, so build the final state directly
+    if plan & _STAGE_UNCLASSIFIED:
+        return _to_unclassified(entity, target_classification, location)
     
-    # No downgrading needed if target is same or more classified
-    if target_index <= original_index:
-        return downgraded
+    # No downgrading needed if target is same or more classified: the copy
+    # keeps all metadata, so it must not share nested values with the COP
+    if not plan:
+        return _copy_for_downgrade(entity, location, deep_metadata=True)
+    
+    # Work with a copy
+    downgraded = _copy_for_downgrade(entity, location)
     
     # Update classification field
     downgraded.information_classification = target_classification
     
     # ============ DOWNGRADE FROM TOP_SECRET ============
-    if original_index == 0:  # Was TOP_SECRET
+    if plan & _STAGE_TOP_SECRET:  # Was TOP_SECRET
         # Remove exact sensor sources (keep count only)
         if len(downgraded.source_sensors) > 0:
             downgraded.source_sensors = [f"{len(downgraded.source_sensors)} sources"]
@@ -147,36 +285,30 @@ def downgrade_entity_classification(
         if downgraded.heading is not None:
             downgraded.heading = round(downgraded.heading / 10) * 10  # Round to nearest 10°
         
-        # Remove sensitive metadata
-        if "multimodal_results" in downgraded.metadata:
-            del downgraded.metadata["multimodal_results"]
-        
-        if "raw_sensor_data" in downgraded.metadata:
-            del downgraded.metadata["raw_sensor_data"]
+        # Remove sensitive metadata (skipped when a later stage removes it
+        # anyway); what is kept is deep-copied, it outlives the downgrade
+        if not plan & (_STAGE_SECRET | _STAGE_CONFIDENTIAL | _STAGE_UNCLASSIFIED):
+            downgraded.metadata = {
+                key: deepcopy(value) for key, value in entity.metadata.items()
+                if key not in _TOP_SECRET_DROP_METADATA
+            }
     
     # ============ DOWNGRADE FROM SECRET ============
-    if original_index <= 1 and target_index >= 2:  # To CONFIDENTIAL or below
-        # Round location to 0.01° (~1km precision)
-        downgraded.location.lat = round(downgraded.location.lat, 2)
-        downgraded.location.lon = round(downgraded.location.lon, 2)
-        
-        # Remove altitude
-        if downgraded.location.alt is not None:
-            downgraded.location.alt = None
+    if plan & _STAGE_SECRET:  # To CONFIDENTIAL or below
+        # Location already rounded and altitude removed above
         
         # Reduce confidence precision
         downgraded.confidence = round(downgraded.confidence, 1)
         
-        # Remove detailed metadata
-        downgraded.metadata = {
-            k: v for k, v in downgraded.metadata.items()
-            if k in ["detection_time", "last_update"]
-        }
+        # Remove detailed metadata (in place: the copy owns its metadata dict)
+        metadata = downgraded.metadata
+        for key in metadata.keys() - _SECRET_KEEP_METADATA:
+            del metadata[key]
     
     # ============ DOWNGRADE FROM CONFIDENTIAL ============
-    if original_index <= 2 and target_index >= 3:  # To RESTRICTED or below
+    if plan & _STAGE_CONFIDENTIAL:  # To RESTRICTED or below
         # Remove all metadata
-        downgraded.metadata = {}
+        downgraded.metadata.clear()
         
         # Remove source sensors
         downgraded.source_sensors = []
@@ -188,21 +320,67 @@ def downgrade_entity_classification(
         # Remove comments
         downgraded.comments = None
     
-    # ============ DOWNGRADE TO UNCLASSIFIED ============
-    if target_index == 4:  # UNCLASSIFIED
-        # Keep only: entity_id, entity_type, approximate location, classification
-        downgraded.location.lat = round(downgraded.location.lat, 1)  # ~10km precision
-        downgraded.location.lon = round(downgraded.location.lon, 1)
-        downgraded.location.alt = None
+    return downgraded
+
+
+def _to_unclassified(
+    entity: EntityCOP,
+    target_classification: str,
+    location: Location
+) -> EntityCOP:
+    """
+    Build the UNCLASSIFIED copy of an entity in one model_copy.
+    
+    Keeps only: entity_id, entity_type, approximate location, classification.
+    
+    Args:
+        entity: Original entity
+        target_classification: Target classification level
+        location: Coarsened location (altitude already removed)
         
-        downgraded.confidence = 0.5  # Generic "moderate" confidence
-        downgraded.source_sensors = []
-        downgraded.metadata = {}
-        downgraded.speed_kmh = None
-        downgraded.heading = None
-        downgraded.comments = "Location approximate"
+    Returns:
+        Downgraded copy of entity
+    """
+    return entity.model_copy(update={
+        "information_classification": target_classification,
+        "location": location,
+        "confidence": 0.5,  # Generic "moderate" confidence
+        "source_sensors": [],
+        "metadata": {},
+        "speed_kmh": None,
+        "heading": None,
+        "comments": "Location approximate",
+    })
+
+
+def _downgrade_bucket(
+    bucket: List[EntityCOP],
+    target_classification: str,
+    original_index: int,
+    target_index: int
+) -> List[EntityCOP]:
+    """
+    Downgrade entities that all share one source classification.
     
-    return downgraded
+    The downgrade plan is resolved once for the whole bucket; a bucket with
+    nothing to remove is just copied.
+    
+    Args:
+        bucket: Entities with the same classification
+        target_classification: Target classification level
+        original_index: Hierarchy index of the bucket's classification
+        target_index: Hierarchy index of target_classification
+        
+    Returns:
+        Downgraded copies, in bucket order
+    """
+    if not _DOWNGRADE_PLAN[(original_index, target_index)]:
+        return [_copy_for_downgrade(entity, deep_metadata=True) for entity in bucket]
+    
+    return [
+        _downgrade(entity, target_classification, original_index, target_index)
+        for entity in bucket
+    ]
 
 
 # ==================== ENTITY FILTERING ====================
@@ -215,6 +393,10 @@ def filter_entities_by_clearance(
     """
     Filter and downgrade entities based on recipient's clearance.
     
+    Entities already at the recipient's highest level (and everything under
+    emergency_override) are returned as the original objects; all others are
+    independent copies, nested metadata included.
+    
     Args:
         entities: List of entities to filter
         recipient_access_level: Recipient's access level
@@ -227,24 +409,47 @@ def filter_entities_by_clearance(
         # Emergency override: return everything as-is
         return entities
     
-    max_classification = get_highest_accessible_classification(recipient_access_level)
-    
-    accessible_entities = []
-    
-    for entity in entities:
-        # Check if recipient can access this entity
-        if can_recipient_access(recipient_access_level, entity.information_classification):
-            # Can access - but may need downgrading
-            if entity.information_classification == max_classification:
-                # No downgrading needed
-                accessible_entities.append(entity)
-            else:
-                # Downgrade to recipient's max level
-                downgraded = downgrade_entity_classification(entity, max_classification)
-                accessible_entities.append(downgraded)
-        # If can't access, skip entity entirely
-    
-    return accessible_entities
+    if not entities:
+        return []
+    
+    hierarchy_index = _HIER_INDEX.get
+    
+    if recipient_access_level == "top_secret_access":
+        # Everything is accessible and nothing is downgraded: TOP_SECRET (and
+        # unknown) entities pass through, the rest are copied as usual
+        return [
+            entity if hierarchy_index(entity.information_classification, 0) == 0
+            else _copy_for_downgrade(entity, deep_metadata=True)
+            for entity in entities
+        ]
+    
+    # Resolve the recipient's level once for the whole list
+    max_index = _ACCESS_TO_INDEX.get(recipient_access_level, _UNCLASSIFIED_INDEX)
+    max_classification = CLASSIFICATION_HIERARCHY[max_index]
+    
+    # Bucket positions by source classification: every entity in a bucket
+    # takes the same downgrade plan, so each bucket is handled as one batch
+    buckets: List[List[int]] = [[] for _ in CLASSIFICATION_HIERARCHY]
+    for position, entity in enumerate(entities):
+        # unknown classification = most restrictive
+        buckets[hierarchy_index(entity.information_classification, 0)].append(position)
+    
+    # Buckets above the recipient's level can't be accessed: skip them entirely
+    slots: List[Optional[EntityCOP]] = [None] * len(entities)
+    for source_index in range(max_index, len(buckets)):
+        positions = buckets[source_index]
+        if not positions:
+            continue
+        
+        bucket = [entities[position] for position in positions]
+        if source_index != max_index:
+            # Can access - but may need downgrading (no downgrading needed at the max level)
+            bucket = _downgrade_bucket(bucket, max_classification, source_index, max_index)
+        for position, entity in zip(positions, bucket):
+            slots[position] = entity
+    
+    # Back to input order
+    return [entity for entity in slots if entity is not None]
 
 
 def get_accessible_entity_ids(
@@ -261,13 +466,19 @@ def get_accessible_entity_ids(
     Returns:
         List of accessible entity IDs
     """
-    accessible_ids = []
-    
-    for entity_id, entity in entities.items():
-        if can_recipient_access(recipient_access_level, entity.information_classification):
-            accessible_ids.append(entity_id)
-    
-    return accessible_ids
+    row = _ACCESS_ALLOWED.get(recipient_access_level, _DEFAULT_ACCESS_ROW)
+    
+    # TOP_SECRET clearance sees everything (including unknown classifications)
+    if row["TOP_SECRET"]:
+        return list(entities)
+    
+    # Otherwise unknown classifications are treated as most restrictive,
+    # so only the listed accessible levels qualify
+    allowed = frozenset(level for level, can_access in row.items() if can_access)
+    return [
+        entity_id for entity_id, entity in entities.items()
+        if entity.information_classification in allowed
+    ]
 
 
 # ==================== CLASSIFICATION SUMMARY ====================
@@ -282,14 +493,12 @@ def get_classification_summary(entities: List[EntityCOP]) -> Dict[str, int]:
     Returns:
         Dictionary with counts per classification level
     """
-    summary = {level: 0 for level in CLASSIFICATION_HIERARCHY}
+    counts = Counter(entity.information_classification for entity in entities)
+    summary = {level: counts.pop(level, 0) for level in CLASSIFICATION_HIERARCHY}
     
-    for entity in entities:
-        classification = entity.information_classification
-        if classification in summary:
-            summary[classification] += 1
-        else:
-            summary["UNCLASSIFIED"] += 1  # Unknown = treat as unclassified
+    # Whatever is left is unknown = treat as unclassified
+    if counts:
+        summary["UNCLASSIFIED"] += sum(counts.values())
     
     return summary
 
@@ -298,7 +507,6 @@ def get_classification_summary(entities: List[EntityCOP]) -> Dict[str, int]:
 
 if __name__ == "__main__":
     from datetime import datetime, timezone
-    from src.models import Location
     
     print("\n" + "=" * 70)
     print("CLASSIFICATION RULES TESTING")
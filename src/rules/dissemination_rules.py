@@ -6,7 +6,9 @@ Deterministic rules for need-to-know dissemination decisions.
 Handles distance-based routing, operational role matching, and recipient loading.
 """
 
+import json
 import math
+import os
 import yaml
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Literal, Any
@@ -15,6 +17,25 @@ from pydantic import BaseModel, Field
 
 from src.models import EntityCOP, ThreatAssessment
 
+# Optional vectorized distance batch - numpy is not a hard dependency,
+# the per-recipient haversine is used when it is not installed
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Below this many located recipients the scalar haversine beats the array setup cost
+BATCH_DISTANCE_MIN = 16
+
+EARTH_RADIUS_KM = 6371
+
+# Prefer libyaml's C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 # ==================== DATA STRUCTURES ====================
 
@@ -70,6 +91,57 @@ _recipients_cache: Optional[List[RecipientInfo]] = None
 _thresholds_cache: Optional[Dict] = None
 
 
+def _load_cached_yaml(path: Path) -> Any:
+    """
+    Load a YAML config file through a JSON sidecar cache.
+    
+    The parsed config is written next to the file as <name>.yaml.json,
+    together with the YAML file's mtime (ns) and size; it is read back
+    instead of re-parsing the YAML only while both still match exactly.
+    
+    Args:
+        path: Path to the YAML file
+        
+    Returns:
+        Parsed configuration
+    """
+    path = Path(path)
+    cache_path = path.with_suffix(path.suffix + '.json')
+    
+    stat = path.stat()
+    source = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+    
+    try:
+        with open(cache_path, 'r') as f:
+            cached = json.load(f)
+        if cached.get("source") == source:
+            return cached["config"]
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass  # No usable cache - parse the YAML
+    
+    with open(path, 'r') as f:
+        config = yaml.load(f, Loader=_YamlLoader)
+    
+    # Only cache configs that survive the JSON round trip unchanged
+    # (e.g. no non-string keys or dates)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        data = json.dumps({"source": source, "config": config})
+        if json.loads(data)["config"] == config:
+            # Write then rename, so readers never see a partial sidecar
+            with open(tmp_path, 'w') as f:
+                f.write(data)
+            os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        # Read-only config dir or unserializable values - skip the cache
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+    
+    return config
+
+
 def load_recipients_config(config_path: Optional[Path] = None) -> List[RecipientInfo]:
     """
     Load recipients from YAML configuration.
@@ -104,8 +176,7 @@ def load_recipients_config(config_path: Optional[Path] = None) -> List[Recipient
                 ", ".join(str(p) for p in possible_paths)
             )
     
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+    config = _load_cached_yaml(config_path)
     
     recipients = []
     for recipient_data in config['recipients']:
@@ -179,8 +250,7 @@ def load_threat_thresholds(config_path: Optional[Path] = None) -> Dict:
                 ", ".join(str(p) for p in possible_paths)
             )
     
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+    config = _load_cached_yaml(config_path)
     
     _thresholds_cache = config
     print(f"✅ Loaded threat thresholds from {config_path}")
@@ -201,7 +271,14 @@ def calculate_distance_km(lat1: float, lon1: float, lat2: float, lon2: float) ->
     Returns:
         Distance in kilometers
     """
-    R = 6371  # Earth radius in kilometers
+    if NUMBA_AVAILABLE:
+        return round(_haversine_nb(lat1, lon1, lat2, lon2), 2)
+    return _calculate_distance_km_py(lat1, lon1, lat2, lon2)
+
+
+def _calculate_distance_km_py(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Pure-Python haversine (used when numba is not installed)"""
+    R = EARTH_RADIUS_KM
     
     lat1_rad = math.radians(lat1)
     lat2_rad = math.radians(lat2)
@@ -217,6 +294,84 @@ def calculate_distance_km(lat1: float, lon1: float, lat2: float, lon2: float) ->
     return round(distance, 2)
 
 
+def haversine_np(lat1: float, lon1: float, lats, lons):
+    """
+    Vectorized calculate_distance_km: one point against many.
+    
+    Args:
+        lat1, lon1: First point (degrees)
+        lats, lons: float64 arrays of second points (degrees)
+        
+    Returns:
+        float64 array of distances in kilometers (unrounded; callers round
+        each value with round(d, 2) like calculate_distance_km)
+    """
+    lat1_rad = np.radians(lat1)
+    lats_rad = np.radians(lats)
+    delta_lat = np.radians(lats - lat1)
+    delta_lon = np.radians(lons - lon1)
+    
+    a = (np.sin(delta_lat / 2) ** 2 +
+         np.cos(lat1_rad) * np.cos(lats_rad) *
+         np.sin(delta_lon / 2) ** 2)
+    c = 2 * np.arcsin(np.sqrt(a))
+    
+    return EARTH_RADIUS_KM * c
+
+
+# Optional JIT acceleration - numba is not a hard dependency, the Python
+# and NumPy versions above are used when it is not installed
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, boundscheck=False)
+    def _haversine_nb(lat1, lon1, lat2, lon2):
+        """
+        Haversine distance in kilometers, unrounded (compiled).
+        
+        Args:
+            lat1, lon1: First point (degrees)
+            lat2, lon2: Second point (degrees)
+        """
+        lat1_rad = math.radians(lat1)
+        lat2_rad = math.radians(lat2)
+        delta_lat = math.radians(lat2 - lat1)
+        delta_lon = math.radians(lon2 - lon1)
+        
+        a = (math.sin(delta_lat / 2) ** 2 +
+             math.cos(lat1_rad) * math.cos(lat2_rad) *
+             math.sin(delta_lon / 2) ** 2)
+        return EARTH_RADIUS_KM * 2 * math.asin(math.sqrt(a))
+    
+    # Serial on purpose: recipient lists are tens of entries, where starting
+    # a parallel region costs more than the arithmetic it would split
+    @njit(cache=True)
+    def _haversine_batch_nb(lat1, lon1, lats, lons):
+        """
+        Vectorized haversine over recipient arrays (compiled loop).
+        
+        Args:
+            lat1, lon1: First point (degrees)
+            lats, lons: float64 arrays of second points (degrees)
+            
+        Returns:
+            float64 array of distances in kilometers (unrounded, like haversine_np)
+        """
+        distances = np.empty(lats.shape[0])
+        for i in range(lats.shape[0]):
+            distances[i] = _haversine_nb(lat1, lon1, lats[i], lons[i])
+        return distances
+    
+    _haversine_batch = _haversine_batch_nb
+elif NUMPY_AVAILABLE:
+    _haversine_batch = haversine_np
+
+
 # ==================== THRESHOLD RETRIEVAL ====================
 
 def get_distance_threshold(
@@ -286,6 +441,28 @@ def get_distance_threshold(
 
 # ==================== NOTIFICATION DECISION ====================
 
+def _distance_decision_type(
+    distance_km: float,
+    threshold: DistanceThreshold
+) -> Literal["must_notify", "never_notify", "llm_needed"]:
+    """
+    Apply the distance rules to one recipient.
+    
+    Args:
+        distance_km: Distance from threat to recipient (rounded to 0.01 km)
+        threshold: Thresholds for the threat/recipient pair
+        
+    Returns:
+        "must_notify" below must_notify_km, "never_notify" above
+        never_notify_km, "llm_needed" in between
+    """
+    if distance_km < threshold.must_notify_km:
+        return "must_notify"
+    if distance_km > threshold.never_notify_km:
+        return "never_notify"
+    return "llm_needed"
+
+
 def should_notify_recipient(
     threat_entity: EntityCOP,
     recipient: RecipientInfo,
@@ -315,9 +492,10 @@ def should_notify_recipient(
     )
     
     # ============ RULE-BASED DECISIONS ============
+    decision_type = _distance_decision_type(distance_km, threshold)
     
     # Must notify (very close)
-    if distance_km < threshold.must_notify_km:
+    if decision_type == "must_notify":
         return NotificationDecision(
             should_notify=True,
             reasoning=f"Distance {distance_km}km < threshold {threshold.must_notify_km}km - MANDATORY notification",
@@ -327,7 +505,7 @@ def should_notify_recipient(
         )
     
     # Never notify (too far)
-    if distance_km > threshold.never_notify_km:
+    if decision_type == "never_notify":
         return NotificationDecision(
             should_notify=False,
             reasoning=f"Distance {distance_km}km > threshold {threshold.never_notify_km}km - TOO FAR to notify",
@@ -454,49 +632,70 @@ def filter_recipients_by_distance(
     never_notify = []
     ambiguous = []
     
-    for recipient in recipients:
-        # Skip if no location available
-        if recipient.location is None and not recipient.is_mobile:
-            ambiguous.append(recipient)
-            continue
-        
+    # Decision for each recipient (no position → ambiguous)
+    decision_types = ["llm_needed"] * len(recipients)
+    
+    # Resolve recipient positions first so all distances can be computed together
+    located = []  # Indices into recipients
+    lats = []
+    lons = []
+    for index, recipient in enumerate(recipients):
         # Get recipient location
         if recipient.location:
-            recipient_location = recipient.location
+            location = recipient.location
+            if isinstance(location, dict):
+                lat, lon = location['lat'], location['lon']
+            else:
+                lat, lon = location.lat, location.lon
         elif recipient.is_mobile and recipient.elemento_identificado:
             # Query from COP
             recipient_entity = cop_entities.get(recipient.elemento_identificado)
-            if recipient_entity:
-                recipient_location = {
-                    'lat': recipient_entity.location.lat,
-                    'lon': recipient_entity.location.lon
-                }
-            else:
+            if not recipient_entity:
                 # Can't find mobile unit - mark as ambiguous
-                ambiguous.append(recipient)
                 continue
+            lat, lon = recipient_entity.location.lat, recipient_entity.location.lon
         else:
-            ambiguous.append(recipient)
+            # No location available
             continue
         
-        # Get notification decision
-        decision = should_notify_recipient(
-            threat_entity=threat_entity,
-            recipient=recipient,
-            distance_km=calculate_distance_km(
-                threat_entity.location.lat,
-                threat_entity.location.lon,
-                recipient_location['lat'],
-                recipient_location['lon']
+        located.append(index)
+        lats.append(lat)
+        lons.append(lon)
+    
+    threat_lat = threat_entity.location.lat
+    threat_lon = threat_entity.location.lon
+    
+    if NUMPY_AVAILABLE and len(located) >= BATCH_DISTANCE_MIN:
+        distances = [
+            round(distance, 2)  # Same rounding as calculate_distance_km
+            for distance in _haversine_batch(
+                threat_lat, threat_lon,
+                np.array(lats, dtype=np.float64), np.array(lons, dtype=np.float64)
+            ).tolist()
+        ]
+    else:
+        distances = [
+            calculate_distance_km(threat_lat, threat_lon, lat, lon)
+            for lat, lon in zip(lats, lons)
+        ]
+    
+    # Thresholds only depend on the recipient's role for a given threat
+    thresholds: Dict[str, DistanceThreshold] = {}
+    for index, distance_km in zip(located, distances):
+        role = recipients[index].operational_role
+        threshold = thresholds.get(role)
+        if threshold is None:
+            threshold = thresholds[role] = get_distance_threshold(
+                entity_type=threat_entity.entity_type,
+                classification=threat_entity.classification,
+                operational_role=role
             )
-        )
-        
-        if decision.decision_type == "must_notify":
-            must_notify.append(recipient)
-        elif decision.decision_type == "never_notify":
-            never_notify.append(recipient)
-        else:  # llm_needed
-            ambiguous.append(recipient)
+        decision_types[index] = _distance_decision_type(distance_km, threshold)
+    
+    # Scatter in recipient order
+    buckets = {"must_notify": must_notify, "never_notify": never_notify, "llm_needed": ambiguous}
+    for recipient, decision_type in zip(recipients, decision_types):
+        buckets[decision_type].append(recipient)
     
     return must_notify, never_notify, ambiguous
 
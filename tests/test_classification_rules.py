@@ -0,0 +1,62 @@
+"""
+Classification Rules Tests
+==========================
+
+Unit tests for clearance filtering and classification downgrading.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from src.models import EntityCOP, Location
+from src.rules.classification_rules import (
+    downgrade_entity_classification,
+    filter_entities_by_clearance,
+)
+
+
+def _entity(entity_id: str, information_classification: str) -> EntityCOP:
+    return EntityCOP(
+        entity_id=entity_id,
+        entity_type="aircraft",
+        location=Location(lat=39.5, lon=-0.4, alt=5000),
+        timestamp=datetime.now(timezone.utc),
+        classification="hostile",
+        information_classification=information_classification,
+        confidence=0.9,
+        source_sensors=["radar_01"],
+        metadata={
+            "track_history": [{"lat": 39.4, "lon": -0.5}],
+            "multimodal_results": {"audio": {"success": True, "report": "intercept"}},
+        }
+    )
+
+
+# ==================== COPY ISOLATION TESTS ====================
+
+@pytest.mark.parametrize("access_level,information_classification", [
+    ("top_secret_access", "SECRET"),
+    ("secret_access", "CONFIDENTIAL"),
+])
+def test_filtered_copies_do_not_share_metadata(access_level, information_classification):
+    """Mutating nested metadata of a filtered entity must not touch the COP entity"""
+    original = _entity("hostile_001", information_classification)
+
+    [copy] = filter_entities_by_clearance([original], access_level)
+    copy.metadata["track_history"][0]["lat"] = 0.0
+    copy.metadata.get("multimodal_results", {}).get("audio", {})["report"] = "edited"
+
+    assert original.metadata["track_history"] == [{"lat": 39.4, "lon": -0.5}]
+    assert original.metadata["multimodal_results"]["audio"]["report"] == "intercept"
+
+
+def test_top_secret_downgrade_does_not_share_metadata():
+    """TOP_SECRET → SECRET keeps most metadata; it must be an independent copy"""
+    original = _entity("hostile_001", "TOP_SECRET")
+
+    downgraded = downgrade_entity_classification(original, "SECRET")
+    downgraded.metadata["track_history"][0]["lat"] = 0.0
+
+    assert "multimodal_results" not in downgraded.metadata
+    assert original.metadata["track_history"] == [{"lat": 39.4, "lon": -0.5}]
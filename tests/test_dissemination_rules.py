@@ -0,0 +1,114 @@
+"""
+Dissemination Rules Tests
+=========================
+
+Unit tests for distance-based recipient filtering and config loading.
+"""
+
+import math
+import os
+from datetime import datetime, timezone
+
+import pytest
+
+from src.models import EntityCOP, Location
+from src.rules import dissemination_rules
+from src.rules.dissemination_rules import (
+    EARTH_RADIUS_KM,
+    RecipientInfo,
+    filter_recipients_by_distance,
+    get_distance_threshold,
+)
+
+
+def _make_recipient(recipient_id: str, distance_km: float) -> RecipientInfo:
+    """Static air_defense recipient due north of (0, 0) at distance_km"""
+    lat = math.degrees(distance_km / EARTH_RADIUS_KM)
+    return RecipientInfo(
+        recipient_id=recipient_id,
+        recipient_name=recipient_id,
+        recipient_type="friendly_unit",
+        access_level="secret_access",
+        location={"lat": lat, "lon": 0.0},
+        is_mobile=False,
+        elemento_identificado=None,
+        operational_role="air_defense",
+        priority_entity_types=["aircraft"],
+        mqtt_topics={},
+        supported_formats=["json"],
+        auto_disseminate=True,
+        requires_human_approval=False
+    )
+
+
+def _bucket_ids(result):
+    return tuple([r.recipient_id for r in group] for group in result)
+
+
+# ==================== DISTANCE FILTERING TESTS ====================
+
+def test_filter_recipients_same_buckets_scalar_and_batch(monkeypatch):
+    """Batch (numpy) and scalar paths must put every recipient in the same bucket"""
+    if not dissemination_rules.NUMPY_AVAILABLE:
+        pytest.skip("numpy not installed")
+
+    threat = EntityCOP(
+        entity_id="hostile_001",
+        entity_type="aircraft",
+        location=Location(lat=0.0, lon=0.0),
+        timestamp=datetime.now(timezone.utc),
+        classification="hostile",
+        information_classification="SECRET",
+        confidence=0.9,
+        source_sensors=["radar_01"]
+    )
+    threshold = get_distance_threshold("aircraft", "hostile", "air_defense")
+    must_km = threshold.must_notify_km
+    never_km = threshold.never_notify_km
+
+    distances = [
+        must_km - 0.004,  # Rounds to must_km: not below it → ambiguous
+        must_km - 0.006,  # Rounds below must_km → must notify
+        must_km - 10,
+        must_km + 10,
+        never_km + 0.004,  # Rounds to never_km: not above it → ambiguous
+        never_km + 0.006,  # Rounds above never_km → never notify
+        never_km + 10,
+        1.0,
+    ]
+    recipients = [_make_recipient(f"r{i:02d}", d) for i, d in enumerate(distances * 3)]
+    recipients.append(RecipientInfo(**{**recipients[0].__dict__, "recipient_id": "no_loc", "location": None}))
+
+    monkeypatch.setattr(dissemination_rules, "BATCH_DISTANCE_MIN", len(recipients) + 1)
+    scalar = filter_recipients_by_distance(threat, recipients, {})
+
+    monkeypatch.setattr(dissemination_rules, "BATCH_DISTANCE_MIN", 1)
+    batch = filter_recipients_by_distance(threat, recipients, {})
+
+    assert _bucket_ids(scalar) == _bucket_ids(batch)
+
+    must_notify, never_notify, ambiguous = _bucket_ids(scalar)
+    assert "r00" in ambiguous and "r01" in must_notify
+    assert "r04" in ambiguous and "r05" in never_notify
+    assert "no_loc" in ambiguous
+
+
+# ==================== CONFIG LOADING TESTS ====================
+
+def test_load_cached_yaml_invalidated_on_edit(tmp_path):
+    """Editing the YAML must invalidate the JSON sidecar, even with an older mtime"""
+    path = tmp_path / "thresholds.yaml"
+    path.write_text("value: 1\n")
+
+    assert dissemination_rules._load_cached_yaml(path) == {"value": 1}
+    assert (tmp_path / "thresholds.yaml.json").exists()
+    assert dissemination_rules._load_cached_yaml(path) == {"value": 1}
+
+    # Replace with different content carrying an older mtime (like cp -p)
+    stat = path.stat()
+    path.write_text("value: 22\n")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10_000_000_000))
+
+    assert dissemination_rules._load_cached_yaml(path) == {"value": 22}
+    assert dissemination_rules._load_cached_yaml(path) == {"value": 22}
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["thresholds.yaml", "thresholds.yaml.json"]
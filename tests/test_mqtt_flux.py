@@ -8,7 +8,6 @@ Test transmission node with real MQTT.
 import logging
 from typing import Dict, Any, List
 from datetime import datetime, timezone
-import json
 
 from langsmith import traceable
 
@@ -127,7 +126,7 @@ def transmission_node(state: TIFDAState) -> Dict[str, Any]:
             # Publish
             result = mqtt_publisher.publish_message(msg, recipient_config)
             
-            payload_size = len(json.dumps(formatted_message["content"]))
+            payload_size = result.payload_size_bytes  # Size of the bytes actually published
             total_bytes_transmitted += payload_size
             
             log_entry = {
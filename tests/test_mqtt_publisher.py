@@ -0,0 +1,274 @@
+"""
+MQTT Publisher Tests
+====================
+
+Unit tests for MQTTPublisher against an in-process fake MQTT client
+(no broker needed).
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from src.integrations import mqtt_publisher
+from src.integrations.mqtt_publisher import MQTTPublisher
+from src.models.dissemination import OutgoingMessage
+
+
+class _FakePahoClient:
+    """Stands in for the paho client: only carries the on_publish callback"""
+    on_publish = None
+
+
+class _FakeMQTTClient:
+    """
+    MQTTClient stand-in that acks QoS 1/2 publishes immediately.
+
+    mids listed in never_ack are queued but never confirmed. With a gate,
+    every publish signals `entered` and then blocks until the gate is set.
+    """
+
+    def __init__(self, never_ack=(), gate=None):
+        self.client = _FakePahoClient()
+        self.is_connected = True
+        self.never_ack = set(never_ack)
+        self.gate = gate
+        self.entered = threading.Event()
+        self.published = []
+        self._mid = 0
+        self._lock = threading.Lock()
+
+    def publish_nowait(self, topic, payload, qos=0, retain=False):
+        if self.gate is not None:
+            self.entered.set()
+            assert self.gate.wait(timeout=5)
+        with self._lock:
+            self._mid += 1
+            mid = self._mid
+            self.published.append((topic, payload, qos, mid))
+        if qos and mid not in self.never_ack:
+            self.client.on_publish(self.client, None, mid)
+        return SimpleNamespace(mid=mid)
+
+    def publish(self, topic, payload, qos=0, retain=False):
+        return self.publish_nowait(topic, payload, qos, retain) is not None
+
+
+def _message(message_id, recipient_id="command_center"):
+    return OutgoingMessage(
+        message_id=message_id,
+        decision_id="dec_001",
+        recipient_id=recipient_id,
+        format_type="json",
+        content={"n": message_id},
+        timestamp=datetime.now(timezone.utc)
+    )
+
+
+# ==================== HEALTH / STATS TESTS ====================
+
+def test_health_check_reports_disconnect_immediately():
+    """A disconnect must show up right away, not after a cached healthy result expires"""
+    client = _FakeMQTTClient()
+    publisher = MQTTPublisher(client)
+
+    assert publisher.health_check()[0] is True
+    assert publisher.get_stats()['connected'] is True
+
+    client.is_connected = False
+
+    assert publisher.health_check()[0] is False
+    assert publisher.get_stats()['connected'] is False
+
+
+
+def test_partial_pool_stays_healthy_and_fails_over():
+    """One dropped pooled connection degrades the publisher but keeps it delivering"""
+    primary = _FakeMQTTClient()
+    dropped = _FakeMQTTClient()
+    publisher = MQTTPublisher(primary, pool=[dropped])
+
+    candidates = [f"unit_{i:02d}" for i in range(64)]
+    recipient = next(r for r in candidates if publisher._client_index(r) == 1)
+
+    dropped.is_connected = False
+
+    is_healthy, health_msg = publisher.health_check()
+    assert is_healthy is True
+    assert "1/2 connections up" in health_msg
+    assert publisher.get_stats()['connections_up'] == 1
+
+    assert publisher._client_index(recipient) == 0
+    assert publisher.publish_batch([_message("msg_001", recipient)])['successful'] == 1
+    assert len(primary.published) == 1 and dropped.published == []
+
+    dropped.is_connected = True
+    assert publisher._client_index(recipient) == 1
+
+# ==================== SUBMIT TESTS ====================
+
+def test_submit_preserves_order():
+    """Submitted messages are published, and their futures resolved, in submit order"""
+    client = _FakeMQTTClient()
+    publisher = MQTTPublisher(client)
+    qos1 = {'connection_config': {'qos': 1}}
+
+    try:
+        futures = [
+            publisher.submit(_message(f"msg_{i:03d}"), qos1 if i % 2 else None)
+            for i in range(50)
+        ]
+        results = [f.result(timeout=5) for f in futures]
+    finally:
+        publisher.close()
+
+    assert [r.message_id for r in results] == [f"msg_{i:03d}" for i in range(50)]
+    assert all(r.success for r in results)
+    assert [p[2] for p in client.published] == [i % 2 for i in range(50)]
+    assert [p[3] for p in client.published] == list(range(1, 51))
+
+
+def test_submit_blocks_while_queue_full(monkeypatch):
+    """submit() blocks once PUBLISH_QUEUE_SIZE messages are waiting, then drains"""
+    monkeypatch.setattr(mqtt_publisher, "PUBLISH_QUEUE_SIZE", 1)
+    gate = threading.Event()
+    client = _FakeMQTTClient(gate=gate)
+    publisher = MQTTPublisher(client)
+    futures = []
+
+    try:
+        futures.append(publisher.submit(_message("msg_001")))
+        assert client.entered.wait(timeout=5)  # Worker holds msg_001
+        futures.append(publisher.submit(_message("msg_002")))  # Fills the queue
+
+        blocked = threading.Thread(target=lambda: futures.append(publisher.submit(_message("msg_003"))))
+        blocked.start()
+        blocked.join(timeout=0.2)
+        assert blocked.is_alive()
+        assert len(futures) == 2
+
+        gate.set()
+        blocked.join(timeout=5)
+        assert not blocked.is_alive()
+
+        results = [f.result(timeout=5) for f in futures]
+    finally:
+        gate.set()
+        publisher.close()
+
+    assert [r.message_id for r in results] == ["msg_001", "msg_002", "msg_003"]
+    assert all(r.success for r in results)
+
+
+def test_close_joins_worker():
+    """close() stops and joins the worker; a later submit starts a fresh one"""
+    publisher = MQTTPublisher(_FakeMQTTClient())
+
+    publisher.close()  # No worker yet: no-op
+    assert publisher._submit_worker is None
+
+    assert publisher.submit(_message("msg_001")).result(timeout=5).success
+    worker = publisher._submit_worker
+    assert worker is not None and worker.is_alive()
+
+    publisher.close()
+    assert publisher._submit_worker is None
+    assert not worker.is_alive()
+
+    assert publisher.submit(_message("msg_002")).result(timeout=5).success
+    assert publisher._submit_worker is not worker
+    publisher.close()
+
+
+def test_submit_fails_future_when_ack_never_comes(monkeypatch):
+    """A QoS 1 future whose PUBACK never arrives fails after the confirm timeout"""
+    monkeypatch.setattr(mqtt_publisher, "PUBLISH_CONFIRM_TIMEOUT_SEC", 0.1)
+    monkeypatch.setattr(mqtt_publisher, "ACK_SWEEP_INTERVAL_SEC", 0.02)
+    publisher = MQTTPublisher(_FakeMQTTClient(never_ack={1}))
+    qos1 = {'connection_config': {'qos': 1}}
+
+    try:
+        lost = publisher.submit(_message("msg_001"), qos1)
+        acked = publisher.submit(_message("msg_002"), qos1)
+
+        assert acked.result(timeout=5).success
+        result = lost.result(timeout=5)
+    finally:
+        publisher.close()
+
+    assert not result.success
+    assert result.error == "Timed out waiting for publish confirmation"
+    assert publisher._ack_waiters == {}
+
+
+def test_close_fails_pending_ack_futures():
+    """close() resolves futures still waiting for an ack instead of abandoning them"""
+    publisher = MQTTPublisher(_FakeMQTTClient(never_ack={1}))
+
+    future = publisher.submit(_message("msg_001"), {'connection_config': {'qos': 1}})
+    deadline = time.monotonic() + 5
+    while not publisher._ack_waiters and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not future.done()
+
+    publisher.close()
+
+    result = future.result(timeout=0)
+    assert not result.success
+    assert result.error == "Publisher closed before publish confirmation"
+    assert publisher._ack_waiters == {}
+
+
+# ==================== PUBLISH BATCH TESTS ====================
+
+def test_publish_batch_unacked_mids_time_out():
+    """Only messages whose mid never gets an ack fail; confirmed_at reflects the wait"""
+    timeout = 0.2
+    client = _FakeMQTTClient(never_ack={2, 5})  # mids are assigned 1, 2, 3, ... in send order
+    publisher = MQTTPublisher(client)
+    configs = {"command_center": {'connection_config': {'qos': 1}}}  # "patrol" defaults to QoS 0
+    recipients = ["command_center", "command_center", "patrol", "command_center", "command_center"]
+    messages = [_message(f"msg_{i}", r) for i, r in enumerate(recipients)]
+
+    start = time.monotonic()
+    stats = publisher.publish_batch(messages, configs, timeout=timeout, batch_size=2)
+    results = stats['results']
+
+    assert (stats['total'], stats['successful'], stats['failed']) == (5, 3, 2)
+    assert [r.message_id for r in results] == [m.message_id for m in messages]
+    assert [r.success for r in results] == [True, False, True, True, False]
+    assert [r.batch_id for r in results] == [0, 0, 1, 1, 2]
+    for i in (1, 4):
+        assert results[i].error == "Timed out waiting for publish confirmation"
+    for i in (0, 2, 3):
+        assert results[i].error is None
+
+    # Outcomes of a slice are only known after its drain; slices 0 and 2 waited out the timeout
+    assert results[0].confirmed_at >= start + timeout
+    assert results[1].confirmed_at >= start + timeout
+    assert results[3].confirmed_at - results[1].confirmed_at < timeout  # Slice 1 didn't wait
+    assert results[4].confirmed_at >= start + 2 * timeout
+
+
+def test_publish_batch_unacked_on_one_pooled_connection():
+    """A connection that never acks fails only its own recipients' messages"""
+    primary = _FakeMQTTClient()
+    silent = _FakeMQTTClient(never_ack=range(1, 100))
+    publisher = MQTTPublisher(primary, pool=[silent])
+
+    # Recipient ids hash per process, so pick two that land on different connections
+    candidates = [f"unit_{i:02d}" for i in range(64)]
+    acked = next(r for r in candidates if publisher._client_index(r) == 0)
+    unacked = next(r for r in candidates if publisher._client_index(r) == 1)
+    qos1 = {'connection_config': {'qos': 1}}
+    configs = {acked: qos1, unacked: qos1}
+    messages = [_message(f"msg_{i}", acked if i % 2 else unacked) for i in range(6)]
+
+    stats = publisher.publish_batch(messages, configs, timeout=0.05, batch_size=2)
+    results = stats['results']
+
+    assert [r.message_id for r in results] == [m.message_id for m in messages]
+    assert [r.success for r in results] == [i % 2 == 1 for i in range(6)]
+    assert len(primary.published) == len(silent.published) == 3
+    assert all(r.confirmed_at > 0 for r in results)
@@ -16,6 +16,9 @@ from src.parsers import (
     ManualParser,
     get_parser_factory
 )
+from src.parsers import parser_factory
+from src.parsers.base_parser import BaseParser
+from src.parsers.parser_factory import ParserFactory
 
 
 # ==================== ASTERIX PARSER TESTS ====================
@@ -120,6 +123,36 @@ def test_asterix_parser_parse():
     assert entity.speed_kmh == 450
 
 
+@pytest.mark.parametrize("track_count", [1, 20])  # Scalar and batch paths
+def test_asterix_parser_malformed_classification(track_count):
+    """Test non-string IFF classifications map to unknown instead of failing"""
+    parser = ASTERIXParser()
+    
+    bad_values = [["hostile"], {"iff": "hostile"}, 7, None]
+    msg = SensorMessage(
+        sensor_id="radar_01",
+        sensor_type="radar",
+        timestamp=datetime.now(timezone.utc),
+        data={
+            "format": "asterix",
+            "tracks": [
+                {
+                    "track_id": f"T{i:03d}",
+                    "location": {"lat": 39.5, "lon": -0.4},
+                    "speed_kmh": 450,
+                    "classification": bad_values[i % len(bad_values)]
+                }
+                for i in range(track_count)
+            ]
+        }
+    )
+    
+    entities = parser.parse(msg)
+    
+    assert len(entities) == track_count
+    assert all(entity.classification == "unknown" for entity in entities)
+
+
 # ==================== DRONE PARSER TESTS ====================
 
 def test_drone_parser_can_parse():
@@ -274,6 +307,27 @@ def test_manual_parser_parse():
     assert entity.metadata["priority"] == "high"
 
 
+def test_manual_parser_validate_unhashable_priority():
+    """Test a list/dict priority is rejected instead of raising"""
+    parser = ManualParser()
+    
+    for priority in (["high"], {"level": "high"}):
+        msg = SensorMessage(
+            sensor_id="operator_charlie",
+            sensor_type="manual",
+            timestamp=datetime.now(timezone.utc),
+            data={
+                "priority": priority,
+                "operator_name": "Cpt. Smith",
+                "content": "Aircraft spotted"
+            }
+        )
+        is_valid, error = parser.validate(msg)
+        
+        assert is_valid is False
+        assert "Invalid priority" in error
+
+
 # ==================== PARSER FACTORY TESTS ====================
 
 def test_parser_factory_get_parser():
@@ -328,5 +382,106 @@ def test_parser_factory_parse():
     assert len(entities) == 1
 
 
+
+def _radar_msg(sensor_id, track):
+    return SensorMessage(
+        sensor_id=sensor_id,
+        sensor_type="radar",
+        timestamp=datetime.now(timezone.utc),
+        data={"format": "asterix", "tracks": [track]}
+    )
+
+
+def test_parser_factory_parse_many_order_and_isolation():
+    """Test parse_many keeps input order and isolates failing messages"""
+    factory = ParserFactory()
+    now = datetime.now(timezone.utc)
+    
+    msgs = [
+        _radar_msg("radar_01", {"track_id": "T001", "location": {"lat": 39.5, "lon": -0.4}, "speed_kmh": 450}),
+        SensorMessage(
+            sensor_id="drone_01",
+            sensor_type="drone",
+            timestamp=now,
+            data={"drone_id": "D1", "latitude": 39.47, "longitude": -0.37}
+        ),
+        _radar_msg("radar_01", {"track_id": "T_BAD", "location": {"lat": 39.5, "lon": -0.4}}),
+        SensorMessage(sensor_id="misc_01", sensor_type="other", timestamp=now, data={}),
+        _radar_msg("radar_02", {"track_id": "T002", "location": {"lat": 39.6, "lon": -0.3}, "speed_kmh": 300}),
+        SensorMessage(
+            sensor_id="operator_charlie",
+            sensor_type="manual",
+            timestamp=now,
+            data={
+                "priority": "high",
+                "operator_name": "Cpt. Smith",
+                "content": "Aircraft spotted",
+                "latitude": 39.50,
+                "longitude": -0.35
+            }
+        ),
+    ]
+    
+    results = factory.parse_many(msgs)
+    
+    assert [success for success, _, _ in results] == [True, True, False, False, True, True]
+    assert results[0][2][0].entity_id == "radar_01_T001"
+    assert results[1][2][0].entity_type == "uav"
+    assert results[2][1].startswith("Validation failed")
+    assert results[2][2] == []
+    assert results[3][1].startswith("No parser found")
+    assert results[4][2][0].entity_id == "radar_02_T002"
+    assert results[5][2][0].entity_type == "event"
+    
+    # Same outcome as parsing one message at a time
+    assert [r[:2] for r in results] == [factory.parse(msg)[:2] for msg in msgs]
+
+
+class _FlavorParser(BaseParser):
+    """Custom parser without a sensor_type, matching data["flavor"]"""
+    
+    def __init__(self, flavor):
+        self.flavor = flavor
+    
+    def can_parse(self, sensor_msg):
+        return sensor_msg.data.get("flavor") == self.flavor
+    
+    def validate(self, sensor_msg):
+        return True, ""
+    
+    def parse(self, sensor_msg):
+        return []
+
+
+def test_parser_factory_dispatch_cache(monkeypatch):
+    """Test dispatch cache FIFO eviction and can_parse re-check"""
+    monkeypatch.setattr(parser_factory, "DISPATCH_CACHE_SIZE", 2)
+    factory = ParserFactory()
+    parser_a = _FlavorParser("a")
+    parser_b = _FlavorParser("b")
+    factory.register_parser(parser_a)
+    factory.register_parser(parser_b)
+    
+    def msg(sensor_id, flavor):
+        return SensorMessage(
+            sensor_id=sensor_id,
+            sensor_type="other",
+            timestamp=datetime.now(timezone.utc),
+            data={"flavor": flavor}
+        )
+    
+    assert factory.get_parser(msg("s1", "a")) is parser_a
+    assert factory.get_parser(msg("s2", "b")) is parser_b
+    assert factory.get_parser(msg("s3", "a")) is parser_a
+    
+    # Oldest entry (s1) evicted once the cache is full
+    assert list(factory._dispatch_cache) == ["s2", "s3"]
+    
+    # A cached parser that can't handle the new message is not reused
+    assert factory.get_parser(msg("s3", "b")) is parser_b
+    assert factory._dispatch_cache["s3"] is parser_b
+    assert factory.get_parser(msg("s2", "c")) is None
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -0,0 +1,123 @@
+"""
+Threat Evaluator Tests
+======================
+
+Unit tests for the hybrid (rules / heuristic / LLM) threat assessment.
+"""
+
+import itertools
+import math
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from src.models import EntityCOP, Location
+from src.nodes import threat_evaluator_node
+from src.rules import threat_rules
+
+
+class _FakeLLM:
+    """Records prompts; answers with a fixed MEDIUM assessment"""
+
+    def __init__(self):
+        self.calls = []
+
+    def invoke(self, messages):
+        self.calls.append(messages)
+        return SimpleNamespace(content=(
+            "THREAT_LEVEL: MEDIUM\n"
+            "CONFIDENCE: 0.7\n"
+            "REASONING: Test response\n"
+            "AFFECTED_ENTITIES: none"
+        ))
+
+
+def _entity(entity_id, classification, lat=0.0, **kwargs):
+    return EntityCOP(
+        entity_id=entity_id,
+        entity_type="aircraft",
+        location=Location(lat=lat, lon=0.0),
+        timestamp=datetime.now(timezone.utc),
+        classification=classification,
+        information_classification="SECRET",
+        confidence=0.9,
+        source_sensors=["radar_01"],
+        **kwargs
+    )
+
+
+def _assess(entity, friendlies, llm):
+    return threat_evaluator_node._assess_threat_hybrid(
+        entity, friendlies, llm, False, datetime.now(timezone.utc), itertools.count()
+    )
+
+
+def _ambiguous_lat():
+    """Latitude (due north of a friendly at 0, 0) inside the unknown aircraft LLM band"""
+    must_km, never_km, _ = threat_rules.get_distance_thresholds("aircraft", "unknown")
+    return math.degrees(((must_km + never_km) / 2) / 6371)
+
+
+# ==================== HEURISTIC SHORTCUT TESTS ====================
+
+def test_heuristic_skips_llm_for_stationary_unknown():
+    """A stationary unknown between must/never notify distances is assessed without the LLM"""
+    friendly = _entity("friendly_001", "friendly")
+    unknown = _entity("unknown_001", "unknown", lat=_ambiguous_lat(), speed_kmh=0)
+    llm = _FakeLLM()
+
+    assessment = _assess(unknown, [friendly], llm)
+
+    assert llm.calls == []
+    assert assessment.threat_level == "low"
+    assert assessment.reasoning.startswith("Heuristic assessment")
+    assert assessment.affected_entities == ["friendly_001"]
+
+
+def test_heuristic_leaves_moving_unknown_to_llm():
+    """A moving unknown in the same band still goes to the LLM"""
+    friendly = _entity("friendly_001", "friendly")
+    unknown = _entity("unknown_001", "unknown", lat=_ambiguous_lat(), speed_kmh=300)
+    llm = _FakeLLM()
+
+    assessment = _assess(unknown, [friendly], llm)
+
+    assert len(llm.calls) == 1
+    assert assessment.threat_level == "medium"
+
+
+# ==================== PROMPT BUDGET TESTS ====================
+
+def _assess_with_llm(entity, friendlies, llm):
+    return threat_evaluator_node._assess_threat_with_llm(
+        entity, friendlies, llm, False, datetime.now(timezone.utc), itertools.count()
+    )
+
+
+def test_llm_prompt_truncates_oversize_comments():
+    """Oversize comments are cut so the prompt sent to the LLM fits MAX_INPUT_TOKENS"""
+    comments = "Observed loitering near the coast. " * 2000
+    unknown = _entity("unknown_001", "unknown", comments=comments)
+    llm = _FakeLLM()
+
+    assessment = _assess_with_llm(unknown, [], llm)
+
+    assert assessment.threat_level == "medium"
+    assert len(llm.calls) == 1
+    system, human = llm.calls[0]
+    assert "Observed loitering near the coast." in human.content
+    assert comments not in human.content
+    assert (
+        threat_evaluator_node._count_tokens(system.content) + threat_evaluator_node._count_tokens(human.content)
+        <= threat_evaluator_node.MAX_INPUT_TOKENS
+    )
+
+
+def test_llm_skipped_when_prompt_cannot_fit():
+    """A prompt still over budget without comments is not sent"""
+    sensors = [f"sensor_{i:05d}_with_a_long_identifier" for i in range(3000)]
+    unknown = _entity("unknown_001", "unknown", comments="short note")
+    unknown.source_sensors = sensors
+    llm = _FakeLLM()
+
+    assert _assess_with_llm(unknown, [], llm) is None
+    assert llm.calls == []